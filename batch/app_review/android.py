@@ -1,31 +1,45 @@
+import json
 from datetime import datetime, timedelta
+from typing import Any
 
 from google_play_scraper import Sort, reviews
 
+from replay import replayable
+
 hanamoney_id = "kr.co.hanamembers.hmscustomer"
 hanacard_id = "com.hanaskcard.paycla"
 langs = ["ko", "en"]
 
 
+def _dump_reviews(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return json.loads(json.dumps(results, ensure_ascii=False, default=str))
+
+
+def _load_reviews(
+    payload: list[dict[str, Any]], arguments: dict[str, Any]
+) -> list[dict[str, Any]]:
+    return [{**r, "at": datetime.fromisoformat(r["at"])} for r in payload]
+
+
+@replayable("play_store_reviews", encode=_dump_reviews, decode=_load_reviews)
+def _fetch_reviews(app_id: str, lang: str) -> list[dict[str, Any]]:
+    results, _ = reviews(
+        app_id,
+        lang=lang,
+        country="kr",
+        sort=Sort.NEWEST,
+        count=20,
+    )
+    return results
+
+
 def get_app_reviews() -> tuple[list[str], list[str]]:
     hanamoney_results = []
     hanapay_results = []
 
     for lang in langs:
-        _hanamoney_results, _ = reviews(
-            hanamoney_id,
-            lang=lang,
-            country="kr",
-            sort=Sort.NEWEST,
-            count=20,
-        )
-        _hanapay_results, _ = reviews(
-            hanacard_id,
-            lang=lang,
-            country="kr",
-            sort=Sort.NEWEST,
-            count=20,
-        )
+        _hanamoney_results = _fetch_reviews(hanamoney_id, lang)
+        _hanapay_results = _fetch_reviews(hanacard_id, lang)
         hanamoney_results.extend(_hanamoney_results)
         hanapay_results.extend(_hanapay_results)
 
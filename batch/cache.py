@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from batch.models.request import AbstractRequest
+from batch.variables import (
+    HTTP_CACHE_MAX_BYTES,
+    HTTP_CACHE_MODE,
+    HTTP_CACHE_PATH,
+    HTTP_CACHE_TTL,
+    LLM_CACHE_MAX_BYTES,
+    LLM_CACHE_MODE,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL,
+)
+from logger import logger
+
+CACHE_MODES: tuple[str, ...] = ("on", "off", "only")
+
+
+class ResponseCache:
+    """
+    SQLite 파일 하나에 응답 본문을 저장하는 on-disk 캐시.
+    - ttl(초)이 지난 항목은 조회되지 않고 eviction 때 삭제. get의 ttl로 호출부마다 더 짧게 지정 가능
+    - 본문 크기 합이 max_bytes를 넘으면 오래 조회되지 않은 항목부터 삭제
+    - mode: on(읽기+쓰기), off(사용 안함), only(캐시만 사용, 네트워크 호출 금지)
+    """
+
+    def __init__(
+        self,
+        path: str = HTTP_CACHE_PATH,
+        table: str = "http_cache",
+        ttl: int = HTTP_CACHE_TTL,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+        mode: str = HTTP_CACHE_MODE,
+        evict_every: int = 100,  # set 호출 n번마다 크기 점검
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"cache mode must be one of {CACHE_MODES}: {mode}")
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == "only"
+
+    @staticmethod
+    def make_key(endpoint: str, request: AbstractRequest) -> str:
+        """endpoint와 정규화된 요청 모델(JSON)로 만든 키"""
+        normalized = request.model_dump_json(exclude_none=True)
+        return hashlib.sha256(f"{endpoint}\n{normalized}".encode()).hexdigest()
+
+    @staticmethod
+    def make_text_key(*parts: str) -> str:
+        """문자열 여러 개(예: model, instructions, input)로 만든 키"""
+        normalized = json.dumps(parts, ensure_ascii=False)
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT,
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table}_accessed "
+                f"ON {self.table} (accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str, ttl: int | None = None) -> str | None:
+        if not self.enabled:
+            return None
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute(
+            f"SELECT body FROM {self.table} WHERE key = ? AND created_at >= ?",
+            (key, now - ttl),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        conn.execute(
+            f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        conn.commit()
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, body: str, endpoint: str = "") -> None:
+        if not self.enabled:
+            return
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO {self.table}
+                (key, endpoint, body, size, created_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (key, endpoint, body, len(body.encode()), now, now),
+        )
+        conn.commit()
+        self._writes += 1
+        if self._writes % self.evict_every == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """만료 항목을 지우고, 크기 한도를 넘으면 LRU 순서로 삭제. 삭제 건수 반환."""
+        conn = self._connect()
+        removed = conn.execute(
+            f"DELETE FROM {self.table} WHERE created_at < ?",
+            (time.time() - self.ttl,),
+        ).rowcount
+        total = conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {self.table}"
+        ).fetchone()[0]
+        if total > self.max_bytes:
+            over = total - self.max_bytes
+            rows = conn.execute(
+                f"SELECT key, size FROM {self.table} ORDER BY accessed_at"
+            )
+            keys: list[str] = []
+            for key, size in rows:
+                if over <= 0:
+                    break
+                keys.append(key)
+                over -= size
+            conn.executemany(
+                f"DELETE FROM {self.table} WHERE key = ?", [(k,) for k in keys]
+            )
+            removed += len(keys)
+        conn.commit()
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self._writes}
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.evict()
+            self._conn.close()
+            self._conn = None
+        logger.info(f"[cache] {self.table} {self.stats()}")
+
+
+http_cache = ResponseCache()
+llm_cache = ResponseCache(
+    path=LLM_CACHE_PATH,
+    table="llm_cache",
+    ttl=LLM_CACHE_TTL,
+    max_bytes=LLM_CACHE_MAX_BYTES,
+    mode=LLM_CACHE_MODE,
+    evict_every=20,
+)
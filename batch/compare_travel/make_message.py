@@ -5,6 +5,7 @@ from batch.compare_travel.keywords import (
 )
 from batch.compare_travel.prompt import PROMPT, TEXT_INPUT
 from batch.fetch import fetch_trend_data
+from batch.variables import LLM_MESSAGE_CACHE_TTL
 from bot.services.core.openai_client import async_openai_response
 
 
@@ -23,6 +24,7 @@ async def _get_trend_message() -> str:
     return await async_openai_response(
         prompt=PROMPT,
         input=TEXT_INPUT.format(content=trend_response.to_results()),
+        cache_ttl=LLM_MESSAGE_CACHE_TTL,
     )
 
 
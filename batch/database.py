@@ -1,10 +1,146 @@
+import os
 import sqlite3
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from batch.scorer import (
+    KEYWORD_SCORE_COLS,
+    PRODUCT_SCORE_KEYWORDS,
+    SCORE_COLS,
+    SCORED_TABLES,
+    get_scorer,
+    keyword_score_values,
+)
+from batch.utils import url_hash
+from batch.variables import (
+    DB_BUSY_TIMEOUT_MS,
+    DB_CACHE_SIZE_KB,
+    DB_CACHED_STATEMENTS,
+    DB_MMAP_SIZE,
+)
 
 DB_PATH = "jupjup.db"
 
+# url_hash(정규화 URL의 64bit 해시)로 중복을 거르는 테이블과 중복 판정 범위 컬럼
+URL_HASH_SCOPE: dict[str, list[str]] = {
+    "travellog": [],
+    "security_monitor": [],
+    "narasarang": [],
+    "issue": [],
+    "product": ["tag"],
+}
+
+_local = threading.local()
+
+
+def _open(path: str) -> sqlite3.Connection:
+    # isolation_level=None: 암묵적 BEGIN 없이 autocommit, 묶어야 하는 쓰기는 transaction()으로
+    conn = sqlite3.connect(
+        path,
+        isolation_level=None,
+        cached_statements=DB_CACHED_STATEMENTS,
+        check_same_thread=False,
+    )
+    # WAL: 수집(쓰기) 중에도 bot/메시지 생성(읽기)이 막히지 않음
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{DB_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+    conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+def get_connection(path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    스레드(프로세스)마다 하나씩 열어 두고 재사용하는 연결.
+    같은 SQL은 sqlite3의 statement cache로 재준비 없이 실행됨.
+    """
+    conns: dict[str, sqlite3.Connection] | None = getattr(_local, "conns", None)
+    if conns is None or getattr(_local, "pid", None) != os.getpid():
+        # fork된 자식 프로세스는 부모 연결을 물려받지 않고 새로 엶
+        conns = _local.conns = {}
+        _local.pid = os.getpid()
+    key = os.path.abspath(path)
+    if key not in conns:
+        conns[key] = _open(path)
+    return conns[key]
+
+
+@contextmanager
+def transaction(path: str = DB_PATH) -> Generator[sqlite3.Connection, None, None]:
+    """블록 안의 쓰기를 하나의 트랜잭션으로 커밋, 예외가 나면 롤백 (중첩 시 바깥 트랜잭션에 합류)"""
+    conn = get_connection(path)
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def close_connections() -> None:
+    """현재 스레드가 연 연결을 닫음 (WAL checkpoint 포함)"""
+    conns: dict[str, sqlite3.Connection] = getattr(_local, "conns", None) or {}
+    for conn in conns.values():
+        conn.close()
+    conns.clear()
+
+
+def _add_column_if_missing(
+    cursor: sqlite3.Cursor, table: str, column: str, decl: str
+) -> None:
+    columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def _backfill_url_hash(cursor: sqlite3.Cursor, table: str) -> None:
+    rows = cursor.execute(
+        f"SELECT id, url FROM {table} WHERE url_hash IS NULL"
+    ).fetchall()
+    cursor.executemany(
+        f"UPDATE {table} SET url_hash = ? WHERE id = ?",
+        [(url_hash(url), id) for id, url in rows],
+    )
+
+
+def _backfill_keyword_scores(cursor: sqlite3.Cursor, table: str) -> None:
+    """점수 재료가 없거나 지금과 다른 키워드로 계산된 행만 다시 계산"""
+    tags = list(PRODUCT_SCORE_KEYWORDS) if table == "product" else [None]
+    assignments = ", ".join(f"{c} = ?" for c in SCORE_COLS)
+    for tag in tags:
+        scorer = get_scorer(table, tag)
+        if scorer is None:
+            continue
+        tag_condition, params = (" AND tag = ?", [tag]) if tag else ("", [])
+        rows = cursor.execute(
+            f"""
+            SELECT id, title, description FROM {table}
+            WHERE score_key IS NOT ?{tag_condition}
+            """,
+            [scorer.score_key, *params],
+        ).fetchall()
+        values = keyword_score_values(
+            table,
+            [
+                {"tag": tag, "title": title, "description": desc}
+                for _, title, desc in rows
+            ],
+        )
+        cursor.executemany(
+            f"UPDATE {table} SET {assignments} WHERE id = ?",
+            [v + (row[0],) for v, row in zip(values, rows)],
+        )
+
 
 def init_database():
-    with sqlite3.connect(DB_PATH) as conn:
+    with transaction() as conn:
         cursor = conn.cursor()
 
         # 트래블로그
@@ -14,6 +150,7 @@ def init_database():
                 query TEXT,
                 title TEXT,
                 url TEXT UNIQUE NOT NULL,
+                url_hash INTEGER,
                 description TEXT,
                 post_date TEXT,
                 scrap_date DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -31,6 +168,7 @@ def init_database():
                 query TEXT,
                 title TEXT,
                 url TEXT UNIQUE NOT NULL,
+                url_hash INTEGER,
                 description TEXT,
                 post_date TEXT,
                 scrap_date TEXT,
@@ -50,11 +188,13 @@ def init_database():
                 content TEXT NOT NULL,
                 is_posted INTEGER DEFAULT 0,
                 scrapped_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                rule_score REAL,
                 gpt_score REAL,
                 topic TEXT
             )
         """)
-        conn.commit()
+        # rule_score 컬럼이 생기기 전에 만든 DB
+        _add_column_if_missing(cursor, "geeknews", "rule_score", "REAL")
 
         # 나라사랑카드
         cursor.execute("""
@@ -64,6 +204,7 @@ def init_database():
                 query TEXT,
                 title TEXT,
                 url TEXT UNIQUE NOT NULL,
+                url_hash INTEGER,
                 description TEXT,
                 post_date TEXT,
                 scrap_date DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -73,3 +214,113 @@ def init_database():
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         """)
+
+        # 카드 이슈 (blog, cafe)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS issue (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT,
+                title TEXT,
+                url TEXT UNIQUE NOT NULL,
+                url_hash INTEGER,
+                description TEXT,
+                post_date TEXT,
+                scrap_date TEXT,
+                source TEXT,
+                name TEXT,
+                is_posted INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # 경쟁사/자사 상품 이슈 (tag: credit | debit | wonder | jade)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS product (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tag TEXT NOT NULL,
+                query TEXT,
+                title TEXT,
+                url TEXT NOT NULL,
+                url_hash INTEGER,
+                description TEXT,
+                post_date TEXT,
+                scrap_date TEXT,
+                source TEXT,
+                name TEXT,
+                is_posted INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (tag, url)
+            )
+        """)
+
+        # date 정렬 수집 워터마크 (테이블, 소스, 검색어별 마지막 최신 URL)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fetch_watermark (
+                table_name TEXT NOT NULL,
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                url TEXT NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (table_name, source, query)
+            )
+        """)
+
+        # 검색어별 수집 수율 (새 URL 개수, 연속 무수확 횟수)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS query_yield (
+                collector TEXT NOT NULL,
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                fetches INTEGER NOT NULL DEFAULT 0,
+                new_urls INTEGER NOT NULL DEFAULT 0,
+                last_new_count INTEGER NOT NULL DEFAULT 0,
+                misses INTEGER NOT NULL DEFAULT 0,
+                last_fetched_at TEXT NOT NULL,
+                last_new_at TEXT,
+                PRIMARY KEY (collector, source, query)
+            )
+        """)
+
+        # url_hash 컬럼이 생기기 전에 만든 DB는 컬럼 추가 후 채움
+        for table, scope in URL_HASH_SCOPE.items():
+            _add_column_if_missing(cursor, table, "url_hash", "INTEGER")
+            _backfill_url_hash(cursor, table)
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_url_hash
+                ON {table} ({", ".join(scope + ["url_hash"])})
+            """)
+
+        # 날짜와 무관한 메시지 점수 재료 (scorer.SCORE_COLS)
+        # 수집 시 insert_rows가 채우고, 이전 DB의 행이나 점수 키워드가 바뀐 행은 여기서 다시 계산
+        for table in SCORED_TABLES:
+            for column in KEYWORD_SCORE_COLS:
+                _add_column_if_missing(cursor, table, column, "INTEGER")
+            _add_column_if_missing(cursor, table, "score_key", "TEXT")
+            _backfill_keyword_scores(cursor, table)
+
+        # 메시지 생성 시 fetch_df 조건(미게시, 브랜드/태그, 날짜 구간)용 인덱스
+        # travellog/security_monitor는 dml.DATE_KEY와 같은 식으로 색인
+        for table in ("travellog", "security_monitor"):
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_posted_date
+                ON {table} (is_posted, COALESCE(NULLIF(post_date, ''), CAST(scrap_date AS TEXT)))
+            """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_narasarang_brand_scrap_date
+            ON narasarang (brand, scrap_date)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_product_tag_post_date
+            ON product (tag, post_date)
+        """)
+
+        # 네이버 OpenAPI 일별 호출량 장부
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_usage (
+                day TEXT NOT NULL,
+                collector TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, collector, endpoint)
+            )
+        """)
@@ -0,0 +1,147 @@
+"""
+제목+본문 요약이 거의 같은 글(통신사 기사 전재, 카페 복붙 글)을 묶어 대표 글 하나만 남기는 near-duplicate 검출.
+
+- 글마다 글자 3-gram 집합의 MinHash 서명(64개)을 계산
+- 서명을 4개씩 16개 band로 나눠 같은 band 값을 가진 글끼리만 후보로 비교(LSH)
+- 후보 쌍은 3-gram 집합의 실제 Jaccard 유사도가 threshold 이상일 때만 union-find로 묶음
+
+검색 API의 description은 200자 안팎으로 짧아서, 몇 글자만 달라도 비트가 크게 흔들리는
+SimHash보다 집합 유사도를 직접 보는 MinHash가 전재 기사를 더 잘 묶음.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from batch.utils import canonical_url
+from batch.variables import NEAR_DUP_THRESHOLD
+
+SHINGLE_SIZE: int = 3
+NUM_PERM: int = 64
+BANDS: int = 16
+ROWS: int = NUM_PERM // BANDS
+ESTIMATE_MARGIN: float = 0.2  # 추정 Jaccard 오차 허용폭 (표준편차 약 0.06)
+_SPACES = re.compile(r"\s+")
+# xor 마스크로 만든 64개의 해시 순열 (실행마다 같은 결과가 나오도록 seed 고정)
+_MASKS = np.random.default_rng(20240101).integers(
+    0, np.iinfo(np.uint64).max, size=NUM_PERM, dtype=np.uint64, endpoint=True
+)
+
+
+def _normalize(text: str) -> str:
+    return _SPACES.sub(" ", (text or "").lower()).strip()
+
+
+def shingles(text: str) -> frozenset[str]:
+    text = _normalize(text)
+    if not text:
+        return frozenset()
+    return frozenset(
+        text[i : i + SHINGLE_SIZE] for i in range(max(1, len(text) - SHINGLE_SIZE + 1))
+    )
+
+
+@lru_cache(maxsize=1 << 16)
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big"
+    )
+
+
+def minhash(grams: frozenset[str]) -> np.ndarray:
+    """NUM_PERM개 순열 각각에서의 최소 해시값"""
+    hashes = np.fromiter(
+        (_shingle_hash(g) for g in grams), dtype=np.uint64, count=len(grams)
+    )
+    return (hashes[:, None] ^ _MASKS).min(axis=0)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _find(parent: list[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_ids(texts: list[str], threshold: float = NEAR_DUP_THRESHOLD) -> list[int]:
+    """
+    글마다 cluster 번호(cluster에서 가장 앞선 글의 위치)를 반환.
+    빈 글은 어떤 글과도 묶지 않음.
+    """
+    grams = [shingles(t) for t in texts]
+    parent = list(range(len(texts)))
+    signatures: dict[int, np.ndarray] = {}
+
+    buckets: dict[tuple[int, bytes], list[int]] = defaultdict(list)
+    for i, g in enumerate(grams):
+        if not g:
+            continue
+        signature = signatures[i] = minhash(g)
+        for band in range(BANDS):
+            key = signature[band * ROWS : (band + 1) * ROWS].tobytes()
+            buckets[(band, key)].append(i)
+
+    for members in buckets.values():
+        for pos, i in enumerate(members):
+            for j in members[pos + 1 :]:
+                root_i, root_j = _find(parent, i), _find(parent, j)
+                if root_i == root_j:
+                    continue
+                # 서명 일치 비율(추정 Jaccard)이 한참 낮으면 실제 계산 생략
+                estimate = np.count_nonzero(signatures[i] == signatures[j]) / NUM_PERM
+                if estimate < threshold - ESTIMATE_MARGIN:
+                    continue
+                if jaccard(grams[i], grams[j]) >= threshold:
+                    # 앞선(순위가 높은) 글이 cluster 대표가 되도록 작은 번호를 root로
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    return [_find(parent, i) for i in range(len(texts))]
+
+
+def collapse_near_duplicates(
+    df: pd.DataFrame,
+    url_col: str = "url",
+    text_cols: tuple[str, ...] = ("title", "description"),
+    threshold: float = NEAR_DUP_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    near-duplicate cluster마다 현재 순서상 첫 행만 남김.
+    - cluster_size: 대표 글이 대신하는 글 수 (자기 자신 포함)
+    - cluster_urls: cluster에 속한 글들의 URL (게시 처리 시 함께 표시)
+    """
+    if df.empty:
+        return df.assign(cluster_size=pd.Series(dtype=int), cluster_urls=[])
+    texts = df[list(text_cols)].fillna("").astype(str).agg(" ".join, axis=1).tolist()
+    clusters = pd.Series(cluster_ids(texts, threshold), index=df.index)
+    members = df[url_col].groupby(clusters).agg(list)
+    representatives = df.loc[~clusters.duplicated()]
+    rep_clusters = clusters.loc[representatives.index]
+    return representatives.assign(
+        cluster_size=rep_clusters.map(members.map(len)).to_numpy(),
+        cluster_urls=rep_clusters.map(members).to_numpy(),
+    )
+
+
+def expand_cluster_urls(
+    df: pd.DataFrame, urls: list[str], url_col: str = "url"
+) -> list[str]:
+    """cluster에 속한 URL 목록을 같은 cluster의 모든 URL로 확장 (순서 유지, 중복 제거)"""
+    if "cluster_urls" not in df.columns:
+        return urls
+    members = {
+        canonical_url(member): cluster
+        for cluster in df["cluster_urls"]
+        for member in cluster
+    }
+    expanded = [u for url in urls for u in members.get(canonical_url(url), [url])]
+    return list(dict.fromkeys(expanded))
@@ -1,9 +1,11 @@
 import sqlite3
-from typing import Iterable
+from typing import Any, Iterable
 
 import pandas as pd
 
-from batch.database import DB_PATH
+from batch.database import URL_HASH_SCOPE, get_connection, transaction
+from batch.scorer import SCORE_COLS, SCORED_TABLES, keyword_score_values
+from batch.utils import url_hash
 
 COMMON_COLS = [
     "query",
@@ -21,44 +23,204 @@ TABLE_COLS: dict[str, list[str]] = {
     "travellog": COMMON_COLS,
     "security_monitor": COMMON_COLS,
     "narasarang": ["brand"] + COMMON_COLS,
+    "issue": COMMON_COLS,
+    "product": ["tag"] + COMMON_COLS,
 }
 
 
-def fetch_df(table: str, cols: list[str] | None = None) -> pd.DataFrame:
+def _where_clause(where: dict[str, Any] | None) -> tuple[str, list[Any]]:
+    """{"col": value} → (" AND col = ?", [value])"""
+    if not where:
+        return "", []
+    return "".join(f" AND {col} = ?" for col in where), list(where.values())
+
+
+# post_date가 비어 있으면 scrap_date로 대신하는 날짜 키 (travellog, security_monitor)
+# scrap_date는 DATETIME(숫자 affinity) 컬럼이라 YYYYMMDD가 정수로 저장되므로 문자열로 비교
+DATE_KEY = "COALESCE(NULLIF(post_date, ''), CAST(scrap_date AS TEXT))"
+
+
+def fetch_df(
+    table: str,
+    cols: list[str] | None = None,
+    *,
+    unposted: bool = False,
+    brand: str | None = None,
+    source: str | None = None,
+    where: dict[str, Any] | None = None,
+    date_col: str = "post_date",
+    since: str | None = None,
+    until: str | None = None,
+    limit: int | None = None,
+) -> pd.DataFrame:
+    """
+    조건을 parameterized SQL의 WHERE로 넘겨 필요한 행만 읽음.
+    - unposted: is_posted = 0 인 행만
+    - brand, source, where: 컬럼 값이 같은 행만 (where는 {"col": value})
+    - since/until: date_col(컬럼 또는 DATE_KEY 같은 식) 기준 문자열 비교 구간 [since, until)
+    - limit: date_col 최신순으로 n개
+    """
     cols = cols or COMMON_COLS
-    sql = f"SELECT {', '.join(cols)} FROM {table}"
-    with sqlite3.connect(DB_PATH) as conn:
-        return pd.read_sql_query(sql, conn)
+    where = {
+        **({"brand": brand} if brand is not None else {}),
+        **({"source": source} if source is not None else {}),
+        **(where or {}),
+    }
+    condition, params = _where_clause(where)
+    if unposted:
+        condition += " AND is_posted = 0"
+    if since is not None:
+        condition += f" AND {date_col} >= ?"
+        params.append(since)
+    if until is not None:
+        condition += f" AND {date_col} < ?"
+        params.append(until)
+
+    sql = f"SELECT {', '.join(cols)} FROM {table} WHERE 1 = 1{condition}"
+    if limit is not None:
+        sql += f" ORDER BY {date_col} DESC LIMIT ?"
+        params.append(limit)
+    return pd.read_sql_query(sql, get_connection(), params=params)
 
 
 def insert_rows(table: str, rows: list[dict]) -> None:
+    """
+    url 또는 정규화 URL 해시(url_hash)가 이미 있는 행은 건너뜀.
+    product처럼 범위 컬럼(URL_HASH_SCOPE)이 있으면 그 범위 안에서만 중복으로 봄.
+    메시지 점수를 매기는 테이블(SCORED_TABLES)은 날짜와 무관한 점수 재료(SCORE_COLS)도 함께 저장.
+    """
+    rows = [r for r in rows if (r.get("url") or "").strip()]
     if not rows:
         return
     cols = TABLE_COLS.get(table, COMMON_COLS)
-    placeholders = ", ".join(["?"] * len(cols))
+    score_cols = SCORE_COLS if table in SCORED_TABLES else []
+    scope = URL_HASH_SCOPE.get(table, [])
+    placeholders = ", ".join(["?"] * (len(cols) + 1 + len(score_cols)))
+    scope_condition = "".join(f" AND {c} = ?" for c in scope)
     sql = f"""
-        INSERT OR IGNORE INTO {table} ({", ".join(cols)})
-        VALUES ({placeholders})
+        INSERT OR IGNORE INTO {table} ({", ".join(cols + ["url_hash"] + score_cols)})
+        SELECT {placeholders}
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {table} WHERE url_hash = ?{scope_condition}
+        )
     """
 
+    scores = keyword_score_values(table, rows) if score_cols else [()] * len(rows)
     values = []
-    for r in rows:
-        link = (r.get("url") or "").strip()
-        if not link:
-            continue
-        values.append(tuple(r.get(c, "") for c in cols))
+    for r, score in zip(rows, scores):
+        h = url_hash(r["url"].strip())
+        values.append(
+            tuple(r.get(c, "") for c in cols)
+            + (h,)
+            + score
+            + (h,)
+            + tuple(r.get(c) for c in scope)
+        )
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with transaction() as conn:
         conn.executemany(sql, values)
-        conn.commit()
 
 
-def mark_posted(table: str, urls: Iterable[str]) -> None:
-    urls = [u.strip() for u in urls if u and u.strip()]
+def _clean_urls(urls: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(u.strip() for u in urls if u and u.strip()))
+
+
+def _load_url_batch(conn: sqlite3.Connection, urls: list[str]) -> None:
+    """
+    URL과 url_hash 목록을 연결 전용 temp 테이블(temp.url_batch)에 적재.
+    IN (?, ?, ...) 대신 이 테이블과 join 하므로 bound variable 개수 제한이 없음.
+    """
+    conn.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS url_batch (
+            url TEXT PRIMARY KEY,
+            url_hash INTEGER NOT NULL
+        )
+    """)
+    conn.execute("DELETE FROM temp.url_batch")
+    conn.executemany(
+        "INSERT OR IGNORE INTO temp.url_batch (url, url_hash) VALUES (?, ?)",
+        [(u, url_hash(u)) for u in urls],
+    )
+
+
+def mark_newly_posted(
+    table: str, urls: Iterable[str], where: dict[str, Any] | None = None
+) -> list[str]:
+    """게시 처리하고, 이번에 처음 is_posted = 1이 된 URL만 반환 (없는 URL, 이미 게시된 URL 제외)"""
+    urls = _clean_urls(urls)
     if not urls:
+        return []
+    condition, params = _where_clause(where)
+    target = (
+        "is_posted = 0 AND url_hash IN (SELECT url_hash FROM temp.url_batch)"
+        f"{condition}"
+    )
+    with transaction() as conn:
+        _load_url_batch(conn, urls)
+        newly = [
+            row[0]
+            for row in conn.execute(f"SELECT url FROM {table} WHERE {target}", params)
+        ]
+        conn.execute(f"UPDATE {table} SET is_posted = 1 WHERE {target}", params)
+    return newly
+
+
+def mark_posted(
+    table: str, urls: Iterable[str], where: dict[str, Any] | None = None
+) -> None:
+    """정규화 URL이 같은 행(url_hash 일치)을 모두 게시 처리"""
+    urls = _clean_urls(urls)
+    if not urls:
+        return
+    condition, params = _where_clause(where)
+    sql = f"""
+        UPDATE {table} SET is_posted = 1
+        WHERE url_hash IN (SELECT url_hash FROM temp.url_batch){condition}
+    """
+    with transaction() as conn:
+        _load_url_batch(conn, urls)
+        conn.execute(sql, params)
+
+
+def existing_urls(
+    table: str, urls: Iterable[str], where: dict[str, Any] | None = None
+) -> set[str]:
+    """urls 중 정규화 URL 기준으로 이미 저장된 것 (입력한 표기 그대로 반환)"""
+    urls = _clean_urls(urls)
+    if not urls:
+        return set()
+    condition, params = _where_clause(where)
+    sql = f"""
+        SELECT b.url FROM temp.url_batch AS b
+        WHERE EXISTS (
+            SELECT 1 FROM {table} WHERE url_hash = b.url_hash{condition}
+        )
+    """
+    # 읽기 전용: temp 테이블만 쓰므로 쓰기 잠금(BEGIN IMMEDIATE)을 잡지 않음
+    conn = get_connection()
+    _load_url_batch(conn, urls)
+    return {row[0] for row in conn.execute(sql, params)}
+
+
+def get_watermark(table: str, source: str, query: str) -> str | None:
+    sql = """
+        SELECT url FROM fetch_watermark
+        WHERE table_name = ? AND source = ? AND query = ?
+    """
+    row = get_connection().execute(sql, (table, source, query)).fetchone()
+    return row[0] if row else None
+
+
+def set_watermarks(table: str, marks: dict[tuple[str, str], str]) -> None:
+    """marks: {(source, query): 가장 최신 url}"""
+    if not marks:
         return
-    placeholders = ",".join(["?"] * len(urls))
-    sql = f"UPDATE {table} SET is_posted = 1 WHERE url IN ({placeholders})"
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(sql, urls)
-        conn.commit()
+    sql = """
+        INSERT INTO fetch_watermark (table_name, source, query, url)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (table_name, source, query)
+        DO UPDATE SET url = excluded.url, updated_at = CURRENT_TIMESTAMP
+    """
+    values = [(table, source, query, url) for (source, query), url in marks.items()]
+    with transaction() as conn:
+        conn.executemany(sql, values)
@@ -1,7 +1,12 @@
+import asyncio
+import json
+import time
 from typing import Any
 
+import httpx
 import requests
 
+from batch.cache import http_cache
 from batch.models.request import SearchRequest, SearchTrendRequest
 from batch.models.response import (
     AbstractResponse,
@@ -10,7 +15,9 @@ from batch.models.response import (
     NewsResponse,
     TrendsResponse,
 )
+from batch.quota import api_quota
 from logger import logger
+from replay import replayable
 from secret import CLIENT_ID, CLIENT_SECRET
 
 TYPE_URL_MAPPER: dict[str, str] = {
@@ -24,8 +31,39 @@ TYPE_RESPONSE_MAPPER: dict[str, Any] = {
     "cafe": CafeResponse,
 }
 DATALAB_URL = "https://openapi.naver.com/v1/datalab/search"
+NAVER_RATE_PER_SEC: float = 10.0  # 검색 API 초당 호출 한도
+FETCH_CONCURRENCY: int = 8
 
 
+def _dump_response(response: AbstractResponse | None) -> dict[str, Any] | None:
+    return None if response is None else response.to_payload()
+
+
+def _load_search_response(
+    payload: dict[str, Any] | None, arguments: dict[str, Any]
+) -> AbstractResponse | None:
+    if payload is None:
+        return None
+    return TYPE_RESPONSE_MAPPER[arguments["type"]].decode(json.dumps(payload))
+
+
+def _load_trend_response(
+    payload: dict[str, Any] | None, arguments: dict[str, Any]
+) -> TrendsResponse | None:
+    return None if payload is None else TrendsResponse.decode(json.dumps(payload))
+
+
+def _fetch_failed(name: str) -> None:
+    """실패 시 fetch_data처럼 None"""
+    return None
+
+
+@replayable(
+    "naver_search",
+    encode=_dump_response,
+    decode=_load_search_response,
+    fail=_fetch_failed,
+)
 def fetch_data(
     type: str,  # Literal["blog", "news", "cafe"],
     query: str,
@@ -47,6 +85,16 @@ def fetch_data(
             start=start,
             sort=sort,
         )
+        cache_key = http_cache.make_key(url, request_data)
+        cached = http_cache.get(cache_key)
+        if cached is not None:
+            return response_wrapper.decode(cached)
+        if http_cache.offline:
+            logger.warning(f"[fetch_data] cache miss: type={type}, query={query}")
+            return None
+        if not api_quota.allow(url):
+            return None
+        api_quota.charge(url)
         response = requests.get(
             url=url,
             params=request_data.model_dump(),
@@ -54,7 +102,9 @@ def fetch_data(
             timeout=(5, 15),
         )
         response.raise_for_status()
-        return response_wrapper(**response.json())
+        result = response_wrapper.decode(response.content)
+        http_cache.set(cache_key, response.text, endpoint=url)
+        return result
     except requests.exceptions.Timeout as e:
         logger.error(f"[fetch_data] timeout: type={type}, query={query}, error={e}")
     except requests.exceptions.HTTPError as e:
@@ -70,6 +120,12 @@ def fetch_data(
     return None
 
 
+@replayable(
+    "naver_datalab",
+    encode=_dump_response,
+    decode=_load_trend_response,
+    fail=_fetch_failed,
+)
 def fetch_trend_data(
     startDate: str,
     endDate: str,
@@ -95,15 +151,172 @@ def fetch_trend_data(
             gender=gender,
             ages=ages,
         )
+        cache_key = http_cache.make_key(DATALAB_URL, request_data)
+        cached = http_cache.get(cache_key)
+        if cached is not None:
+            return TrendsResponse.decode(cached)
+        if http_cache.offline:
+            logger.warning(f"[fetch_trend_data] cache miss: {keywordGroups}")
+            return None
+        if not api_quota.allow(DATALAB_URL):
+            return None
+        api_quota.charge(DATALAB_URL)
         response = requests.post(
             url=DATALAB_URL,
             headers=headers,
             json=request_data.model_dump(exclude_none=True),
         )
         response.raise_for_status()
-        return TrendsResponse(**response.json())
+        result = TrendsResponse.decode(response.content)
+        http_cache.set(cache_key, response.text, endpoint=DATALAB_URL)
+        return result
     except requests.exceptions.RequestException as e:
         logger.error(f"API 요청 실패: {e}")
     except ValueError as e:
         logger.error(f"응답 데이터 오류: {e}")
     return None
+
+
+class TokenBucket:
+    """초당 rate 개의 토큰을 채우는 비동기 rate limiter."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncFetcher:
+    """keep-alive 클라이언트 하나로 blog, news, cafe 검색을 동시에 호출."""
+
+    def __init__(
+        self,
+        rate: float = NAVER_RATE_PER_SEC,
+        concurrency: int = FETCH_CONCURRENCY,
+    ):
+        self.limiter = TokenBucket(rate)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.concurrency = concurrency
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        self._client = httpx.AsyncClient(
+            headers={
+                "X-Naver-Client-Id": CLIENT_ID,
+                "X-Naver-Client-Secret": CLIENT_SECRET,
+            },
+            timeout=httpx.Timeout(15, connect=5),
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @replayable(
+        "naver_search",
+        encode=_dump_response,
+        decode=_load_search_response,
+        fail=_fetch_failed,
+    )
+    async def fetch(
+        self,
+        type: str,  # Literal["blog", "news", "cafe"],
+        query: str,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "sim",
+    ) -> AbstractResponse | None:
+        """fetch_data의 비동기 버전. 실패 시 None."""
+        if self._client is None:
+            raise RuntimeError("AsyncFetcher must be used with 'async with'")
+        url = TYPE_URL_MAPPER[type]
+        response_wrapper = TYPE_RESPONSE_MAPPER[type]
+        async with self.semaphore:
+            try:
+                request_data = SearchRequest(
+                    query=query,
+                    display=display,
+                    start=start,
+                    sort=sort,
+                )
+                cache_key = http_cache.make_key(url, request_data)
+                cached = http_cache.get(cache_key)
+                if cached is not None:
+                    return response_wrapper.decode(cached)
+                if http_cache.offline:
+                    logger.warning(
+                        f"[fetch_many] cache miss: type={type}, query={query}"
+                    )
+                    return None
+                if not api_quota.allow(url):
+                    return None
+                api_quota.charge(url)
+                await self.limiter.acquire()
+                response = await self._client.get(url, params=request_data.model_dump())
+                response.raise_for_status()
+                result = response_wrapper.decode(response.content)
+                http_cache.set(cache_key, response.text, endpoint=url)
+                return result
+            except httpx.TimeoutException as e:
+                logger.error(
+                    f"[fetch_many] timeout: type={type}, query={query}, error={e}"
+                )
+            except httpx.HTTPStatusError as e:
+                logger.error(
+                    f"[fetch_many] http error: type={type}, query={query}, error={e}"
+                )
+            except httpx.RequestError as e:
+                logger.error(
+                    f"[fetch_many] request error: type={type}, query={query}, error={e}"
+                )
+            except ValueError as e:
+                logger.error(
+                    f"[fetch_many] response parse error: type={type}, query={query}, error={e}"
+                )
+        return None
+
+    async def fetch_all(
+        self, tasks: list[dict[str, Any]]
+    ) -> list[AbstractResponse | None]:
+        return await asyncio.gather(*[self.fetch(**task) for task in tasks])
+
+
+def fetch_many(
+    tasks: list[dict[str, Any]],
+    rate: float = NAVER_RATE_PER_SEC,
+    concurrency: int = FETCH_CONCURRENCY,
+) -> list[AbstractResponse | None]:
+    """
+    fetch_data 인자(dict) 목록을 동시에 호출하고 입력 순서대로 결과를 돌려줌.
+    - 초당 호출 수는 token bucket으로 NAVER_RATE_PER_SEC 이하로 제한
+    - 실패한 요청은 fetch_data와 같이 None
+    """
+    if not tasks:
+        return []
+
+    async def _run() -> list[AbstractResponse | None]:
+        async with AsyncFetcher(rate=rate, concurrency=concurrency) as fetcher:
+            return await fetcher.fetch_all(tasks)
+
+    return asyncio.run(_run())
@@ -4,6 +4,8 @@ import re
 
 from pydantic import BaseModel
 
+from batch.packing import score_packed
+from batch.variables import LLM_SCORE_CACHE_TTL, LLM_SCORE_PACK_SIZE
 from bot.services.core.openai_client import async_openai_response
 from logger import logger
 
@@ -72,6 +74,12 @@ def _make_prompt_input(row: GeekNewsItem) -> str:
 """.strip()
 
 
+def _score_topic(obj: dict) -> tuple[float, str]:
+    score = max(0.0, min(100.0, float(obj.get("score", 0.0))))
+    topic = str(obj.get("topic", "")).strip() or "기타"
+    return score, topic[:10]
+
+
 def _parse_score_topic(text: str) -> tuple[float, str]:
     if not text:
         return 0.0, "기타"
@@ -79,26 +87,12 @@ def _parse_score_topic(text: str) -> tuple[float, str]:
     t = text.strip()
 
     try:
-        obj = json.loads(t)
-        score = float(obj.get("score", 0.0))
-        topic = str(obj.get("topic", "")).strip()
-        score = max(0.0, min(100.0, score))
-        topic = topic if topic else "기타"
-        topic = topic[:10]
-        return score, topic
+        return _score_topic(json.loads(t))
     except Exception:
-        score = 0.0
-        topic = "기타"
-
         m = re.search(r"\{.*\}", t, re.DOTALL)
         if m:
             try:
-                obj = json.loads(m.group(0))
-                score = float(obj.get("score", 0.0))
-                topic = str(obj.get("topic", "")).strip() or "기타"
-                score = max(0.0, min(100.0, score))
-                topic = topic[:10]
-                return score, topic
+                return _score_topic(json.loads(m.group(0)))
             except Exception:
                 pass
 
@@ -113,6 +107,7 @@ async def _gpt_score_one_item(
             out = await async_openai_response(
                 prompt=SCORING_PROMPT,
                 input=_make_prompt_input(item),
+                cache_ttl=LLM_SCORE_CACHE_TTL,
             )
             return _parse_score_topic(out)
         except Exception as e:
@@ -123,9 +118,24 @@ async def _gpt_score_one_item(
 async def gpt_score_from_items(
     items: list[GeekNewsItem],
     concurrency: int = 5,
+    pack_size: int = LLM_SCORE_PACK_SIZE,
 ) -> list[tuple[float, str]]:
     if not items:
         return []
     sem = asyncio.Semaphore(concurrency)
-    results = await asyncio.gather(*[_gpt_score_one_item(it, sem) for it in items])
+    if pack_size > 1:
+        # 글 pack_size개를 요청 하나로 묶고, 답이 빠진 글만 글 단위 요청으로 처리
+        results = await score_packed(
+            [_make_prompt_input(it) for it in items],
+            prompt=SCORING_PROMPT,
+            keys=("score", "topic"),
+            example='{"id":0,"score":73,"topic":"라우터 해킹"}',
+            convert=_score_topic,
+            fallback=lambda i: _gpt_score_one_item(items[i], sem),
+            semaphore=sem,
+            pack_size=pack_size,
+            cache_ttl=LLM_SCORE_CACHE_TTL,
+        )
+    else:
+        results = await asyncio.gather(*[_gpt_score_one_item(it, sem) for it in items])
     return [(float(s), str(tp)) for (s, tp) in results]
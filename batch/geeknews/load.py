@@ -6,10 +6,11 @@ import xml.etree.ElementTree as ET
 
 import requests
 
-from batch.database import DB_PATH
+from batch.database import get_connection, transaction
 from batch.geeknews.gpt_rank import GeekNewsItem, gpt_score_from_items
 from batch.geeknews.rank import rule_score_from_text
 from logger import logger
+from replay import replayable
 
 RSS_URL = "https://feeds.feedburner.com/geeknews-feed"
 
@@ -21,47 +22,72 @@ def remove_html(raw_html: str) -> str:
 
 
 def get_last_url() -> str:
-    with sqlite3.connect(DB_PATH) as conn:
-        row = conn.execute("""
-            SELECT url
-            FROM geeknews
-            ORDER BY id DESC
-            LIMIT 1
-            """).fetchone()
+    conn = get_connection()
+    row = conn.execute("""
+        SELECT url
+        FROM geeknews
+        ORDER BY id DESC
+        LIMIT 1
+        """).fetchone()
     return (row[0] or "").strip()
 
 
+INSERT_SQL = """
+    INSERT OR IGNORE INTO geeknews (title, url, content, rule_score, gpt_score, topic)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _row(item: GeekNewsItem) -> tuple:
+    return (
+        item.title,
+        item.url,
+        item.content,
+        item.rule_score,
+        item.gpt_score,
+        item.topic,
+    )
+
+
 def save_news_item(item: GeekNewsItem) -> None:
-    with sqlite3.connect(DB_PATH) as conn:
-        try:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO geeknews (title, url, content, rule_score, gpt_score, topic)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    item.title,
-                    item.url,
-                    item.content,
-                    item.rule_score,
-                    item.gpt_score,
-                    item.topic,
-                ),
-            )
-            conn.commit()
-        except sqlite3.Error as e:
-            logger.error(f"DB save error: {e}")
+    try:
+        with transaction() as conn:
+            conn.execute(INSERT_SQL, _row(item))
+    except sqlite3.Error as e:
+        logger.error(f"DB save error: {e}")
+
+
+def save_news_items(items: list[GeekNewsItem]) -> int:
+    """여러 건을 한 트랜잭션에서 executemany로 저장. 새로 저장된 건수 반환."""
+    if not items:
+        return 0
+    try:
+        with transaction() as conn:
+            return conn.executemany(INSERT_SQL, [_row(it) for it in items]).rowcount
+    except sqlite3.Error as e:
+        logger.error(f"DB save error: {e}")
+        return 0
+
+
+@replayable(
+    "geeknews_rss",
+    encode=lambda content: content.decode("utf-8"),
+    decode=lambda payload, _: payload.encode("utf-8"),
+)
+def fetch_rss() -> bytes:
+    response = requests.get(RSS_URL, timeout=10)
+    response.raise_for_status()
+    return response.content
 
 
 def collect_load_geeknews(rule_top_n: int = 30, gpt_concurrency: int = 5) -> None:
     try:
-        response = requests.get(RSS_URL, timeout=10)
-        response.raise_for_status()
+        content = fetch_rss()
     except Exception as e:
         logger.error(f"GeekNews RSS fetch error: {e}")
         return
 
-    root = ET.fromstring(response.content)
+    root = ET.fromstring(content)
     ns = {"atom": "http://www.w3.org/2005/Atom"}
     entries = root.findall("atom:entry", ns)
 
@@ -113,9 +139,9 @@ def collect_load_geeknews(rule_top_n: int = 30, gpt_concurrency: int = 5) -> Non
             s, tp = score_map[it.url]
             it.gpt_score = s
             it.topic = tp
-        save_news_item(it)
+    saved = save_news_items(items)
 
     logger.info(
-        f"[GeekNews] saved new items (looped insert): {len(items)} "
+        f"[GeekNews] saved new items (bulk insert): {saved}/{len(items)} "
         f"(gpt_scored={len(score_map)}, rule_top_n={rule_top_n})"
     )
@@ -1,41 +1,51 @@
 import sqlite3
 
-from batch.database import DB_PATH
+from batch.database import get_connection, transaction
 from logger import logger
 
 
 def update_posted_status(id: str):
-    with sqlite3.connect(DB_PATH) as conn:
+    with transaction() as conn:
         conn.execute("UPDATE geeknews SET is_posted = 1 WHERE id = ?", (id,))
-        conn.commit()
+
+
+def update_posted_statuses(ids: list[int]) -> None:
+    if not ids:
+        return
+    placeholders = ",".join(["?"] * len(ids))
+    with transaction() as conn:
+        conn.execute(
+            f"UPDATE geeknews SET is_posted = 1 WHERE id IN ({placeholders})", ids
+        )
 
 
 def get_geeknews_message() -> list[str]:
     """DB에서 미발송건만 찾아 전달"""
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute(
-            """
-            SELECT id, title, content, url, topic
-            FROM geeknews
-            WHERE is_posted = 0
-            ORDER BY gpt_score DESC
-            LIMIT 10
-            """
-        )
-        unposted = cursor.fetchall()
-        messages: list[str] = []
-        for row in unposted:
-            try:
-                message = (
-                    f"대주제:{row['topic']}\n"
-                    f"제목:{row['title']}\n"
-                    f"내용:{row['content']}\n"
-                    f"링크:{row['url']}"
-                )
-                messages.append(message)
-                update_posted_status(row["id"])
-            except Exception as e:
-                logger.error(f"Poster Error (ID {row['id']}): {e}")
+    cursor = get_connection().cursor()
+    cursor.row_factory = sqlite3.Row
+    unposted = cursor.execute(
+        """
+        SELECT id, title, content, url, topic
+        FROM geeknews
+        WHERE is_posted = 0
+        ORDER BY gpt_score DESC
+        LIMIT 10
+        """
+    ).fetchall()
+    messages: list[str] = []
+    posted_ids: list[int] = []
+    for row in unposted:
+        try:
+            message = (
+                f"대주제:{row['topic']}\n"
+                f"제목:{row['title']}\n"
+                f"내용:{row['content']}\n"
+                f"링크:{row['url']}"
+            )
+            messages.append(message)
+            posted_ids.append(row["id"])
+        except Exception as e:
+            logger.error(f"Poster Error (ID {row['id']}): {e}")
+    update_posted_statuses(posted_ids)
 
     return messages
@@ -1,3 +1,5 @@
+from batch.matcher import get_matcher
+
 KEYWORD_WEIGHTS: dict[str, int] = {
     # ===== 최상위: 금융·보안·개인정보 =====
     "금융": 22,
@@ -45,12 +47,8 @@ KEYWORD_WEIGHTS: dict[str, int] = {
 
 
 def _keyword_score(text: str) -> float:
-    t = (text or "").lower()
-    score = 0.0
-    for kw, w in KEYWORD_WEIGHTS.items():
-        if kw.lower() in t:
-            score += float(w)
-    return score
+    matcher = get_matcher(tuple(KEYWORD_WEIGHTS), ignore_case=True)
+    return float(sum(KEYWORD_WEIGHTS[kw] for kw in matcher.hits(text)))
 
 
 def rule_score_from_text(title: str, content: str) -> float:
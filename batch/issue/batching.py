@@ -0,0 +1,151 @@
+"""
+이슈 검색어 여러 개를 네이버 검색 OR 연산자(|)로 묶어 한 번에 호출하고,
+받은 결과를 제목/요약에 포함된 검색어 기준으로 다시 나누는 배칭 모드.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any
+
+from batch.fetch import fetch_many
+from batch.variables import SOURCES
+from logger import logger
+
+OR_OPERATOR: str = " | "
+API_MAX_DISPLAY: int = 100
+DEFAULT_DISPLAY: int = 10  # 배칭하지 않을 때 검색어 하나당 결과 수
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _compact(text: str) -> str:
+    return _WHITESPACE.sub("", text or "").lower()
+
+
+def pack_queries(queries: list[str], batch_size: int) -> list[list[str]]:
+    """
+    첫 토큰(카드 상품명)이 같은 검색어끼리 batch_size개씩 묶음.
+    같은 상품끼리 묶어야 OR 검색 결과가 상품과 무관한 문서로 채워지지 않음.
+    """
+    if batch_size <= 1:
+        return [[q] for q in queries]
+
+    groups: dict[str, list[str]] = defaultdict(list)
+    for q in queries:
+        groups[q.split(" ", 1)[0]].append(q)
+    return [
+        group[i : i + batch_size]
+        for group in groups.values()
+        for i in range(0, len(group), batch_size)
+    ]
+
+
+def packed_query(batch: list[str]) -> str:
+    return OR_OPERATOR.join(batch)
+
+
+def batch_display(batch: list[str]) -> int:
+    """묶은 검색어 수만큼 결과 수를 늘려 검색어당 결과 수를 유지"""
+    return min(API_MAX_DISPLAY, DEFAULT_DISPLAY * len(batch))
+
+
+def match_queries(item: dict[str, Any], batch: list[str]) -> list[str]:
+    """
+    제목+요약에 검색어의 모든 토큰이 (공백 무시) 포함된 검색어 목록.
+    네이버는 '인증 실패'와 '인증실패'를 같은 검색어로 취급하므로 공백을 무시하고 비교.
+    """
+    text = _compact(f"{item.get('title', '')} {item.get('description', '')}")
+    return [q for q in batch if all(_compact(token) in text for token in q.split())]
+
+
+def demux(items: list[dict[str, Any]], batch: list[str]) -> list[dict[str, Any]]:
+    """
+    묶어서 받은 결과를 검색어별로 다시 나눔.
+    - 여러 검색어에 해당하면 검색어마다 한 행씩 만듦 (저장 시 link 기준 중복 제거)
+    - 어느 검색어에도 해당하지 않으면 묶은 검색어 문자열을 그대로 query로 사용
+      (scheduler 기록에서는 묶은 검색어 모두의 결과로 셈)
+    """
+    if len(batch) == 1:
+        return [{**it, "query": batch[0]} for it in items]
+
+    rows: list[dict[str, Any]] = []
+    for it in items:
+        matched = match_queries(it, batch) or [packed_query(batch)]
+        rows.extend({**it, "query": q} for q in matched)
+    return rows
+
+
+def build_batched_tasks(source: str, batches: list[list[str]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "type": source,
+            "query": packed_query(batch),
+            "display": batch_display(batch),
+            "sort": "date" if source == "cafe" else "sim",
+        }
+        for batch in batches
+    ]
+
+
+def compare_modes(
+    queries: list[str], batch_size: int, sources: list[str] = SOURCES
+) -> dict[str, Any]:
+    """
+    배칭 모드와 기존 모드(검색어당 1회 호출)의 요청 수와 재현율 비교.
+    - recall: 기존 모드에서 수집된 link 중 배칭 모드에서도 수집된 비율
+    - attributed_recall: 기존 모드의 (query, link) 쌍 중 배칭 모드에서 같은 query로 배정된 비율
+    """
+    batches = pack_queries(queries, batch_size)
+    report: dict[str, Any] = {"batch_size": batch_size, "sources": {}}
+    for source in sources:
+        baseline_pairs: set[tuple[str, str]] = set()
+        baseline_tasks = build_batched_tasks(source, [[q] for q in queries])
+        for q, response in zip(queries, fetch_many(baseline_tasks)):
+            if response is None:
+                continue
+            baseline_pairs.update(
+                (q, it["link"]) for it in response.to_items(query=q, scrap_date="")
+            )
+
+        batched_pairs: set[tuple[str, str]] = set()
+        for batch, response in zip(
+            batches, fetch_many(build_batched_tasks(source, batches))
+        ):
+            if response is None:
+                continue
+            items = response.to_items(query=packed_query(batch), scrap_date="")
+            batched_pairs.update(
+                (it["query"], it["link"]) for it in demux(items, batch)
+            )
+
+        baseline_links = {link for _, link in baseline_pairs}
+        batched_links = {link for _, link in batched_pairs}
+        report["sources"][source] = {
+            "requests": {"unbatched": len(queries), "batched": len(batches)},
+            "links": {"unbatched": len(baseline_links), "batched": len(batched_links)},
+            "recall": _ratio(len(baseline_links & batched_links), len(baseline_links)),
+            "attributed_recall": _ratio(
+                len(baseline_pairs & batched_pairs), len(baseline_pairs)
+            ),
+            "unmatched": sum(1 for q, _ in batched_pairs if OR_OPERATOR in q),
+        }
+    return report
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    from batch.issue.keywords import QUERIES
+
+    parser = argparse.ArgumentParser(description="이슈 검색어 배칭 비교 리포트")
+    parser.add_argument("--batch-size", type=int, default=5)
+    args = parser.parse_args()
+
+    report = compare_modes(QUERIES, args.batch_size)
+    logger.info(f"[issue.batching] {json.dumps(report, ensure_ascii=False)}")
+    print(json.dumps(report, ensure_ascii=False, indent=2))
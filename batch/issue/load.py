@@ -1,60 +1,114 @@
-import os
 from datetime import datetime
-from time import sleep
+from typing import Any
 
 import pandas as pd
 from tqdm import tqdm
 
-from batch.fetch import fetch_data
+from batch.dml import existing_urls, insert_rows
+from batch.fetch import fetch_many
+from batch.issue.batching import (
+    build_batched_tasks,
+    demux,
+    pack_queries,
+    packed_query,
+)
 from batch.issue.keywords import QUERIES
 from batch.issue.select_column import SOURCES_SELECT_MAP
-from batch.utils import read_csv
-from batch.variables import DATA_PATH, SAVE_PATH, SOURCES
+from batch.planner import QueryPlanner
+from batch.scheduler import QueryScheduler
+from batch.variables import ISSUE_QUERY_BATCH_SIZE, SOURCES
 from logger import logger
 
+COLLECTOR = "issue"
+TABLE = "issue"
 
-def collect_load_data(queries: list[str]) -> None:
-    """데이터를 수집하고 저장."""
-    os.makedirs(SAVE_PATH, exist_ok=True)
 
-    _df_list: list[pd.DataFrame] = [read_csv(DATA_PATH)]
+def _source_tasks(
+    source: str, queries: list[str], batch_size: int = 1
+) -> list[dict[str, Any]]:
+    if batch_size > 1:
+        return build_batched_tasks(source, pack_queries(queries, batch_size))
+    return [
+        {
+            "type": source,
+            "query": keyword,
+            "sort": "date" if source == "cafe" else "sim",
+        }
+        for keyword in queries
+    ]
+
+
+def _due_queries(
+    scheduler: QueryScheduler | None, source: str, queries: list[str]
+) -> list[str]:
+    return scheduler.due(COLLECTOR, source, queries) if scheduler else queries
+
+
+def build_tasks(
+    queries: list[str],
+    batch_size: int = ISSUE_QUERY_BATCH_SIZE,
+    scheduler: QueryScheduler | None = None,
+) -> list[dict[str, Any]]:
+    """QueryPlanner에 등록할 검색 요청 목록"""
+    return [
+        task
+        for source in SOURCES
+        for task in _source_tasks(
+            source, _due_queries(scheduler, source, queries), batch_size
+        )
+    ]
+
+
+def collect_load_data(
+    queries: list[str],
+    planner: QueryPlanner | None = None,
+    batch_size: int = ISSUE_QUERY_BATCH_SIZE,
+    scheduler: QueryScheduler | None = None,
+) -> None:
+    """
+    데이터를 수집하고 issue 테이블에 저장.
+    batch_size > 1이면 검색어를 OR(|)로 묶어 호출하고 결과를 검색어별로 다시 나눔.
+    scheduler가 있으면 이번 실행에 수집할 검색어만 호출하고 검색어별 새 URL 수를 기록.
+    """
+    fetch = planner.fetch_many if planner else fetch_many
+
     for source in tqdm(SOURCES, disable=True):
-        _file_path = os.path.join(SAVE_PATH, f"_{source}.csv")
-        _data_source = read_csv(_file_path)
         items: list[dict[str, str]] = []
-        for keyword in tqdm(queries, disable=True):
-            _data = fetch_data(
-                type=source,
-                query=keyword,
-                sort="date" if source == "cafe" else "sim",
-            )
-            sleep(0.05)
+        fetched: dict[str, set[str]] = {}  # 검색어별 수집 link
+        source_queries = _due_queries(scheduler, source, queries)
+        batches = pack_queries(source_queries, batch_size)
+        results = fetch(_source_tasks(source, source_queries, batch_size))
+        for batch, _data in tqdm(zip(batches, results), disable=True):
             if _data is None:
-                logger.error(f"Failed to fetch data for {keyword} from {source}")
+                logger.error(f"Failed to fetch data for {batch} from {source}")
                 continue
             _items = _data.to_items(
-                query=keyword,
+                query=batch[0],
                 scrap_date=datetime.today().strftime("%Y%m%d"),
             )
-            items.extend(_items)
+            rows = demux(_items, batch)
+            items.extend(rows)
+            # 어느 검색어에도 배정되지 않은 결과는 묶은 검색어 모두의 수집 결과로 셈
+            unmatched = packed_query(batch)
+            for q in batch:
+                fetched[q] = {
+                    it["link"] for it in rows if it["query"] in (q, unmatched)
+                }
 
-        _data_source = pd.concat(
-            [_data_source, pd.DataFrame(items).assign(source=source, is_posted=0)],
-            ignore_index=True,
-        )
-        _data_source = _data_source.drop_duplicates(subset=["link"])
-        _data_source.to_csv(_file_path, index=False, encoding="utf-8")
-        _df_list.append(SOURCES_SELECT_MAP[source](_data_source))
-        logger.info(f"{_file_path} scrap completed")
-
-    data = (
-        pd.concat(_df_list, ignore_index=True)
-        .sort_values(
-            by=["is_posted", "scrap_date"], ascending=[False, True]
-        )  # is_posted가 1인 경우, scrap_date 가 오래된 것을 남김
-        .drop_duplicates(subset="link", keep="first")  # link 기준으로 중복 제거
-    )
-    data.to_csv(DATA_PATH, index=False, encoding="utf-8")
+        if scheduler:
+            known_links = existing_urls(TABLE, [it["link"] for it in items])
+            for q, links in fetched.items():
+                scheduler.record(COLLECTOR, source, q, len(links - known_links))
+
+        if not items:
+            logger.info(f"issue scrap completed: source={source}, rows=0")
+            continue
+
+        df = SOURCES_SELECT_MAP[source](
+            pd.DataFrame(items).assign(source=source, is_posted=0)
+        ).rename(columns={"link": "url"})
+        insert_rows(TABLE, df.to_dict(orient="records"))
+        logger.info(f"issue scrap completed: source={source}, rows={len(df)}")
 
 
 if __name__ == "__main__":
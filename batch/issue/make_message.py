@@ -3,14 +3,18 @@ from datetime import datetime
 
 import pandas as pd
 
+from batch.dedup import collapse_near_duplicates, expand_cluster_urls
+from batch.dml import COMMON_COLS, fetch_df, mark_posted
 from batch.issue.keywords import CARD_PRODUCTS, ISSUE_KEYWORDS
 from batch.issue.prompt import PROMPT, TEXT_INPUT
-from batch.scorer import extract_high_score_data
+from batch.scorer import SCORE_COLS, extract_high_score_data
 from batch.utils import extract_urls
-from batch.variables import DATA_PATH, EXTRACTED_DATA_COUNT
+from batch.variables import EXTRACTED_DATA_COUNT, LLM_MESSAGE_CACHE_TTL
 from bot.services.core.openai_client import async_openai_response
 from logger import logger
 
+TABLE = "issue"
+
 
 async def get_issue_message(data: pd.DataFrame, tag: bool = True) -> list[str]:
     refined_data = extract_high_score_data(
@@ -22,9 +26,12 @@ async def get_issue_message(data: pd.DataFrame, tag: bool = True) -> list[str]:
     if len(refined_data) == 0:
         logger.warning("No data found after filtering.")
         return ["오늘은 주목할만한 이슈가 없어요! 다음에 더 좋은 이슈로 찾아올게요 😊"]
+    refined_data = collapse_near_duplicates(refined_data, url_col="link")
 
     content = json.dumps(
-        refined_data[["title", "link", "description"]].to_dict(orient="records"),
+        refined_data[["title", "link", "description", "cluster_size"]].to_dict(
+            orient="records"
+        ),
         ensure_ascii=False,
     )
     try:
@@ -36,6 +43,7 @@ async def get_issue_message(data: pd.DataFrame, tag: bool = True) -> list[str]:
             ),
             timeout=90,
             initial_delay=2,
+            cache_ttl=LLM_MESSAGE_CACHE_TTL,
         )
     except Exception as e:
         logger.exception(f"[issue] Failed to generate issue message: {e}")
@@ -55,7 +63,11 @@ async def get_issue_message(data: pd.DataFrame, tag: bool = True) -> list[str]:
         if len(urls) != 2:
             logger.warning("Not expected number of URLs found in the message.")
         if tag:
-            data.loc[data["link"].isin(urls), "is_posted"] = 1
+            mark_posted(TABLE, expand_cluster_urls(refined_data, urls, "link"))
 
-    data.to_csv(DATA_PATH, index=False, encoding="utf-8")
     return [message]
+
+
+def load_issue_data() -> pd.DataFrame:
+    """issue 테이블을 프롬프트/스코어러가 쓰는 컬럼명(link)으로 로드 (저장된 점수 재료 포함)"""
+    return fetch_df(TABLE, COMMON_COLS + SCORE_COLS).rename(columns={"url": "link"})
@@ -0,0 +1,109 @@
+"""
+여러 키워드를 글 한 번 훑기로 찾는 Aho-Corasick 매처.
+
+`kw in text`/`text.count(kw)`를 키워드마다 반복하면 비용이 (키워드 수 × 글 수 × 글 길이)로
+늘어나므로, 키워드 집합마다 automaton을 한 번 만들어 두고(get_matcher로 캐시) 글마다 한 번만 훑음.
+- ignore_case: 키워드와 글을 소문자로 맞춰 비교
+- ignore_space: 공백을 모두 지우고 비교 ("나라 사랑" == "나라사랑")
+빈 키워드(정규화 후 빈 문자열 포함)는 무시하고, 중복 키워드는 count/counts에서 중복 횟수만큼 셈.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+import ahocorasick
+
+_SPACES = re.compile(r"\s+")
+
+
+def _self_overlaps(pattern: str) -> bool:
+    """pattern의 접두사와 접미사가 같은 경우가 있으면 한 글 안에서 겹쳐 나올 수 있음"""
+    return any(pattern[:k] == pattern[-k:] for k in range(1, len(pattern)))
+
+
+class KeywordMatcher:
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        *,
+        ignore_space: bool = False,
+        ignore_case: bool = False,
+    ):
+        self.keywords = tuple(k for k in keywords if k)
+        self.ignore_space = ignore_space
+        self.ignore_case = ignore_case
+
+        # 정규화하면 같아지는 키워드("KB", "kb")나 중복 키워드는 하나의 패턴으로 묶음
+        grouped: dict[str, list[str]] = {}
+        for kw in self.keywords:
+            pattern = self.normalize(kw)
+            if pattern:
+                grouped.setdefault(pattern, []).append(kw)
+
+        self._automaton = ahocorasick.Automaton()
+        for pattern, originals in grouped.items():
+            self._automaton.add_word(pattern, (len(pattern), tuple(originals)))
+        if grouped:
+            self._automaton.make_automaton()
+        self._empty = not grouped
+        # 자기 자신과 겹칠 수 있는 키워드("aa", "abab")나 묶인 키워드가 없으면 매치 수가 곧 등장 횟수 합
+        self._plain_count = all(
+            len(originals) == 1 and not _self_overlaps(pattern)
+            for pattern, originals in grouped.items()
+        )
+
+    def normalize(self, text: str) -> str:
+        text = text or ""
+        if self.ignore_case:
+            text = text.lower()
+        if self.ignore_space:
+            text = _SPACES.sub("", text)
+        return text
+
+    def _iter(self, text: str) -> Iterator[tuple[int, int, tuple[str, ...]]]:
+        """(시작 위치, 끝 위치, 해당 키워드들)을 끝 위치 순으로"""
+        if self._empty or not text:
+            return
+        for end, (length, originals) in self._automaton.iter(self.normalize(text)):
+            yield end - length + 1, end, originals
+
+    def has_any(self, text: str) -> bool:
+        if self._empty or not text:
+            return False
+        return next(self._automaton.iter(self.normalize(text)), None) is not None
+
+    def hits(self, text: str) -> set[str]:
+        """글에 한 번이라도 나온 키워드"""
+        return {kw for _, _, originals in self._iter(text) for kw in originals}
+
+    def counts(self, text: str) -> dict[str, int]:
+        """키워드별 등장 횟수 (str.count처럼 같은 키워드끼리는 겹치지 않게 셈)"""
+        counts: dict[str, int] = {}
+        last_end: dict[tuple[str, ...], int] = {}
+        for start, end, originals in self._iter(text):
+            if start <= last_end.get(originals, -1):
+                continue
+            last_end[originals] = end
+            for kw in originals:
+                counts[kw] = counts.get(kw, 0) + 1
+        return counts
+
+    def count(self, text: str) -> int:
+        """모든 키워드의 등장 횟수 합 (sum(text.count(kw) for kw in keywords)와 같음)"""
+        if not self._plain_count:
+            return sum(self.counts(text).values())
+        if self._empty or not text:
+            return 0
+        return len(list(self._automaton.iter(self.normalize(text))))
+
+
+@lru_cache(maxsize=128)
+def get_matcher(
+    keywords: tuple[str, ...],
+    *,
+    ignore_space: bool = False,
+    ignore_case: bool = False,
+) -> KeywordMatcher:
+    """키워드 튜플(과 옵션)마다 automaton을 한 번만 만들어 재사용"""
+    return KeywordMatcher(keywords, ignore_space=ignore_space, ignore_case=ignore_case)
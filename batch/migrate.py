@@ -0,0 +1,77 @@
+"""
+CSV로 관리하던 issue/product 데이터를 jupjup.db로 옮기는 1회성 마이그레이션.
+옮긴 CSV는 <파일명>.migrated로 이름을 바꿔 다음 실행에서 다시 읽지 않음.
+"""
+
+import os
+
+import pandas as pd
+
+from batch.database import transaction
+from batch.dml import TABLE_COLS
+from batch.product.load import FILE_TAG_QUERIES_MAP
+from batch.scorer import SCORE_COLS, keyword_score_values
+from batch.utils import url_hash
+from batch.variables import DATA_PATH, PRODUCT_SAVE_PATH
+from logger import logger
+
+MIGRATED_SUFFIX: str = ".migrated"
+
+
+def _read_legacy_csv(path: str) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=str, encoding="utf-8").fillna("")
+    df = df.rename(columns={"link": "url"})
+    df["url"] = df["url"].str.strip()
+    df["is_posted"] = pd.to_numeric(df.get("is_posted", 0), errors="coerce")
+    df["is_posted"] = df["is_posted"].fillna(0).astype(int)
+    return df.loc[df["url"] != ""]
+
+
+def _upsert(table: str, df: pd.DataFrame, conflict_cols: list[str]) -> int:
+    """이미 있는 행은 is_posted만 합침 (한 번이라도 게시된 URL은 게시된 것으로 유지)"""
+    cols = TABLE_COLS[table] + ["url_hash"] + SCORE_COLS
+    sql = f"""
+        INSERT INTO {table} ({", ".join(cols)})
+        VALUES ({", ".join(["?"] * len(cols))})
+        ON CONFLICT ({", ".join(conflict_cols)})
+        DO UPDATE SET is_posted = MAX(is_posted, excluded.is_posted)
+    """
+    df = df.assign(url_hash=df["url"].map(url_hash))
+    records = df.to_dict(orient="records")
+    # 날짜와 무관한 점수 재료도 함께 저장 (insert_rows와 같은 값)
+    base_cols = TABLE_COLS[table] + ["url_hash"]
+    values = [
+        tuple(row.get(c, "") for c in base_cols) + score
+        for row, score in zip(records, keyword_score_values(table, records))
+    ]
+    with transaction() as conn:
+        conn.executemany(sql, values)
+    return len(values)
+
+
+def _migrate_file(path: str, table: str, conflict_cols: list[str], **extra) -> None:
+    if not os.path.exists(path):
+        return
+    df = _read_legacy_csv(path).assign(**extra)
+    count = _upsert(table, df, conflict_cols)
+    os.replace(path, path + MIGRATED_SUFFIX)
+    logger.info(f"[migrate] {path} → {table}: rows={count}")
+
+
+def migrate_csv_history() -> None:
+    """data.csv와 product/<tag>.csv를 issue/product 테이블로 옮김. 파일이 없으면 아무것도 안 함."""
+    _migrate_file(DATA_PATH, "issue", ["url"])
+    for tag in FILE_TAG_QUERIES_MAP:
+        _migrate_file(
+            os.path.join(PRODUCT_SAVE_PATH, f"{tag}.csv"),
+            "product",
+            ["tag", "url"],
+            tag=tag,
+        )
+
+
+if __name__ == "__main__":
+    from batch.database import init_database
+
+    init_database()
+    migrate_csv_history()
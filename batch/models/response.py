@@ -1,23 +1,130 @@
+import json
 import re
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, ClassVar, Self, get_args
 
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
+from batch.variables import STRICT_DECODE
+
+HTML_TAG = re.compile(r"<.*?>")
+# 여러 문자열을 _SEP로 이어 붙여 한 번에 태그를 지울 때 사용. <.*?>와 같지만 _SEP를 넘지 않음
+_SEP = "\x00"
+_BATCH_HTML_TAG = re.compile(r"<[^\n\x00>]*>")
+_PUB_DATE = re.compile(
+    r"^[A-Z][a-z]{2}, (\d{1,2}) ([A-Z][a-z]{2}) (\d{4}) \d{2}:\d{2}:\d{2} [+-]\d{4}$"
+)
+_MONTHS: dict[str, int] = {
+    m: i + 1
+    for i, m in enumerate(
+        [
+            "Jan",
+            "Feb",
+            "Mar",
+            "Apr",
+            "May",
+            "Jun",
+            "Jul",
+            "Aug",
+            "Sep",
+            "Oct",
+            "Nov",
+            "Dec",
+        ]
+    )
+}
+
 
 def remove_html_tags(text: str) -> str:
-    return re.sub(r"<.*?>", "", text) if text else text
+    return HTML_TAG.sub("", text) if text else text
+
+
+def remove_html_tags_many(texts: list[str]) -> list[str]:
+    """remove_html_tags를 목록 전체에 regex 한 번으로 적용"""
+    if not texts:
+        return texts
+    joined = _SEP.join(texts)
+    if joined.count(_SEP) != len(texts) - 1:  # 본문에 구분자가 있으면 하나씩 처리
+        return [remove_html_tags(t) for t in texts]
+    return _BATCH_HTML_TAG.sub("", joined).split(_SEP)
+
+
+@lru_cache(maxsize=4096)
+def _yyyymmdd(day: str, month: str, year: str) -> str | None:
+    try:
+        return date(int(year), _MONTHS[month], int(day)).strftime("%Y%m%d")
+    except (KeyError, ValueError):
+        return None
+
+
+def normalize_pub_date(value: str) -> str:
+    """
+    "Mon, 02 Jan 2006 15:04:05 +0900" → "20060102".
+    NewsItem.normalize_post_date와 같은 결과를 흔한 표기는 strptime 없이 계산. 형식이 다르면 원본 그대로.
+    """
+    if not value:
+        return value
+    match = _PUB_DATE.match(value)
+    if match is None:  # 한 자리 시각 등 드문 표기는 기존 strptime으로 처리
+        try:
+            return datetime.strptime(value, "%a, %d %b %Y %H:%M:%S %z").strftime(
+                "%Y%m%d"
+            )
+        except ValueError:
+            return value
+    return _yyyymmdd(*match.groups()) or value
 
 
 class AbstractResponse(BaseModel):
-    items: list
-    results: list
+    """
+    검색/데이터랩 응답 공통 모델.
+    decode()는 기본적으로 pydantic 검증 없이 item을 plain dict(model_dump()와 같은 키)로
+    만들고, STRICT_DECODE(디버그 실행)일 때만 모델 검증을 거침.
+    """
+
+    items: list = []
+    results: list = []
+
+    HTML_FIELDS: ClassVar[tuple[str, ...]] = ("title", "description")
+
+    @classmethod
+    def item_model(cls) -> type[BaseModel] | None:
+        args = get_args(cls.model_fields["items"].annotation)
+        return args[0] if args and isinstance(args[0], type) else None
+
+    @classmethod
+    def decode(cls, raw: str | bytes, strict: bool = STRICT_DECODE) -> Self:
+        """응답 본문(JSON)을 모델로 변환. strict=False면 item 검증과 직렬화를 생략."""
+        item_model = cls.item_model()
+        if strict or item_model is None:
+            return cls.model_validate_json(raw)
+
+        data: dict[str, Any] = json.loads(raw)
+        data["items"] = _decode_items(item_model, data.get("items") or [])
+        data.setdefault("results", [])
+        return cls.model_construct(**data)
+
+    def to_payload(self) -> dict[str, Any]:
+        """decode()로 다시 읽을 수 있는 응답 본문 형태의 dict"""
+        payload = self.model_dump(by_alias=True, exclude={"items"})
+        item_model = self.item_model()
+        aliases = (
+            {name: f.alias for name, f in item_model.model_fields.items() if f.alias}
+            if item_model
+            else {}
+        )
+        payload["items"] = [
+            {aliases.get(k, k): v for k, v in _as_record(item).items()}
+            for item in self.items
+        ]
+        return payload
 
     def to_items(self, query: str, scrap_date: str) -> list[dict[str, Any]]:
         if not hasattr(self, "items"):
             raise AttributeError("items not exists.")
         return [
-            {**item.model_dump(), "query": query, "scrap_date": scrap_date}
+            {**_as_record(item), "query": query, "scrap_date": scrap_date}
             for item in self.items
         ]
 
@@ -27,6 +134,32 @@ class AbstractResponse(BaseModel):
         return [result.model_dump() for result in self.results]
 
 
+def _as_record(item: BaseModel | dict[str, Any]) -> dict[str, Any]:
+    return item if isinstance(item, dict) else item.model_dump()
+
+
+def _decode_items(
+    item_model: type[BaseModel], raw_items: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """
+    raw item 목록을 item_model.model_dump()와 같은 키의 dict로 변환.
+    title/description 태그 제거와 pubDate 정규화는 필드별로 목록 전체에 한 번씩 적용.
+    """
+    keys = {name: f.alias or name for name, f in item_model.model_fields.items()}
+    records = [
+        {name: raw.get(key) or "" for name, key in keys.items()} for raw in raw_items
+    ]
+    for name in AbstractResponse.HTML_FIELDS:
+        if name in keys:
+            cleaned = remove_html_tags_many([r[name] for r in records])
+            for record, value in zip(records, cleaned):
+                record[name] = value
+    if "post_date" in keys:
+        for record in records:
+            record["post_date"] = normalize_pub_date(record["post_date"])
+    return records
+
+
 class BaseItem(BaseModel):
     @field_serializer("title", "description", check_fields=False)
     def remove_html(self, value: str) -> str:
@@ -5,6 +5,9 @@ from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 
 from batch.narasarang.prompt import SCORE_INPUT, SCORING_PROMPT
+from batch.packing import score_packed
+from batch.utils import canonical_url
+from batch.variables import LLM_SCORE_CACHE_TTL, LLM_SCORE_PACK_SIZE
 from bot.services.core.openai_client import async_openai_response
 from logger import logger
 
@@ -68,7 +71,7 @@ def dedup_title_url(items: list[dict[str, str | None]]) -> list[dict[str, str |
     for it in items:
         title = it.get("title", "").strip()
         url = it.get("url", "").strip()
-        key = (title, url)
+        key = (title, canonical_url(url))
         if not title or not url:
             continue
         if key in seen:
@@ -106,15 +109,18 @@ def _safe_json_obj(raw: str) -> dict:
     return json.loads(s)
 
 
+def _score_summary(obj: dict) -> tuple[float, str]:
+    score = float(obj.get("score", 0.0))
+    score = max(0.0, min(100.0, score))
+    summary = str(obj.get("summary", "")).strip()
+    if len(summary) > 180:
+        summary = f"{summary[:180]}..."
+    return score, summary
+
+
 def _parse_score_summary(raw: str) -> tuple[float, str]:
     try:
-        obj = _safe_json_obj(raw)
-        score = float(obj.get("score", 0.0))
-        score = max(0.0, min(100.0, score))
-        summary = str(obj.get("summary", "")).strip()
-        if len(summary) > 180:
-            summary = f"{summary[:180]}..."
-        return score, summary
+        return _score_summary(_safe_json_obj(raw))
     except Exception:
         return 0.0, ""
 
@@ -130,6 +136,7 @@ async def _score_one(
             raw = await async_openai_response(
                 prompt=prompt,
                 input=_make_input(it),
+                cache_ttl=LLM_SCORE_CACHE_TTL,
             )
             return _parse_score_summary(raw)
         except Exception as e:
@@ -137,15 +144,49 @@ async def _score_one(
             return 0.0, ""
 
 
+async def _score_packed(
+    items: list[dict[str, str | None]], sem: asyncio.Semaphore, pack_size: int
+) -> list[tuple[float, str]]:
+    """브랜드마다 프롬프트가 다르므로 브랜드별로 묶어 요청"""
+    by_brand: dict[str, list[int]] = {}
+    for i, it in enumerate(items):
+        by_brand.setdefault((it.get("brand") or "").strip(), []).append(i)
+
+    async def _brand(brand: str, idx: list[int]) -> list[tuple[float, str]]:
+        return await score_packed(
+            [_make_input(items[i]) for i in idx],
+            prompt=SCORING_PROMPT.replace("{brand}", brand),
+            keys=("score", "summary"),
+            example='{"id":0,"score":73,"summary":"OO카드의 발급 조건 변경에 대한 후기가 언급되었습니다."}',
+            convert=_score_summary,
+            fallback=lambda k: _score_one(items[idx[k]], sem),
+            semaphore=sem,
+            pack_size=pack_size,
+            cache_ttl=LLM_SCORE_CACHE_TTL,
+        )
+
+    scored: list[tuple[float, str]] = [(0.0, "")] * len(items)
+    groups = list(by_brand.items())
+    parts = await asyncio.gather(*[_brand(brand, idx) for brand, idx in groups])
+    for (_, idx), part in zip(groups, parts):
+        for i, value in zip(idx, part):
+            scored[i] = value
+    return scored
+
+
 async def gpt_rank_sorted(
     items: list[dict[str, str | None]],
     concurrency: int = 5,
+    pack_size: int = LLM_SCORE_PACK_SIZE,
 ) -> list[dict[str, str | None]]:
     if not items:
         return []
 
     sem = asyncio.Semaphore(concurrency)
-    scored = await asyncio.gather(*[_score_one(it, sem) for it in items])
+    if pack_size > 1:
+        scored = await _score_packed(items, sem, pack_size)
+    else:
+        scored = await asyncio.gather(*[_score_one(it, sem) for it in items])
 
     merged: list[dict[str, str | None]] = []
     for it, (score, summary) in zip(items, scored):
@@ -1,10 +1,14 @@
 from datetime import datetime
+from typing import Any
 
 from batch.dml import insert_rows
-from batch.fetch import fetch_data
+from batch.paginate import DatePaginator
+from batch.planner import QueryPlanner
+from batch.scheduler import QueryScheduler
 from logger import logger
 
 TABLE = "narasarang"
+NARASARANG_SOURCES: tuple[str, ...] = ("blog", "news", "cafe")
 
 
 def _normalize_items(
@@ -19,7 +23,7 @@ def _normalize_items(
                 "title": it.get("title", ""),
                 "url": it.get("link", ""),
                 "description": it.get("description", ""),
-                "post_date": it.get("postdate", "") or it.get("pubDate", ""),
+                "post_date": it.get("postdate", "") or it.get("post_date", ""),
                 "scrap_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "source": source_type,
                 "name": "",
@@ -29,31 +33,51 @@ def _normalize_items(
     return rows
 
 
+def build_tasks(
+    queries_by_brand: dict[str, list[str]],
+    display: int = 30,
+    scheduler: QueryScheduler | None = None,
+) -> list[dict[str, Any]]:
+    """QueryPlanner에 등록할 첫 페이지 검색 요청 목록"""
+    paginator = DatePaginator(TABLE, display=display, scheduler=scheduler)
+    return [
+        paginator.first_page_task(t, q)
+        for queries in queries_by_brand.values()
+        for q in queries
+        for t in NARASARANG_SOURCES
+        if paginator.is_due(t, q)
+    ]
+
+
 def collect_load_narasarang_data(
-    queries_by_brand: dict[str, list[str]], display: int = 30
+    queries_by_brand: dict[str, list[str]],
+    display: int = 30,
+    planner: QueryPlanner | None = None,
+    scheduler: QueryScheduler | None = None,
 ) -> None:
     all_rows: list[dict] = []
 
-    for brand, queries in queries_by_brand.items():
-        for q in queries:
-            for t in ("blog", "news", "cafe"):
-                resp = fetch_data(
-                    type=t, query=q, display=display, start=1, sort="date"
-                )
-                if not resp:
-                    continue
-
-                try:
-                    items = [x.model_dump() for x in resp.items]
-                except Exception:
-                    try:
-                        items = list(resp.items)
-                    except Exception:
-                        items = []
-
-                all_rows.extend(
-                    _normalize_items(items, brand=brand, source_type=t, query=q)
-                )
+    targets = [
+        (brand, t, q)
+        for brand, queries in queries_by_brand.items()
+        for q in queries
+        for t in NARASARANG_SOURCES
+    ]
+    paginator = DatePaginator(
+        TABLE, display=display, planner=planner, scheduler=scheduler
+    )
+    pages_by_target = paginator.fetch_many(
+        [{"type": t, "query": q} for _, t, q in targets]
+    )
+
+    for (brand, t, q), resp in (
+        (target, page)
+        for target, pages in zip(targets, pages_by_target)
+        for page in pages
+    ):
+        items = resp.to_items(query=q, scrap_date="")
+        all_rows.extend(_normalize_items(items, brand=brand, source_type=t, query=q))
 
     insert_rows(TABLE, all_rows)
+    paginator.commit()
     logger.info(f"Narasarang Data Collection Completed: rows={len(all_rows)}")
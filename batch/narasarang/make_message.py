@@ -1,9 +1,9 @@
-import re
 from datetime import datetime, timedelta
 from typing import Any
 
-from batch.dml import fetch_df, mark_posted
+from batch.dml import fetch_df, mark_newly_posted
 from batch.fetch import fetch_trend_data
+from batch.matcher import get_matcher
 from batch.narasarang.gpt_rank import (
     dedup_title_url,
     filter_recent_days,
@@ -31,23 +31,8 @@ def _get_title_keywords_for_brand(brand: str) -> list[str]:
 
 
 def _title_has_any_keyword(title: str, keywords: list[str]) -> bool:
-    t = (title or "").strip()
-    if not t:
-        return False
-
-    t_nospace = re.sub(r"\s+", "", t)
-
-    for k in keywords:
-        if not k:
-            continue
-        if k in t:
-            return True
-
-        k_nospace = re.sub(r"\s+", "", k)
-        if k_nospace and k_nospace in t_nospace:
-            return True
-
-    return False
+    """공백을 무시하고 비교 ("나라 사랑카드"도 "나라사랑카드"에 걸림)"""
+    return get_matcher(tuple(keywords), ignore_space=True).has_any(title)
 
 
 def _to_carousel_messages(picked: list[dict[str, Any]]) -> list[list[str]]:
@@ -77,7 +62,10 @@ def _extract_urls(picked: list[dict[str, Any]]) -> list[str]:
     return urls
 
 
-def _load_brand_rows(brand: str) -> list[dict[str, Any]]:
+def _load_brand_rows(brand: str, recent_days: int) -> list[dict[str, Any]]:
+    # post_date는 scrap 시점보다 늦을 수 없으므로 scrap_date 구간으로 먼저 좁힘
+    # (post_date 형식이 소스마다 달라 정확한 구간 필터는 filter_recent_days에서 수행)
+    since = (datetime.today() - timedelta(days=recent_days + 1)).strftime("%Y-%m-%d")
     df = fetch_df(
         TABLE,
         cols=[
@@ -89,15 +77,14 @@ def _load_brand_rows(brand: str) -> list[dict[str, Any]]:
             "source",
             "is_posted",
         ],
+        brand=brand,
+        date_col="scrap_date",
+        since=since,
     )
     if df.empty:
         return []
 
-    sub = df.loc[df["brand"] == brand].copy()
-    if sub.empty:
-        return []
-
-    return sub.to_dict(orient="records")
+    return df.to_dict(orient="records")
 
 
 async def _make_brand_messages(
@@ -105,7 +92,7 @@ async def _make_brand_messages(
     recent_days: int = 7,
     concurrency: int = 5,
 ) -> list[list[str]]:
-    rows = _load_brand_rows(brand)
+    rows = _load_brand_rows(brand, recent_days)
     if not rows:
         logger.info(f"[narasarang] no rows in db for brand={brand}")
         return []
@@ -148,8 +135,10 @@ async def _make_brand_messages(
 
     urls = _extract_urls(ranked)
     if urls:
-        mark_posted(TABLE, urls)
-        logger.info(f"[narasarang] mark_posted: brand={brand}, n={len(urls)}")
+        newly = mark_newly_posted(TABLE, urls)
+        logger.info(
+            f"[narasarang] mark_posted: brand={brand}, n={len(newly)}/{len(urls)}"
+        )
 
     return carousels
 
@@ -0,0 +1,175 @@
+"""
+LLM 점수 매기기에서 글 여러 개를 요청 하나로 묶어 보내는 packed 모드.
+
+지시문(prompt)을 글마다 반복해 보내지 않도록 글 N개를 [id: 번호] 블록으로 묶어 보내고 JSON 배열로 답을 받음.
+배열에서 빠졌거나 형식이 틀린 글만 다시 묶어 요청하고, 그래도 남은 글은 글 하나씩 보내는 기존 경로(fallback)로 처리.
+결과는 묶음이 아니라 글 단위로 llm_cache에 저장하므로 다른 글과 묶여도 다음 실행에서 재사용됨.
+"""
+
+import asyncio
+import json
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from batch.cache import llm_cache
+from bot.services.core.openai_client import (
+    OPENAI_MODEL,
+    async_openai_response,
+    openai_cache_key,
+)
+from logger import logger
+
+T = TypeVar("T")
+
+PACKED_RULE: str = """
+[여러 문서 동시 평가]
+- 입력에는 [id: 번호]로 구분된 문서가 여러 개 있다. 문서마다 위 기준을 따로 적용하라.
+- 위의 출력 형식 대신, 문서마다 객체 하나씩 담은 JSON 배열 한 줄만 출력하라.
+- 각 객체 keys: id, {keys} (id는 입력의 번호 그대로)
+- 모든 id를 빠짐없이 한 번씩 포함하고, 다른 문장/설명/코드펜스는 출력하지 마라.
+- 예: [{example}]
+""".strip()
+
+
+def pack_inputs(inputs: list[str], ids: list[int]) -> str:
+    return "\n\n".join(f"[id: {i}]\n{inputs[i].strip()}" for i in ids)
+
+
+def _load_json(raw: str | None, pattern: str) -> Any:
+    """코드펜스를 벗기고 JSON으로 읽음. 실패하면 pattern에 맞는 첫 부분을 다시 시도"""
+    s = (raw or "").strip()
+    if s.startswith("```"):
+        s = re.sub(r"^```[a-zA-Z]*\s*", "", s)
+        s = re.sub(r"\s*```$", "", s).strip()
+    try:
+        return json.loads(s)
+    except ValueError:
+        m = re.search(pattern, s, re.DOTALL)
+        if not m:
+            return None
+        try:
+            return json.loads(m.group(0))
+        except ValueError:
+            return None
+
+
+def _convert(
+    entry: Any, keys: tuple[str, ...], convert: Callable[[dict[str, Any]], T]
+) -> T | None:
+    """keys가 모두 있는 객체를 convert로 변환, 형식이 틀리면 None"""
+    if not isinstance(entry, dict) or any(k not in entry for k in keys):
+        return None
+    try:
+        return convert(entry)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_packed(
+    raw: str,
+    ids: list[int],
+    keys: tuple[str, ...],
+    convert: Callable[[dict[str, Any]], T],
+) -> dict[int, dict[str, Any]]:
+    """요청한 id 중 keys가 모두 있고 convert가 성공한 항목만 {id: 객체(id 제외)}로 반환"""
+    arr = _load_json(raw, r"\[.*\]")
+    wanted = set(ids)
+    out: dict[int, dict[str, Any]] = {}
+    for entry in arr if isinstance(arr, list) else []:
+        if _convert(entry, ("id", *keys), convert) is None:
+            continue
+        try:
+            i = int(entry["id"])
+        except (TypeError, ValueError):
+            continue
+        if i in wanted and i not in out:
+            out[i] = {k: entry[k] for k in keys}
+    return out
+
+
+async def _request_pack(
+    prompt: str,
+    inputs: list[str],
+    ids: list[int],
+    keys: tuple[str, ...],
+    convert: Callable[[dict[str, Any]], T],
+    semaphore: asyncio.Semaphore,
+    timeout: int,
+) -> dict[int, dict[str, Any]]:
+    async with semaphore:
+        try:
+            raw = await async_openai_response(
+                prompt=prompt, input=pack_inputs(inputs, ids), timeout=timeout
+            )
+        except Exception as e:
+            logger.warning(f"[packing] packed request failed (n={len(ids)}): {e}")
+            return {}
+    return parse_packed(raw, ids, keys, convert)
+
+
+async def score_packed(
+    inputs: list[str],
+    *,
+    prompt: str,
+    keys: tuple[str, ...],
+    example: str,
+    convert: Callable[[dict[str, Any]], T],
+    fallback: Callable[[int], Awaitable[T]],
+    semaphore: asyncio.Semaphore,
+    pack_size: int,
+    cache_ttl: int | None = None,
+    retries: int = 1,
+    timeout: int = 90,
+) -> list[T]:
+    """
+    inputs를 pack_size개씩 묶어 점수를 매기고 inputs 순서대로 결과를 반환.
+    - prompt: 글 하나씩 보낼 때의 지시문. fallback도 같은 (prompt, input)으로 요청해야 캐시를 공유
+    - keys: 글마다 받아야 하는 JSON key (id 제외), example: 객체 하나의 예시
+    - convert: 객체 하나를 결과로 변환. 값이 틀리면 ValueError/TypeError
+    - cache_ttl: 주면 글마다 (prompt, input) 키로 캐시를 먼저 찾고, 묶음 응답도 글 단위로 저장
+    - retries: 빠진 글만 다시 묶어 보내는 횟수. 그래도 남으면 fallback(index)
+    """
+    results: dict[int, T] = {}
+    pending: list[int] = []
+    for i, text in enumerate(inputs):
+        cached = None
+        if cache_ttl is not None:
+            cached = llm_cache.get(openai_cache_key(prompt, text), ttl=cache_ttl)
+        value = _convert(_load_json(cached, r"\{.*\}"), keys, convert)
+        if value is None:
+            pending.append(i)
+        else:
+            results[i] = value
+
+    packed_prompt = f"{prompt.strip()}\n\n" + PACKED_RULE.format(
+        keys=", ".join(keys), example=example
+    )
+    for _ in range(1 + retries):
+        if not pending:
+            break
+        chunks = [pending[k : k + pack_size] for k in range(0, len(pending), pack_size)]
+        parsed = await asyncio.gather(
+            *[
+                _request_pack(
+                    packed_prompt, inputs, chunk, keys, convert, semaphore, timeout
+                )
+                for chunk in chunks
+            ]
+        )
+        for part in parsed:
+            for i, obj in part.items():
+                results[i] = convert(obj)
+                if cache_ttl is not None:
+                    llm_cache.set(
+                        openai_cache_key(prompt, inputs[i]),
+                        json.dumps(obj, ensure_ascii=False),
+                        endpoint=OPENAI_MODEL,
+                    )
+        pending = [i for i in pending if i not in results]
+
+    if pending:
+        logger.warning(f"[packing] per-item fallback: {len(pending)}/{len(inputs)}")
+        for i, value in zip(pending, await asyncio.gather(*map(fallback, pending))):
+            results[i] = value
+    return [results[i] for i in range(len(inputs))]
@@ -0,0 +1,194 @@
+import asyncio
+from collections.abc import Iterator
+
+from batch.dml import existing_urls, get_watermark, set_watermarks
+from batch.fetch import AsyncFetcher, fetch_data
+from batch.models.response import (
+    AbstractResponse,
+    BlogResponse,
+    CafeResponse,
+    NewsResponse,
+)
+from batch.planner import QueryPlanner
+from batch.scheduler import QueryScheduler
+from logger import logger
+
+API_MAX_START: int = 1000  # 검색 API start 최댓값
+
+
+class DatePaginator:
+    """
+    sort="date" 검색 결과를 start=1, 1+display, ... 순서로 넘기면서
+    이미 테이블에 있는 URL(또는 워터마크)을 만나면 멈추는 증분 수집기.
+    - 워터마크는 (table, source, query)별 가장 최신 URL
+    - 워터마크는 commit()을 호출해야 저장되므로 insert 이후에 호출할 것
+    - 중간 페이지에서 실패한 검색어는 워터마크를 옮기지 않음 (다음 실행에서 다시 넘김)
+    - planner가 있으면 첫 페이지는 QueryPlanner가 미리 받아둔 결과를 사용
+    - scheduler가 있으면 수집 주기가 아닌 검색어는 건너뛰고 검색어별 새 URL 수를 기록
+    """
+
+    def __init__(
+        self,
+        table: str,
+        display: int = 100,
+        max_start: int = API_MAX_START,
+        planner: QueryPlanner | None = None,
+        scheduler: QueryScheduler | None = None,
+    ):
+        self.table = table
+        self.display = display
+        self.max_start = max_start
+        self.planner = planner
+        self.scheduler = scheduler
+        self._marks: dict[tuple[str, str], str] = {}
+        self._failed: set[tuple[str, str]] = set()
+
+    def is_due(self, type: str, query: str) -> bool:
+        if self.scheduler is None:
+            return True
+        return bool(self.scheduler.due(self.table, type, [query]))
+
+    def first_page_task(self, type: str, query: str) -> dict[str, str | int]:
+        """QueryPlanner에 등록할 첫 페이지 요청"""
+        return {
+            "type": type,
+            "query": query,
+            "display": self.display,
+            "start": 1,
+            "sort": "date",
+        }
+
+    def _planned(
+        self, type: str, query: str, start: int
+    ) -> tuple[bool, AbstractResponse | None]:
+        if self.planner is None or start != 1:
+            return False, None
+        return self.planner.lookup(self.first_page_task(type, query))
+
+    def _cut(self, items: list, watermark: str | None) -> int:
+        """이미 수집한 첫 아이템 위치. 없으면 len(items)"""
+        urls = [(_item_url(it) or "").strip() for it in items]
+        known = existing_urls(self.table, urls)
+        for i, url in enumerate(urls):
+            if url and (url == watermark or url in known):
+                return i
+        return len(items)
+
+    def _walk(
+        self, type: str, query: str, response: AbstractResponse | None, start: int
+    ) -> tuple[AbstractResponse | None, bool]:
+        """페이지 하나를 잘라서 돌려주고, 다음 페이지가 필요한지 판단."""
+        if response is None:
+            logger.error(
+                f"[paginate] fetch failed: table={self.table}, type={type}, query={query}, start={start}"
+            )
+            self._failed.add((type, query))
+            return None, False
+
+        items = list(response.items)
+        if start == 1 and items:
+            newest = (_item_url(items[0]) or "").strip()
+            if newest:
+                self._marks[(type, query)] = newest
+
+        cut = self._cut(items, get_watermark(self.table, type, query))
+        if cut < len(items):
+            return response.model_copy(update={"items": items[:cut]}), False
+
+        if not isinstance(response, (BlogResponse, CafeResponse, NewsResponse)):
+            return response, False
+        has_next = len(items) >= self.display and start + self.display <= min(
+            response.total, self.max_start
+        )
+        return response, has_next
+
+    def iter_pages(self, type: str, query: str) -> Iterator[AbstractResponse]:
+        """fetch_data 기반 동기 iterator. 새로 수집된 아이템만 담긴 페이지를 yield."""
+        start = 1
+        while start <= self.max_start:
+            found, response = self._planned(type, query, start)
+            if not found:
+                response = fetch_data(
+                    type=type,
+                    query=query,
+                    display=self.display,
+                    start=start,
+                    sort="date",
+                )
+            page, has_next = self._walk(type, query, response, start)
+            if page is not None and page.items:
+                yield page
+            if not has_next:
+                return
+            start += self.display
+
+    async def _pages(
+        self, fetcher: AsyncFetcher, type: str, query: str
+    ) -> list[AbstractResponse]:
+        pages: list[AbstractResponse] = []
+        start = 1
+        while start <= self.max_start:
+            found, response = self._planned(type, query, start)
+            if not found:
+                response = await fetcher.fetch(
+                    type=type,
+                    query=query,
+                    display=self.display,
+                    start=start,
+                    sort="date",
+                )
+            page, has_next = self._walk(type, query, response, start)
+            if page is not None and page.items:
+                pages.append(page)
+            if not has_next:
+                break
+            start += self.display
+        return pages
+
+    def fetch_many(self, tasks: list[dict[str, str]]) -> list[list[AbstractResponse]]:
+        """
+        {"type", "query"} 목록을 동시에 수집. 검색어 하나의 페이지는 순서대로 넘기고,
+        검색어끼리는 AsyncFetcher의 동시성/rate limit을 공유.
+        수집 주기가 아닌 검색어는 호출하지 않고 빈 목록을 돌려줌.
+        """
+        if not tasks:
+            return []
+        due = [t for t in tasks if self.is_due(t["type"], t["query"])]
+
+        async def _run() -> list[list[AbstractResponse]]:
+            async with AsyncFetcher() as fetcher:
+                return await asyncio.gather(
+                    *[self._pages(fetcher, t["type"], t["query"]) for t in due]
+                )
+
+        fetched = asyncio.run(_run()) if due else []
+        by_task = {(t["type"], t["query"]): r for t, r in zip(due, fetched)}
+        results = [by_task.get((t["type"], t["query"]), []) for t in tasks]
+        self._record(by_task)
+
+        pages = sum(len(r) for r in fetched)
+        logger.info(
+            f"[paginate] table={self.table}, queries={len(due)}/{len(tasks)}, pages_with_new={pages}"
+        )
+        return results
+
+    def _record(self, by_task: dict[tuple[str, str], list[AbstractResponse]]) -> None:
+        if self.scheduler is None:
+            return
+        for (type, query), pages in by_task.items():
+            if (type, query) in self._failed:
+                continue
+            new_count = sum(len(page.items) for page in pages)
+            self.scheduler.record(self.table, type, query, new_count)
+
+    def commit(self) -> None:
+        marks = {k: v for k, v in self._marks.items() if k not in self._failed}
+        set_watermarks(self.table, marks)
+        self._marks = {}
+        self._failed = set()
+
+
+def _item_url(item) -> str | None:
+    if isinstance(item, dict):
+        return item.get("link") or item.get("url")
+    return getattr(item, "link", None)
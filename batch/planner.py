@@ -0,0 +1,123 @@
+from collections import defaultdict
+from typing import Any
+
+from batch.fetch import fetch_many
+from batch.models.response import AbstractResponse
+from batch.quota import api_quota
+from logger import logger
+
+PlanKey = tuple[str, str, str, int]  # (type, query, sort, start)
+
+
+def _normalize(task: dict[str, Any]) -> dict[str, Any]:
+    """fetch_data 기본값을 채운 요청"""
+    return {
+        "type": task["type"],
+        "query": task["query"],
+        "display": int(task.get("display", 10)),
+        "start": int(task.get("start", 1)),
+        "sort": task.get("sort", "sim"),
+    }
+
+
+def _key(task: dict[str, Any]) -> PlanKey:
+    return (task["type"], task["query"], task["sort"], task["start"])
+
+
+def _slice(response: AbstractResponse | None, display: int) -> AbstractResponse | None:
+    if response is None or len(response.items) <= display:
+        return response
+    return response.model_copy(
+        update={"items": response.items[:display], "display": display}
+    )
+
+
+class QueryPlanner:
+    """
+    한 배치 안에서 여러 수집기가 보내는 검색 요청을 미리 모아 중복을 제거.
+    - (type, query, sort, start)가 같은 요청은 display가 가장 큰 요청 하나로 합쳐 한 번만 호출
+    - 결과는 각 수집기가 요청한 display만큼 잘라서 돌려주므로 수집기별 정규화 로직은 그대로 사용
+    - 계획에 없던 요청은 fetch_many로 바로 호출
+    - 합쳐진 요청의 호출량은 등록한 수집기 중 우선순위가 가장 높은 수집기 몫으로 기록
+    """
+
+    def __init__(self):
+        self._displays: dict[PlanKey, int] = {}
+        self._owners: dict[PlanKey, str] = {}
+        self._consumers: dict[str, int] = defaultdict(int)
+        self._responses: dict[PlanKey, AbstractResponse | None] = {}
+        self.requested = 0
+        self.unplanned = 0
+
+    def add(self, consumer: str, tasks: list[dict[str, Any]]) -> None:
+        for task in map(_normalize, tasks):
+            key = _key(task)
+            self._displays[key] = max(self._displays.get(key, 0), task["display"])
+            owner = self._owners.get(key)
+            if owner is None or api_quota.priority(consumer) < api_quota.priority(
+                owner
+            ):
+                self._owners[key] = consumer
+        self._consumers[consumer] += len(tasks)
+        self.requested += len(tasks)
+
+    def execute(self) -> None:
+        pending: dict[str, list[PlanKey]] = defaultdict(list)
+        for key in self._displays:
+            if key not in self._responses:
+                pending[self._owners[key]].append(key)
+
+        # 우선순위가 높은 수집기의 요청부터 호출해 quota가 부족하면 낮은 쪽이 밀려나도록 함
+        for owner in sorted(pending, key=api_quota.priority):
+            keys = pending[owner]
+            with api_quota.track(owner):
+                results = fetch_many(
+                    [
+                        {
+                            "type": type,
+                            "query": query,
+                            "display": self._displays[(type, query, sort, start)],
+                            "start": start,
+                            "sort": sort,
+                        }
+                        for type, query, sort, start in keys
+                    ]
+                )
+            self._responses.update(zip(keys, results))
+        logger.info(f"[planner] executed: {self.stats()}")
+
+    def lookup(self, task: dict[str, Any]) -> tuple[bool, AbstractResponse | None]:
+        """(계획에 있었는지, 응답). 계획된 display보다 큰 요청은 계획에 없는 것으로 취급."""
+        task = _normalize(task)
+        key = _key(task)
+        if key not in self._responses or self._displays[key] < task["display"]:
+            return False, None
+        return True, _slice(self._responses[key], task["display"])
+
+    def fetch_many(self, tasks: list[dict[str, Any]]) -> list[AbstractResponse | None]:
+        """fetch_many와 같은 인터페이스. 계획된 요청은 저장된 결과를 사용."""
+        results: list[AbstractResponse | None] = [None] * len(tasks)
+        missing: list[int] = []
+        for i, task in enumerate(tasks):
+            found, response = self.lookup(task)
+            if found:
+                results[i] = response
+            else:
+                missing.append(i)
+
+        if missing:
+            self.unplanned += len(missing)
+            fetched = fetch_many([tasks[i] for i in missing])
+            for i, response in zip(missing, fetched):
+                results[i] = response
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        unique = len(self._displays)
+        return {
+            "requested": self.requested,
+            "unique": unique,
+            "saved": self.requested - unique,
+            "unplanned": self.unplanned,
+            "by_consumer": dict(self._consumers),
+        }
@@ -1,11 +1,12 @@
-import os
 from datetime import datetime
-from time import sleep
+from typing import Any
 
 import pandas as pd
 from tqdm import tqdm
 
-from batch.fetch import fetch_data
+from batch.dml import existing_urls, insert_rows
+from batch.fetch import fetch_many
+from batch.planner import QueryPlanner
 from batch.product.keywords import (
     CREDIT_CARD_KEYWORDS,
     DEBIT_CARD_KEYWORDS,
@@ -13,10 +14,13 @@ from batch.product.keywords import (
     WONDER_CARD_FEEDBACK_KEYWORDS,
 )
 from batch.product.select_column import SOURCES_SELECT_MAP
-from batch.utils import read_csv
-from batch.variables import PRODUCT_SAVE_PATH
+from batch.scheduler import QueryScheduler
+from batch.utils import url_hash
 from logger import logger
 
+COLLECTOR = "product"
+TABLE = "product"
+
 FILE_TAG_QUERIES_MAP: dict[str, list[str]] = {
     "credit": CREDIT_CARD_KEYWORDS,
     "debit": DEBIT_CARD_KEYWORDS,
@@ -32,50 +36,97 @@ FILE_TAG_SOURCES_MAP: dict[str, list[str]] = {
 }
 
 
-def collect_load_product_issues(file_tag: str) -> None:
+def _source_tasks(source: str, queries: list[str]) -> list[dict[str, Any]]:
+    return [
+        {"type": source, "query": keyword, "display": 100, "sort": "sim"}
+        for keyword in queries
+    ]
+
+
+def _due_queries(
+    scheduler: QueryScheduler | None, source: str, queries: list[str]
+) -> list[str]:
+    return scheduler.due(COLLECTOR, source, queries) if scheduler else queries
+
+
+def build_tasks(
+    file_tag: str, scheduler: QueryScheduler | None = None
+) -> list[dict[str, Any]]:
+    """QueryPlanner에 등록할 검색 요청 목록"""
+    queries = FILE_TAG_QUERIES_MAP[file_tag]
+    return [
+        task
+        for source in FILE_TAG_SOURCES_MAP[file_tag]
+        for task in _source_tasks(source, _due_queries(scheduler, source, queries))
+    ]
+
+
+def new_url_counts(
+    fetched: dict[str, list[str]], known_links: set[str]
+) -> dict[str, int]:
+    """
+    검색어별 새 URL 수. insert_rows처럼 정규화 URL(url_hash) 기준으로 세고,
+    이미 저장된 URL과 앞선 검색어가 먼저 가져온 URL은 새 글로 세지 않음.
+    """
+    seen = {url_hash(link) for link in known_links}
+    counts: dict[str, int] = {}
+    for keyword, links in fetched.items():
+        counts[keyword] = 0
+        for link in filter(None, (link.strip() for link in links)):
+            h = url_hash(link)
+            if h not in seen:
+                seen.add(h)
+                counts[keyword] += 1
+    return counts
+
+
+def collect_load_product_issues(
+    file_tag: str,
+    planner: QueryPlanner | None = None,
+    scheduler: QueryScheduler | None = None,
+) -> None:
     """
     경쟁사(credit/debit) 또는 자사(wonder/jade) 상품 이슈 데이터를 로드하고 처리합니다.
     - credit/debit: news 소스만 사용
     - wonder/jade: news 및 blog 소스 모두 사용
+    scheduler가 있으면 insert 전에 검색어별 새 URL 수를 기록.
     """
-    os.makedirs(PRODUCT_SAVE_PATH, exist_ok=True)
+    fetch = planner.fetch_many if planner else fetch_many
 
-    final_file_name = os.path.join(PRODUCT_SAVE_PATH, f"{file_tag}.csv")
-
-    _df_list: list[pd.DataFrame] = [read_csv(final_file_name)]
-    sources_to_fetch = FILE_TAG_SOURCES_MAP[file_tag]
-    for source in sources_to_fetch:
-        source_file_path = os.path.join(PRODUCT_SAVE_PATH, f"{source}_{file_tag}.csv")
-        existing_data = read_csv(source_file_path)
+    for source in FILE_TAG_SOURCES_MAP[file_tag]:
         items: list[dict[str, str]] = []
-        for keyword in tqdm(FILE_TAG_QUERIES_MAP[file_tag], desc=source, leave=False):
-            result = fetch_data(source, keyword, display=100, sort="sim")
-            sleep(0.1)
-
+        # 검색어별 수집 link (검색어 순서 = insert 순서)
+        fetched: dict[str, list[str]] = {}
+        queries = _due_queries(scheduler, source, FILE_TAG_QUERIES_MAP[file_tag])
+        results = fetch(_source_tasks(source, queries))
+        for keyword, result in tqdm(
+            zip(queries, results), desc=source, leave=False, total=len(queries)
+        ):
             if result is None:
                 logger.error(f"Failed to fetch data for {keyword} from {source}")
                 continue
-            items.extend(
-                result.to_items(
-                    query=keyword, scrap_date=datetime.today().strftime("%Y%m%d")
-                )
+            _items = result.to_items(
+                query=keyword, scrap_date=datetime.today().strftime("%Y%m%d")
+            )
+            items.extend(_items)
+            fetched[keyword] = [it["link"] or "" for it in _items]
+
+        if scheduler:
+            known_links = existing_urls(
+                TABLE, [it["link"] for it in items], where={"tag": file_tag}
+            )
+            for keyword, count in new_url_counts(fetched, known_links).items():
+                scheduler.record(COLLECTOR, source, keyword, count)
+
+        if not items:
+            continue
+        df = (
+            SOURCES_SELECT_MAP[source](
+                pd.DataFrame(items).assign(source=source, is_posted=0)
             )
+            .rename(columns={"link": "url"})
+            .assign(tag=file_tag)
+        )
+        insert_rows(TABLE, df.to_dict(orient="records"))
 
-        df_new = pd.DataFrame(items).assign(source=source, is_posted=0)
-        df = pd.concat(
-            [existing_data, df_new],
-            ignore_index=True,
-        ).drop_duplicates(subset=["link"])
-        df.to_csv(source_file_path, index=False, encoding="utf-8")
-        _df_list.append(SOURCES_SELECT_MAP[source](df))
-
-    data = (
-        pd.concat(_df_list, ignore_index=True)
-        .sort_values(
-            by=["is_posted", "scrap_date"], ascending=[False, True]
-        )  # is_posted가 1인 경우, scrap_date 가 오래된 것을 남김
-        .drop_duplicates(subset="link", keep="first")  # link 기준으로 중복 제거
-    )
-
-    data.to_csv(final_file_name, index=False, encoding="utf-8")
-    logger.info(f"{final_file_name} scrap completed")
+    logger.info(f"product scrap completed: tag={file_tag}")
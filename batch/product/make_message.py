@@ -1,9 +1,11 @@
 import json
-import os
 from datetime import datetime, timedelta
 
 import pandas as pd
 
+from batch.dedup import collapse_near_duplicates, expand_cluster_urls
+from batch.dml import COMMON_COLS, fetch_df, mark_posted
+from batch.matcher import get_matcher
 from batch.product.keywords import BUTTON_TAG_MAP, CARD_COMPANIES, KEYWORDS_BY_BUTTON
 from batch.product.prompt import (
     OTHER_PROMPT,
@@ -11,15 +13,14 @@ from batch.product.prompt import (
     US_PROMPT,
     US_TEXT_INPUT,
 )
-from batch.scorer import extract_high_score_data
-from batch.utils import extract_urls, read_csv
-from batch.variables import (
-    EXTRACTED_DATA_COUNT,
-    PRODUCT_SAVE_PATH,
-)
+from batch.scorer import SCORE_COLS, extract_high_score_data
+from batch.utils import extract_urls
+from batch.variables import EXTRACTED_DATA_COUNT, LLM_MESSAGE_CACHE_TTL
 from bot.services.core.openai_client import async_openai_response
 from logger import logger
 
+TABLE = "product"
+
 
 async def process_generate_message(
     button_label: str,
@@ -29,9 +30,9 @@ async def process_generate_message(
         tag = BUTTON_TAG_MAP[button_label]
         is_our_product: bool = button_label in ["원더카드 고객반응", "JADE 고객반응"]
         extracted_data_count = 12 if is_our_product else EXTRACTED_DATA_COUNT
-        file_name = os.path.join(PRODUCT_SAVE_PATH, f"{tag}.csv")
-        data = read_csv(file_name)
-        data = _filter_last_n_days_postdate(data, 7)
+        data = _load_product_data(tag, 7)
+        if not data.empty:
+            data = _filter_last_n_days_postdate(data, 7)
 
         if data.empty:
             logger.warning("No data after 7-day postdate filter.")
@@ -48,6 +49,7 @@ async def process_generate_message(
             return [
                 f"오늘은 {button_label} 관련 주목할만한 이슈가 없어요! 다음에 더 좋은 이슈로 찾아올게요 😊"
             ]
+        refined_data = collapse_near_duplicates(refined_data, url_col="link")
         refined_data["companies"] = refined_data.apply(
             lambda r: _identify_companies(
                 f"{r.get('title', '')} {r.get('description', '')}"
@@ -55,7 +57,7 @@ async def process_generate_message(
             axis=1,
         )
         data_records = refined_data[
-            ["companies", "title", "link", "description"]
+            ["companies", "title", "link", "description", "cluster_size"]
         ].to_dict(orient="records")  # type: ignore[assignment]
         content = json.dumps(
             data_records,
@@ -89,11 +91,16 @@ async def process_generate_message(
         )
 
         result = await async_openai_response(
-            prompt=US_PROMPT if is_our_product else OTHER_PROMPT, input=text_input
+            prompt=US_PROMPT if is_our_product else OTHER_PROMPT,
+            input=text_input,
+            cache_ttl=LLM_MESSAGE_CACHE_TTL,
         )
         urls = extract_urls(result)
-        data.loc[data["link"].isin(urls), "is_posted"] = 1
-        data.to_csv(file_name, index=False, encoding="utf-8")
+        mark_posted(
+            TABLE,
+            expand_cluster_urls(refined_data, urls, "link"),
+            where={"tag": tag},
+        )
         return [f"[{button_label}]\n{header}\n{result}"]
     except Exception as e:
         logger.error(f"Error in process_generate_message for {button_label}: {e}")
@@ -102,8 +109,17 @@ async def process_generate_message(
         ]
 
 
+def _load_product_data(tag: str, days: int = 7) -> pd.DataFrame:
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+    data = fetch_df(
+        TABLE, ["tag"] + COMMON_COLS + SCORE_COLS, where={"tag": tag}, since=since
+    )
+    return data.rename(columns={"url": "link"})
+
+
 def _identify_companies(text: str) -> list[str]:
-    return [company for company in CARD_COMPANIES if company in text]
+    hits = get_matcher(tuple(CARD_COMPANIES)).hits(text)
+    return [company for company in CARD_COMPANIES if company in hits]
 
 
 def _filter_last_n_days_postdate(df: pd.DataFrame, days: int = 7) -> pd.DataFrame:
@@ -0,0 +1,195 @@
+from collections import defaultdict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any
+
+from batch.database import get_connection, transaction
+from batch.variables import (
+    COLLECTOR_DAILY_BUDGET,
+    COLLECTOR_PRIORITY,
+    NAVER_DAILY_QUOTAS,
+)
+from logger import logger
+
+DEFAULT_COLLECTOR: str = "etc"
+LOWEST_PRIORITY: int = max(COLLECTOR_PRIORITY.values(), default=0) + 1
+
+_current_collector: ContextVar[str] = ContextVar(
+    "current_collector", default=DEFAULT_COLLECTOR
+)
+
+
+def endpoint_name(url: str) -> str:
+    """https://openapi.naver.com/v1/search/blog.json → search/blog.json"""
+    return url.split("/v1/", 1)[-1]
+
+
+def endpoint_group(endpoint: str) -> str:
+    """일일 한도가 따로 잡히는 API 묶음 (search, datalab)"""
+    return endpoint.split("/", 1)[0]
+
+
+class QuotaLedger:
+    """
+    네이버 OpenAPI 키 하나를 공유하는 수집기들의 일일 호출량 장부.
+    - api_usage 테이블에 (day, collector, endpoint)별 호출 수를 누적
+    - 수집기마다 일일 budget과 priority(작을수록 우선)가 있고,
+      우선순위가 높은 수집기의 남은 budget은 낮은 수집기가 쓰지 못하도록 예약
+    - 한도에 걸린 호출은 네트워크로 나가지 않고 fetch 계층에서 실패(None)로 처리
+    - 캐시 적중은 호출로 세지 않음
+    - 날짜가 바뀌면 장부를 새 날짜로 넘기고, RELOAD_EVERY마다 다른 프로세스(배치/봇)의
+      호출을 반영하도록 api_usage를 다시 읽음 (callback 서버처럼 오래 떠 있는 프로세스)
+    """
+
+    FLUSH_EVERY: int = 100  # charge 호출 n번마다 장부 저장
+    RELOAD_EVERY: timedelta = timedelta(minutes=5)
+
+    def __init__(
+        self,
+        quotas: dict[str, int] = NAVER_DAILY_QUOTAS,
+        budgets: dict[str, int] = COLLECTOR_DAILY_BUDGET,
+        priorities: dict[str, int] = COLLECTOR_PRIORITY,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self.quotas = quotas
+        self.budgets = budgets
+        self.priorities = priorities
+        self.clock = clock
+        self.day = clock().strftime("%Y%m%d")
+        self._used: dict[tuple[str, str], int] | None = None  # (collector, endpoint)
+        self._loaded_at: datetime | None = None
+        self._pending: dict[tuple[str, str], int] = defaultdict(int)
+        self._run_calls: dict[str, int] = defaultdict(int)
+        self._denied: dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    @contextmanager
+    def track(collector: str) -> Generator[None, None, None]:
+        """이 블록 안의 호출을 collector 몫으로 기록"""
+        token = _current_collector.set(collector)
+        try:
+            yield
+        finally:
+            _current_collector.reset(token)
+
+    @staticmethod
+    def current() -> str:
+        return _current_collector.get()
+
+    def priority(self, collector: str) -> int:
+        return self.priorities.get(collector, LOWEST_PRIORITY)
+
+    def _sync(self) -> None:
+        """날짜가 바뀌었거나 장부를 읽은 지 RELOAD_EVERY가 지났으면 저장 후 다시 읽도록 비움"""
+        now = self.clock()
+        day = now.strftime("%Y%m%d")
+        if day != self.day:
+            self.flush()  # 어제 호출은 어제 날짜로 저장
+            self.day = day
+            self._used = None
+            self._denied = defaultdict(int)
+        elif self._loaded_at is not None and now - self._loaded_at >= self.RELOAD_EVERY:
+            self.flush()
+            self._used = None
+
+    def _load(self) -> dict[tuple[str, str], int]:
+        if self._used is None:
+            sql = "SELECT collector, endpoint, calls FROM api_usage WHERE day = ?"
+            self._used = defaultdict(int)
+            self._loaded_at = self.clock()
+            for collector, endpoint, calls in get_connection().execute(
+                sql, (self.day,)
+            ):
+                self._used[(collector, endpoint)] = calls
+        return self._used
+
+    def used(self, collector: str | None = None, group: str | None = None) -> int:
+        return sum(
+            calls
+            for (c, endpoint), calls in self._load().items()
+            if (collector is None or c == collector)
+            and (group is None or endpoint_group(endpoint) == group)
+        )
+
+    def _reserved(self, collector: str, group: str) -> int:
+        """collector보다 우선순위가 높은 수집기들의 남은 budget 합"""
+        priority = self.priority(collector)
+        return sum(
+            max(0, budget - self.used(other, group))
+            for other, budget in self.budgets.items()
+            if other != collector and self.priority(other) < priority
+        )
+
+    def allow(self, url: str) -> bool:
+        self._sync()
+        collector = self.current()
+        endpoint = endpoint_name(url)
+        group = endpoint_group(endpoint)
+        quota = self.quotas.get(group)
+        if quota is None:
+            return True
+
+        budget = self.budgets.get(collector)
+        if group == "search" and budget is not None:
+            if self.used(collector, group) >= budget:
+                self._deny(collector, endpoint, "budget exhausted")
+                return False
+        reserved = self._reserved(collector, group) if group == "search" else 0
+        if self.used(group=group) + 1 + reserved > quota:
+            self._deny(collector, endpoint, "quota reserved for higher priority")
+            return False
+        return True
+
+    def _deny(self, collector: str, endpoint: str, reason: str) -> None:
+        if self._denied[collector] == 0:
+            logger.warning(
+                f"[quota] skipping calls: collector={collector}, endpoint={endpoint}, reason={reason}"
+            )
+        self._denied[collector] += 1
+
+    def charge(self, url: str) -> None:
+        self._sync()
+        key = (self.current(), endpoint_name(url))
+        self._load()[key] += 1
+        self._pending[key] += 1
+        self._run_calls[key[0]] += 1
+        if sum(self._pending.values()) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        sql = """
+            INSERT INTO api_usage (day, collector, endpoint, calls)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (day, collector, endpoint)
+            DO UPDATE SET calls = calls + excluded.calls
+        """
+        values = [
+            (self.day, collector, endpoint, calls)
+            for (collector, endpoint), calls in self._pending.items()
+        ]
+        with transaction() as conn:
+            conn.executemany(sql, values)
+        self._pending = defaultdict(int)
+
+    def summary(self) -> dict[str, Any]:
+        """수집기별 이번 실행 호출 수, 오늘 누적 호출 수, budget, 건너뛴 호출 수"""
+        collectors = sorted(
+            {c for c, _ in self._load()} | set(self._denied),
+            key=lambda c: (self.priority(c), c),
+        )
+        return {
+            collector: {
+                "run": self._run_calls.get(collector, 0),
+                "today": self.used(collector),
+                "budget": self.budgets.get(collector),
+                "skipped": self._denied.get(collector, 0),
+            }
+            for collector in collectors
+        }
+
+
+api_quota = QuotaLedger()
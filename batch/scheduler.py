@@ -0,0 +1,128 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any
+
+from batch.database import get_connection, transaction
+from batch.variables import YIELD_MAX_STALENESS_DAYS
+
+TIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+# 배치 시작 시각이 조금씩 달라도 같은 주기로 취급
+SCHEDULE_SLACK: timedelta = timedelta(hours=2)
+
+YieldKey = tuple[str, str, str]  # (collector, source, query)
+
+
+def backoff_interval(misses: int, max_staleness_days: int) -> timedelta:
+    """
+    연속으로 새 URL이 없었던 횟수에 따른 다음 수집까지의 간격.
+    0회 → 매번, 1회 → 1일, 2회 → 2일, 3회 → 4일 ... 최대 max_staleness_days일.
+    """
+    if misses <= 0:
+        return timedelta(0)
+    return timedelta(days=min(2 ** (misses - 1), max_staleness_days))
+
+
+class QueryScheduler:
+    """
+    (collector, source, query)별 수집 수율을 query_yield 테이블에 기록하고,
+    새 URL이 계속 나오지 않는 검색어는 지수적으로 수집 간격을 늘림.
+    - 직전 수집에서 새 URL이 나온 검색어는 매번 수집
+    - 아무리 수율이 낮아도 max_staleness_days일에 한 번은 수집
+    - record()로 모은 결과는 commit()을 호출해야 저장되므로 insert 이후에 호출할 것
+    """
+
+    def __init__(
+        self,
+        max_staleness_days: int = YIELD_MAX_STALENESS_DAYS,
+        now: datetime | None = None,
+    ):
+        self.max_staleness_days = max_staleness_days
+        self.now = now or datetime.now()
+        self._history: dict[YieldKey, tuple[int, str]] | None = None
+        self._records: dict[YieldKey, int] = {}
+        self._scheduled: dict[str, set[tuple[str, str]]] = defaultdict(set)
+        self._skipped: dict[str, set[tuple[str, str]]] = defaultdict(set)
+
+    def _load(self) -> dict[YieldKey, tuple[int, str]]:
+        if self._history is None:
+            sql = """
+                SELECT collector, source, query, misses, last_fetched_at
+                FROM query_yield
+            """
+            self._history = {
+                (collector, source, query): (misses, last_fetched_at)
+                for collector, source, query, misses, last_fetched_at in get_connection().execute(
+                    sql
+                )
+            }
+        return self._history
+
+    def is_due(self, collector: str, source: str, query: str) -> bool:
+        history = self._load().get((collector, source, query))
+        if history is None:
+            return True
+        misses, last_fetched_at = history
+        elapsed = self.now - datetime.strptime(last_fetched_at, TIME_FORMAT)
+        interval = backoff_interval(misses, self.max_staleness_days)
+        return elapsed + SCHEDULE_SLACK >= interval
+
+    def due(self, collector: str, source: str, queries: list[str]) -> list[str]:
+        """이번 실행에서 수집할 검색어만 순서를 유지해서 반환"""
+        due: list[str] = []
+        for q in queries:
+            if self.is_due(collector, source, q):
+                due.append(q)
+                self._scheduled[collector].add((source, q))
+            else:
+                self._skipped[collector].add((source, q))
+        return due
+
+    def record(self, collector: str, source: str, query: str, new_count: int) -> None:
+        """수집에 성공한 검색어의 새 URL 개수 (실패한 호출은 기록하지 않음)"""
+        key = (collector, source, query)
+        self._records[key] = self._records.get(key, 0) + new_count
+
+    def commit(self) -> None:
+        if not self._records:
+            return
+        now = self.now.strftime(TIME_FORMAT)
+        sql = """
+            INSERT INTO query_yield (
+                collector, source, query, fetches, new_urls, last_new_count,
+                misses, last_fetched_at, last_new_at
+            )
+            VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)
+            ON CONFLICT (collector, source, query) DO UPDATE SET
+                fetches = fetches + 1,
+                new_urls = new_urls + excluded.new_urls,
+                last_new_count = excluded.last_new_count,
+                misses = CASE WHEN excluded.last_new_count > 0 THEN 0 ELSE misses + 1 END,
+                last_fetched_at = excluded.last_fetched_at,
+                last_new_at = COALESCE(excluded.last_new_at, last_new_at)
+        """
+        values = [
+            (
+                collector,
+                source,
+                query,
+                new_count,
+                new_count,
+                0 if new_count > 0 else 1,
+                now,
+                now if new_count > 0 else None,
+            )
+            for (collector, source, query), new_count in self._records.items()
+        ]
+        with transaction() as conn:
+            conn.executemany(sql, values)
+        self._records = {}
+        self._history = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            collector: {
+                "scheduled": len(self._scheduled[collector]),
+                "skipped": len(self._skipped[collector]),
+            }
+            for collector in self._scheduled.keys() | self._skipped.keys()
+        }
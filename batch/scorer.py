@@ -1,8 +1,50 @@
-import re
+import hashlib
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
+from batch.issue.keywords import CARD_PRODUCTS, ISSUE_KEYWORDS
+from batch.matcher import get_matcher
+from batch.product.keywords import BUTTON_TAG_MAP, CARD_COMPANIES, KEYWORDS_BY_BUTTON
+from batch.security_monitor import keywords as security_keywords
+from batch.travellog.keywords import (
+    TRAVELLOG_ISSUE_KEYWORDS,
+    TRAVELLOG_PRODUCT_KEYWORDS,
+)
+from batch.variables import SCORE_CHUNK_ROWS, SCORE_PARALLEL_MIN_ROWS, SCORE_WORKERS
+
+# 날짜와 무관해 수집 시 한 번 계산해 두는 점수 재료
+# - title_hit/desc_hit: 제목/본문에 상품 키워드 포함 여부
+# - issue_count: 본문의 issue 키워드 등장 횟수
+# - repetition: 제목 + 본문 반복 점수 (제목에 상품 키워드가 없으면 total_score가 0이라 계산 생략, 0)
+KEYWORD_SCORE_COLS: list[str] = ["title_hit", "desc_hit", "issue_count", "repetition"]
+# score_key: 재료를 계산한 키워드 집합의 해시 (키워드가 바뀌면 다시 계산)
+SCORE_COLS: list[str] = KEYWORD_SCORE_COLS + ["score_key"]
+# 점수 재료 계산 방식이 바뀌면 올려서 저장된 재료를 모두 다시 계산
+SCORE_VERSION: int = 1
+
+# 테이블별 메시지 점수 키워드 (issue_keywords, product_keywords)
+SCORE_KEYWORDS: dict[str, tuple[list[str], list[str]]] = {
+    "issue": (ISSUE_KEYWORDS, CARD_PRODUCTS),
+    "travellog": (TRAVELLOG_ISSUE_KEYWORDS, TRAVELLOG_PRODUCT_KEYWORDS),
+    "security_monitor": (
+        security_keywords.ISSUE_KEYWORDS,
+        security_keywords.PRODUCT_KEYWORDS,
+    ),
+}
+# product는 tag(버튼)마다 키워드가 다름
+PRODUCT_SCORE_KEYWORDS: dict[str, tuple[list[str], list[str]]] = {
+    tag: (KEYWORDS_BY_BUTTON[button], CARD_COMPANIES)
+    for button, tag in BUTTON_TAG_MAP.items()
+}
+SCORED_TABLES: list[str] = [*SCORE_KEYWORDS, "product"]
+
 
 class FeedbackScorer:
     def __init__(
@@ -13,6 +55,22 @@ class FeedbackScorer:
         self.issue_keywords = issue_keywords
         self.product_keywords = product_keywords
         self.all_keywords = issue_keywords + product_keywords
+        self.product_matcher = get_matcher(tuple(product_keywords))
+        self.issue_matcher = get_matcher(tuple(issue_keywords))
+        # ({kw})\1{2,} 에 걸리는 글 == kw를 3번 이어 붙인 문자열을 포함하는 글
+        # 키워드별 정규식 대신 3번 이어 붙인 키워드들의 automaton 하나로 한 번에 검사
+        self.repetition_matcher = get_matcher(tuple(kw * 3 for kw in self.all_keywords))
+        # 빈 키워드("")는 automaton에 넣을 수 없어 str 연산 결과를 그대로 재현
+        # ("" in text와 ()\1{2,}는 항상 참, text.count("")는 len(text) + 1)
+        self.empty_product = "" in product_keywords
+        self.empty_issue_count = issue_keywords.count("")
+        self.empty_repetition = "" in self.all_keywords
+        self.score_key = hashlib.blake2b(
+            json.dumps(
+                [SCORE_VERSION, issue_keywords, product_keywords], ensure_ascii=False
+            ).encode(),
+            digest_size=8,
+        ).hexdigest()
 
     def calculate_date_score(self, days: int) -> int:
         """scoring 기준 1: 날짜가 최신일수록 높은 스코어"""
@@ -20,19 +78,15 @@ class FeedbackScorer:
 
     def calculate_product_score(self, text: str) -> int:
         """scoring 기준 2: 우리 상품과 관련된 키워드가 포함되면 1 아니면 0"""
-        return int(any(kw in text for kw in self.product_keywords))
+        return int(self.empty_product or self.product_matcher.has_any(text))
 
     def calculate_issue_score(self, text: str) -> int:
         """scoring 기준 3: 글의 길이 대비 issue 단어 카운트가 높을수록 높은 스코어"""
-        return sum(text.count(kw) for kw in self.issue_keywords)
+        return self.issue_matcher.count(text) + self.empty_issue_count * (len(text) + 1)
 
     def score_by_repetition(self, text: str) -> int:
         """scoring 기준 4: 모든 단어가 자주 반복될수록 낮은 스코어"""
-        for kw in self.all_keywords:
-            pattern = rf"({re.escape(kw)})\1{{2,}}"
-            if re.search(pattern, text):
-                return -1
-        return 0
+        return -int(self.empty_repetition or self.repetition_matcher.has_any(text))
 
     def assign_percentile_score(self, series: pd.Series) -> pd.Series:
         """score를 quantile 단위로 grouping 해서 축소"""
@@ -88,44 +142,298 @@ class FeedbackScorer:
         return df
 
 
+class VectorizedFeedbackScorer(FeedbackScorer):
+    """
+    FeedbackScorer.apply_scores와 같은 total_score를 행마다 Python 함수를 부르지 않고 계산.
+    - 날짜 점수: np.select로 10/20/30일 구간
+    - percentile 점수: np.quantile(linear) 한 번으로 q80, q90
+    - 키워드 포함/횟수: 글마다 키워드 automaton(batch.matcher)으로 한 번 훑기
+    - 반복 점수: 제목에 상품 키워드가 있는 행만 계산 (나머지는 total_score가 0)
+    - workers > 1 이고 parallel_min_rows 이상이면 키워드 스캔을 chunk로 나눠 프로세스 풀에서 계산
+      (percentile은 합친 뒤 전체 분포로 계산)
+    """
+
+    def __init__(
+        self,
+        issue_keywords: list[str],
+        product_keywords: list[str],
+        workers: int = SCORE_WORKERS,
+        parallel_min_rows: int = SCORE_PARALLEL_MIN_ROWS,
+    ):
+        super().__init__(issue_keywords, product_keywords)
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_min_rows = parallel_min_rows
+
+    @staticmethod
+    def date_scores(days: np.ndarray) -> np.ndarray:
+        """NaN(날짜 없음)은 모든 비교가 거짓이라 0점"""
+        return np.select([days <= 10, days <= 20, days <= 30], [3, 2, 1], default=0)
+
+    @staticmethod
+    def percentile_scores(values: np.ndarray) -> np.ndarray:
+        """
+        assign_percentile_score와 같은 값.
+        기존 구현의 (val >= q80) + (val >= q90)은 numpy bool끼리의 덧셈(= OR)이라
+        실제 점수는 0 또는 1 (q80 이상이면 1)
+        """
+        if len(values) == 0:
+            return np.zeros(0, dtype=np.int64)
+        q80, q90 = np.quantile(values, [0.8, 0.9])
+        return ((values >= q80) | (values >= q90)).astype(np.int64)
+
+    @classmethod
+    def grouped_percentile_scores(
+        cls, values: np.ndarray, groups: np.ndarray | None
+    ) -> np.ndarray:
+        """groups가 있으면 그룹(예: source)마다 따로 percentile 점수"""
+        if groups is None:
+            return cls.percentile_scores(values)
+        codes, uniques = pd.factorize(groups, use_na_sentinel=False)
+        scores = np.zeros(len(values), dtype=np.int64)
+        for code in range(len(uniques)):
+            mask = codes == code
+            scores[mask] = cls.percentile_scores(values[mask])
+        return scores
+
+    @staticmethod
+    def _days(dates: pd.Series, today: datetime) -> np.ndarray:
+        dt = pd.to_datetime(dates, format="%Y%m%d", errors="coerce")
+        return (today - dt).dt.days.to_numpy(dtype=float, na_value=np.nan)
+
+    def product_scores(self, texts: list[str]) -> np.ndarray:
+        if self.empty_product:
+            return np.ones(len(texts), dtype=np.int64)
+        has_any = self.product_matcher.has_any
+        return np.fromiter(
+            (has_any(t) for t in texts), dtype=bool, count=len(texts)
+        ).astype(np.int64)
+
+    def issue_counts(self, texts: list[str]) -> np.ndarray:
+        count = self.issue_matcher.count
+        counts = np.fromiter(
+            (count(t) for t in texts), dtype=np.int64, count=len(texts)
+        )
+        if self.empty_issue_count:
+            lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+            counts += self.empty_issue_count * (lengths + 1)
+        return counts
+
+    def repetition_scores(self, texts: list[str]) -> np.ndarray:
+        if self.empty_repetition:
+            return -np.ones(len(texts), dtype=np.int64)
+        has_any = self.repetition_matcher.has_any
+        repeated = np.fromiter(
+            (has_any(t) for t in texts), dtype=bool, count=len(texts)
+        )
+        return -repeated.astype(np.int64)
+
+    def keyword_components(
+        self, titles: list[str], descriptions: list[str]
+    ) -> dict[str, np.ndarray]:
+        """KEYWORD_SCORE_COLS 값 (날짜와 무관한 점수 재료)"""
+        if self.workers > 1 and len(titles) >= self.parallel_min_rows:
+            return self._parallel_components(titles, descriptions)
+        return self._components(titles, descriptions)
+
+    def _parallel_components(
+        self, titles: list[str], descriptions: list[str]
+    ) -> dict[str, np.ndarray]:
+        """
+        SCORE_CHUNK_ROWS 단위로 나눠 worker마다 만든 scorer(automaton은 worker당 한 번)로 계산.
+        executor.map은 입력 순서대로 결과를 돌려주므로 합친 결과는 단일 프로세스와 같음
+        """
+        bounds = range(0, len(titles), SCORE_CHUNK_ROWS)
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(bounds)),
+            initializer=_init_worker,
+            initargs=(self.issue_keywords, self.product_keywords),
+        ) as executor:
+            chunks = list(
+                executor.map(
+                    _score_chunk,
+                    [titles[i : i + SCORE_CHUNK_ROWS] for i in bounds],
+                    [descriptions[i : i + SCORE_CHUNK_ROWS] for i in bounds],
+                )
+            )
+        return {
+            c: np.concatenate([chunk[c] for chunk in chunks])
+            for c in KEYWORD_SCORE_COLS
+        }
+
+    def _components(
+        self, titles: list[str], descriptions: list[str]
+    ) -> dict[str, np.ndarray]:
+        title_hit = self.product_scores(titles)
+        candidates = np.flatnonzero(title_hit)
+        repetition = np.zeros(len(titles), dtype=np.int64)
+        repetition[candidates] = self.repetition_scores(
+            [titles[i] for i in candidates]
+        ) + self.repetition_scores([descriptions[i] for i in candidates])
+        return {
+            "title_hit": title_hit,
+            "desc_hit": self.product_scores(descriptions),
+            "issue_count": self.issue_counts(descriptions),
+            "repetition": repetition,
+        }
+
+    def stored_components(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        df에 저장된 점수 재료를 쓰고, 재료가 없거나 다른 키워드로 계산된(score_key 불일치) 행만
+        title/description에서 다시 계산
+        """
+        components = df.reindex(columns=KEYWORD_SCORE_COLS)
+        keys = df.get("score_key", pd.Series(None, index=df.index, dtype=object))
+        stale = (components.isna().any(axis=1) | (keys != self.score_key)).to_numpy()
+        if stale.any():
+            rows = df.loc[stale]
+            fresh = self.keyword_components(
+                rows["title"].fillna("").astype(str).tolist(),
+                rows["description"].fillna("").astype(str).tolist(),
+            )
+            components.loc[stale, KEYWORD_SCORE_COLS] = np.column_stack(
+                [fresh[c] for c in KEYWORD_SCORE_COLS]
+            )
+        return components.astype(np.int64)
+
+    def apply_scores(
+        self,
+        df: pd.DataFrame,
+        today: datetime | None = None,
+        by: str | None = None,
+    ) -> pd.DataFrame:
+        """by: percentile 점수를 나눠 계산할 컬럼 (source별로 apply_scores를 따로 부른 것과 같음)"""
+        today = today or datetime.today()
+        groups = df[by].to_numpy() if by else None
+        post_days = np.nan_to_num(self._days(df["post_date"], today), nan=999)
+        scrap_days = self._days(df["scrap_date"], today)
+        components = self.stored_components(df)
+
+        total_score = components["title_hit"].to_numpy() * (
+            self.date_scores(post_days)
+            + self.date_scores(scrap_days)
+            + self.grouped_percentile_scores(components["desc_hit"].to_numpy(), groups)
+            + components["repetition"].to_numpy()
+            + self.grouped_percentile_scores(
+                components["issue_count"].to_numpy(), groups
+            )
+        )
+        return df.assign(total_score=pd.Series(total_score, index=df.index))
+
+
+# 프로세스 풀 worker마다 한 번 만드는 scorer
+_worker_scorer: VectorizedFeedbackScorer | None = None
+
+
+def _init_worker(issue_keywords: list[str], product_keywords: list[str]) -> None:
+    global _worker_scorer
+    _worker_scorer = VectorizedFeedbackScorer(
+        issue_keywords, product_keywords, workers=1
+    )
+
+
+def _score_chunk(titles: list[str], descriptions: list[str]) -> dict[str, np.ndarray]:
+    assert _worker_scorer is not None
+    return _worker_scorer.keyword_components(titles, descriptions)
+
+
+@lru_cache(maxsize=32)
+def _cached_scorer(
+    issue_keywords: tuple[str, ...], product_keywords: tuple[str, ...]
+) -> VectorizedFeedbackScorer:
+    return VectorizedFeedbackScorer(list(issue_keywords), list(product_keywords))
+
+
+def get_scorer(table: str, tag: str | None = None) -> VectorizedFeedbackScorer | None:
+    """테이블(product는 tag)의 메시지 점수 scorer, 점수를 매기지 않는 테이블이면 None"""
+    if table == "product":
+        keywords = PRODUCT_SCORE_KEYWORDS.get(tag or "")
+    else:
+        keywords = SCORE_KEYWORDS.get(table)
+    if keywords is None:
+        return None
+    return _cached_scorer(tuple(keywords[0]), tuple(keywords[1]))
+
+
+def keyword_score_values(table: str, rows: list[dict]) -> list[tuple]:
+    """
+    저장할 행마다 SCORE_COLS 값 (insert_rows, CSV 이관에서 사용).
+    점수 키워드가 없는 테이블/tag의 행은 모두 None
+    """
+    values: list[tuple] = [(None,) * len(SCORE_COLS)] * len(rows)
+    groups: dict[str | None, list[int]] = defaultdict(list)
+    for i, row in enumerate(rows):
+        groups[row.get("tag")].append(i)
+
+    for tag, positions in groups.items():
+        scorer = get_scorer(table, tag)
+        if scorer is None:
+            continue
+        components = scorer.keyword_components(
+            [str(rows[i].get("title") or "") for i in positions],
+            [str(rows[i].get("description") or "") for i in positions],
+        )
+        for j, i in enumerate(positions):
+            values[i] = tuple(int(components[c][j]) for c in KEYWORD_SCORE_COLS) + (
+                scorer.score_key,
+            )
+    return values
+
+
+# source별 (정렬 날짜 컬럼, 뽑을 개수 = extracted_data_count // 나눌 값), 결과는 이 순서로 이어 붙임
+SOURCE_RANKING: list[tuple[str, str, int]] = [
+    ("blog", "post_date", 2),
+    ("cafe", "scrap_date", 2),
+    ("news", "scrap_date", 1),
+]
+
+
+def top_k_positions(dates: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    (날짜 내림차순, score 내림차순, 원래 순서) 기준 앞에서 k개의 위치.
+    sort_values([date, score], ascending=False).iloc[:k]와 같은 행을 같은 순서로 고르되,
+    전체 정렬 대신 argpartition으로 k개만 골라 정렬.
+    """
+    n = len(dates)
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    # 서로 다른 날짜만 정렬해 순위를 매김 (NaN은 sort_values처럼 맨 뒤)
+    codes, uniques = pd.factorize(dates, sort=True)
+    date_rank = np.where(codes >= 0, len(uniques) - 1 - codes, len(uniques))
+    score_rank = scores.max() - scores
+    # 세 기준을 하나의 정수 키로 합침 (원래 위치가 들어가서 키가 모두 다름)
+    key = (date_rank * (score_rank.max() + 1) + score_rank) * n + np.arange(n)
+    top = np.argpartition(key, k - 1)[:k] if k < n else np.arange(n)
+    return top[np.argsort(key[top])]
+
+
 def extract_high_score_data(
     data: pd.DataFrame,
     issue_keywords: list[str],
     product_keywords: list[str],
     extracted_data_count: int,
 ) -> pd.DataFrame:
-    scorer = FeedbackScorer(
-        issue_keywords=issue_keywords,
-        product_keywords=product_keywords,
-    )
-    _data = data.loc[data["is_posted"] == 0]
-
-    # 블로그 필터링
-    data_blog = _data.loc[_data["source"] == "blog"]
-    data_blog = scorer.apply_scores(data_blog)
-    data_blog = (
-        data_blog.loc[data_blog["total_score"] > 0]
-        .sort_values(["post_date", "total_score"], ascending=[False, False])
-        .iloc[: min((extracted_data_count // 2), len(data_blog))]
-    )
+    """
+    미게시 글을 한 번에 점수 매기고(percentile은 source별), source별로 total_score > 0 인 글 중
+    날짜, total_score 순으로 SOURCE_RANKING의 개수만큼 뽑아 blog, cafe, news 순으로 이어 붙임
+    """
+    # 수집 시 저장한 점수 재료(SCORE_COLS)가 있으면 날짜 점수와 percentile만 계산
+    scorer = _cached_scorer(tuple(issue_keywords), tuple(product_keywords))
+    sources = [source for source, _, _ in SOURCE_RANKING]
+    _data = data.loc[(data["is_posted"] == 0) & data["source"].isin(sources)]
+    scored = scorer.apply_scores(_data, by="source")
 
-    # 카페 필터링
-    data_cafe = _data.loc[_data["source"] == "cafe"]
-    data_cafe = scorer.apply_scores(data_cafe)
-    data_cafe = (
-        data_cafe.loc[data_cafe["total_score"] > 0]
-        .sort_values(["scrap_date", "total_score"], ascending=[False, False])
-        .iloc[: min((extracted_data_count // 2), len(data_cafe))]
-    )
-
-    # 뉴스 필터링
-    data_news = _data.loc[_data["source"] == "news"]
-    data_news = scorer.apply_scores(data_news)
-    data_news = (
-        data_news.loc[data_news["total_score"] > 0]
-        .sort_values(["scrap_date", "total_score"], ascending=[False, False])
-        .iloc[: min(extracted_data_count, len(data_news))]
-    )
+    source_values = scored["source"].to_numpy()
+    totals = scored["total_score"].to_numpy()
+    dates = {col: scored[col].to_numpy() for _, col, _ in SOURCE_RANKING}
+    picked = []
+    for source, date_col, divisor in SOURCE_RANKING:
+        positions = np.flatnonzero((source_values == source) & (totals > 0))
+        top = top_k_positions(
+            dates[date_col][positions],
+            totals[positions],
+            extracted_data_count // divisor,
+        )
+        picked.append(scored.iloc[positions[top]])
 
-    # 병합하여 반환
-    return pd.concat([data_blog, data_cafe, data_news], ignore_index=True)
+    return pd.concat(picked, ignore_index=True)
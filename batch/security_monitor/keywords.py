@@ -7,6 +7,9 @@ CARD_PRODUCTS: list[str] = [
     "하나카드",
 ]
 
+# 메시지 점수의 상품 키워드
+PRODUCT_KEYWORDS: list[str] = ["카드사", "카드업", "하나카드"]
+
 ISSUE_KEYWORDS: list[str] = [
     "개인정보",
     "고객정보",
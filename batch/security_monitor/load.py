@@ -1,25 +1,56 @@
 from datetime import datetime
-from time import sleep
+from typing import Any
 
 from tqdm import tqdm
 
 from batch.dml import insert_rows
-from batch.fetch import fetch_data
+from batch.paginate import DatePaginator
+from batch.planner import QueryPlanner
+from batch.scheduler import QueryScheduler
 from batch.variables import SOURCES
 from logger import logger
 
+TABLE = "security_monitor"
+DISPLAY = 100
+SECURITY_SOURCES: list[str] = ["news"] + SOURCES
 
-def collect_load_security_issues(queries: list[str]) -> None:
-    for source in tqdm(["news"] + SOURCES, desc="source"):
-        rows: list[dict] = []
 
-        for keyword in tqdm(queries, desc=source, leave=False):
-            result = fetch_data(source, keyword, display=100, sort="date")
-            sleep(0.1)
-            if result is None:
-                logger.error(f"Failed to fetch data for {keyword} from {source}")
-                continue
+def build_tasks(
+    queries: list[str], scheduler: QueryScheduler | None = None
+) -> list[dict[str, Any]]:
+    """QueryPlanner에 등록할 첫 페이지 검색 요청 목록"""
+    paginator = DatePaginator(TABLE, display=DISPLAY, scheduler=scheduler)
+    return [
+        paginator.first_page_task(source, keyword)
+        for source in SECURITY_SOURCES
+        for keyword in queries
+        if paginator.is_due(source, keyword)
+    ]
+
+
+def collect_load_security_issues(
+    queries: list[str],
+    planner: QueryPlanner | None = None,
+    scheduler: QueryScheduler | None = None,
+) -> None:
+    paginator = DatePaginator(
+        TABLE, display=DISPLAY, planner=planner, scheduler=scheduler
+    )
+    for source in tqdm(SECURITY_SOURCES, desc="source"):
+        rows: list[dict] = []
 
+        pages_by_query = paginator.fetch_many(
+            [{"type": source, "query": keyword} for keyword in queries]
+        )
+        for keyword, result in tqdm(
+            (
+                (keyword, page)
+                for keyword, pages in zip(queries, pages_by_query)
+                for page in pages
+            ),
+            desc=source,
+            leave=False,
+        ):
             items = result.to_items(
                 query=keyword,
                 scrap_date=datetime.today().strftime("%Y%m%d"),
@@ -51,5 +82,6 @@ def collect_load_security_issues(queries: list[str]) -> None:
                     }
                 )
 
-        insert_rows("security_monitor", rows)
+        insert_rows(TABLE, rows)
+        paginator.commit()
         logger.info(f"security_monitor: inserted {len(rows)} rows (source={source})")
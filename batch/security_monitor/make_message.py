@@ -2,47 +2,43 @@ import json
 import re
 from datetime import datetime, timedelta
 
-import pandas as pd
-
-from batch.dml import fetch_df, mark_posted
-from batch.scorer import extract_high_score_data
-from batch.security_monitor.keywords import ISSUE_KEYWORDS
+from batch.dedup import collapse_near_duplicates, expand_cluster_urls
+from batch.dml import COMMON_COLS, DATE_KEY, fetch_df, mark_posted
+from batch.scorer import SCORE_COLS, extract_high_score_data
+from batch.security_monitor.keywords import ISSUE_KEYWORDS, PRODUCT_KEYWORDS
 from batch.security_monitor.prompt import SECURITY_PROMPT, SECURITY_TEXT_INPUT
 from batch.utils import extract_urls
-from batch.variables import EXTRACTED_DATA_COUNT
+from batch.variables import EXTRACTED_DATA_COUNT, LLM_MESSAGE_CACHE_TTL
 from bot.services.core.openai_client import async_openai_response
 from logger import logger
 
 
 async def get_security_messages(tag: bool = True) -> list[str]:
-    data = fetch_df("security_monitor")
+    yesterday = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+    data = fetch_df(
+        "security_monitor",
+        COMMON_COLS + SCORE_COLS,
+        unposted=True,
+        date_col=DATE_KEY,
+        since=yesterday,
+    )
 
     refined_data = extract_high_score_data(
         data=data,
         issue_keywords=ISSUE_KEYWORDS,
-        product_keywords=["카드사", "카드업", "하나카드"],
+        product_keywords=PRODUCT_KEYWORDS,
         extracted_data_count=EXTRACTED_DATA_COUNT,
     )
 
-    yesterday = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
-    refined_data["post_date"] = refined_data["post_date"].fillna("").astype(str)
-
-    refined_data["date_key"] = (
-        refined_data["post_date"]
-        .replace("", pd.NA)
-        .fillna(refined_data["scrap_date"])
-        .astype(str)
-    )
-
-    refined_data = refined_data.loc[refined_data["date_key"] >= yesterday]
-
     if len(refined_data) == 0:
         logger.warning("No data found after filtering.")
         return []
+    refined_data = collapse_near_duplicates(refined_data)
 
     columns = ["title", "url", "description"]
     if "name" in refined_data.columns:
         columns.append("name")
+    columns.append("cluster_size")
 
     content = json.dumps(
         refined_data[columns].to_dict(orient="records"),
@@ -55,6 +51,7 @@ async def get_security_messages(tag: bool = True) -> list[str]:
             issue_keywords=", ".join(ISSUE_KEYWORDS),
             content=content,
         ),
+        cache_ttl=LLM_MESSAGE_CACHE_TTL,
     )
 
     entries = re.split(r"\n\s*\n|[-]{6,}", result.strip())
@@ -66,6 +63,6 @@ async def get_security_messages(tag: bool = True) -> list[str]:
 
     logger.info(f"{len(urls)} found in the message.")
     if tag:
-        mark_posted("security_monitor", urls)
+        mark_posted("security_monitor", expand_cluster_urls(refined_data, urls))
 
     return entries
@@ -8,6 +8,13 @@ TRAVELLOG_KEYWORDS: list[str] = [
     "하나머니",
 ]
 
+# 메시지 점수의 상품 키워드 (자주 틀리는 표기 포함)
+TRAVELLOG_PRODUCT_KEYWORDS: list[str] = TRAVELLOG_KEYWORDS + [
+    "트레블로그",
+    "트레블고",
+    "트레블GO",
+]
+
 TRAVELLOG_ADDTIONAL_KEYWORDS: list[str] = [
     "인출",
     "ATM",
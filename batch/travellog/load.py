@@ -1,43 +1,61 @@
 from datetime import datetime
-from time import sleep
 from typing import Any
 
 import pandas as pd
 from tqdm import tqdm
 
 from batch.dml import insert_rows
-from batch.fetch import fetch_data
+from batch.paginate import DatePaginator
+from batch.planner import QueryPlanner
+from batch.scheduler import QueryScheduler
 from batch.travellog.select_column import SCHEMA, SOURCES_SELECT_MAP
 from batch.variables import SOURCES
 from logger import logger
 
+TABLE = "travellog"
+DISPLAY = 100
 
-def collect_load_travellog_data(queries: list[str]) -> None:
+
+def build_tasks(
+    queries: list[str], scheduler: QueryScheduler | None = None
+) -> list[dict[str, Any]]:
+    """QueryPlanner에 등록할 첫 페이지 검색 요청 목록"""
+    paginator = DatePaginator(TABLE, display=DISPLAY, scheduler=scheduler)
+    return [
+        paginator.first_page_task(source, keyword)
+        for source in SOURCES
+        for keyword in queries
+        if paginator.is_due(source, keyword)
+    ]
+
+
+def collect_load_travellog_data(
+    queries: list[str],
+    planner: QueryPlanner | None = None,
+    scheduler: QueryScheduler | None = None,
+) -> None:
     """데이터를 수집하고 저장."""
     all_rows: list[dict[str, str]] = []
+    paginator = DatePaginator(
+        TABLE, display=DISPLAY, planner=planner, scheduler=scheduler
+    )
 
     for source in tqdm(SOURCES, disable=True):
         items: list[dict[str, Any]] = []
 
-        for keyword in tqdm(queries, disable=True):
-            _data = fetch_data(
-                type=source,
-                query=keyword,
-                sort="date",
-                display=100,
-            )
-            sleep(0.05)
-            if _data is None:
-                logger.error(f"Failed to fetch data for {keyword} from {source}")
-                continue
-            _items = _data.to_items(
-                query=keyword,
-                scrap_date=datetime.today().strftime("%Y%m%d"),
-            )
-            for it in _items:
-                it["source"] = source
-                it["is_posted"] = 0
-            items.extend(_items)
+        pages_by_query = paginator.fetch_many(
+            [{"type": source, "query": keyword} for keyword in queries]
+        )
+        for keyword, pages in tqdm(zip(queries, pages_by_query), disable=True):
+            for _data in pages:
+                _items = _data.to_items(
+                    query=keyword,
+                    scrap_date=datetime.today().strftime("%Y%m%d"),
+                )
+                for it in _items:
+                    it["source"] = source
+                    it["is_posted"] = 0
+                items.extend(_items)
 
         if items:
             for it in items:
@@ -50,6 +68,7 @@ def collect_load_travellog_data(queries: list[str]) -> None:
             df = pd.DataFrame(columns=SCHEMA)
 
         all_rows.extend(df.to_dict(orient="records"))
-        logger.info(f"issue scrap completed: source={source}, rows={len(df)}")
+        logger.info(f"travellog scrap completed: source={source}, rows={len(df)}")
 
-    insert_rows("travellog", all_rows)
+    insert_rows(TABLE, all_rows)
+    paginator.commit()
@@ -5,22 +5,39 @@ from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 
-from batch.dml import mark_posted
-from batch.scorer import extract_high_score_data
-from batch.travellog.keywords import TRAVELLOG_ISSUE_KEYWORDS, TRAVELLOG_KEYWORDS
+from batch.dedup import collapse_near_duplicates, expand_cluster_urls
+from batch.dml import COMMON_COLS, DATE_KEY, fetch_df, mark_posted
+from batch.scorer import SCORE_COLS, extract_high_score_data
+from batch.travellog.keywords import (
+    TRAVELLOG_ISSUE_KEYWORDS,
+    TRAVELLOG_KEYWORDS,
+    TRAVELLOG_PRODUCT_KEYWORDS,
+)
 from batch.travellog.prompt import PROMPT, TEXT_INPUT
 from batch.utils import extract_urls
-from batch.variables import EXTRACTED_DATA_COUNT
+from batch.variables import EXTRACTED_DATA_COUNT, LLM_MESSAGE_CACHE_TTL
 from bot.services.core.openai_client import async_openai_response
 from logger import logger
 
 
+def load_travellog_data() -> pd.DataFrame:
+    """메시지 후보(미게시, 어제 이후)만 DB에서 읽음"""
+    yesterday = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+    return fetch_df(
+        "travellog",
+        COMMON_COLS + SCORE_COLS,
+        unposted=True,
+        date_col=DATE_KEY,
+        since=yesterday,
+    )
+
+
 async def get_travellog_message(data: pd.DataFrame, tag: bool = True) -> list[str]:
     data = data.loc[data["is_posted"] == 0].copy()
     refined_data = extract_high_score_data(
         data=data,
         issue_keywords=TRAVELLOG_ISSUE_KEYWORDS,
-        product_keywords=TRAVELLOG_KEYWORDS + ["트레블로그", "트레블고", "트레블GO"],
+        product_keywords=TRAVELLOG_PRODUCT_KEYWORDS,
         extracted_data_count=EXTRACTED_DATA_COUNT,
     )
 
@@ -35,9 +52,12 @@ async def get_travellog_message(data: pd.DataFrame, tag: bool = True) -> list[st
     if len(refined_data) == 0:
         logger.warning("No data found after filtering.")
         return ["오늘은 주목할만한 이슈가 없어요! 다음에 더 좋은 이슈로 찾아올게요 😊"]
+    refined_data = collapse_near_duplicates(refined_data)
 
     content = json.dumps(
-        refined_data[["title", "url", "description", "name"]].to_dict(orient="records"),
+        refined_data[["title", "url", "description", "name", "cluster_size"]].to_dict(
+            orient="records"
+        ),
         ensure_ascii=False,
     )
     result = await async_openai_response(
@@ -46,6 +66,7 @@ async def get_travellog_message(data: pd.DataFrame, tag: bool = True) -> list[st
             card_products=", ".join(TRAVELLOG_KEYWORDS),
             content=content,
         ),
+        cache_ttl=LLM_MESSAGE_CACHE_TTL,
     )
 
     entries = re.split(r"\n\s*\n|[-]{6,}", result.strip())
@@ -59,6 +80,6 @@ async def get_travellog_message(data: pd.DataFrame, tag: bool = True) -> list[st
     else:
         logger.info(f"{len(urls)} found in the message.")
         if tag:
-            mark_posted("travellog", urls)
+            mark_posted("travellog", expand_cluster_urls(refined_data, urls))
 
     return entries
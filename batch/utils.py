@@ -1,8 +1,31 @@
+import hashlib
 import os
 import re
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 import pandas as pd
 
+# 같은 글을 가리키지만 유입 경로만 다른 query string
+TRACKING_PARAMS: frozenset[str] = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "igshid",
+        "ref",
+        "ref_src",
+        "from",
+        "NaPm",
+        "Redirect",
+        "redirect",
+        "trackingCode",
+        "widgetTypeCall",
+        "directAccess",
+    }
+)
+HOST_PREFIXES: tuple[str, ...] = ("www.", "m.")
+NAVER_NEWS_HOSTS: frozenset[str] = frozenset({"news.naver.com", "n.news.naver.com"})
+NAVER_NEWS_PATH = re.compile(r"^/(?:mnews/)?article/(\d+)/(\d+)")
+
 
 def extract_urls(text: str) -> list[str]:
     urls = re.findall(r"https?://[^\s]+", text)
@@ -13,3 +36,48 @@ def read_csv(file_path: str) -> pd.DataFrame:
     if os.path.exists(file_path):
         return pd.read_csv(file_path, encoding="utf-8")
     return pd.DataFrame()
+
+
+def canonical_url(url: str) -> str:
+    """
+    같은 글의 여러 URL 표기를 하나로 맞춤.
+    - http/https, www./m. 접두사, 기본 포트, fragment, 끝의 / 차이 무시
+    - utm_* 등 추적용 파라미터 제거, 나머지 파라미터는 정렬
+    - 네이버 블로그 PostView?blogId=&logNo= → blog.naver.com/<blogId>/<logNo>
+    - 네이버 뉴스 n.news/mnews/read.naver?oid=&aid= → news.naver.com/article/<oid>/<aid>
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = (parts.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix) :]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip("/") or "/"
+    params = {
+        k: v
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in TRACKING_PARAMS and not k.startswith("utm_")
+    }
+
+    if host == "blog.naver.com" and "blogId" in params and "logNo" in params:
+        path, params = f"/{params['blogId']}/{params['logNo']}", {}
+    elif host in NAVER_NEWS_HOSTS:
+        host = "news.naver.com"
+        if match := NAVER_NEWS_PATH.match(path):
+            path, params = f"/article/{match[1]}/{match[2]}", {}
+        elif "oid" in params and "aid" in params:
+            path, params = f"/article/{params['oid']}/{params['aid']}", {}
+
+    query = f"?{urlencode(sorted(params.items()))}" if params else ""
+    return f"https://{host}{path}{query}"
+
+
+def url_hash(url: str) -> int:
+    """canonical_url의 64bit 해시 (SQLite INTEGER에 들어가도록 signed)"""
+    digest = hashlib.blake2b(canonical_url(url).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -8,6 +8,62 @@ EXTRACTED_DATA_COUNT: int = 100
 DATA_PATH: str = os.path.join(SAVE_PATH, "data.csv")
 SECURITY_DATA_PATH: str = os.path.join(SAVE_PATH, "security_data.csv")
 TRAVELLOG_DATA_PATH: str = os.path.join(SAVE_PATH, "travellog_data.csv")
+
+# 디버그 실행 여부. 켜면 검색 응답을 pydantic 모델로 엄격하게 검증
+JUPJUP_DEBUG: bool = os.environ.get("JUPJUP_DEBUG", "0") == "1"
+STRICT_DECODE: bool = JUPJUP_DEBUG
+
+# 네이버 검색/데이터랩 응답 캐시 (on: 읽기+쓰기, off: 사용 안함, only: 캐시만 사용)
+HTTP_CACHE_PATH: str = os.path.join(SAVE_PATH, "http_cache.db")
+HTTP_CACHE_MODE: str = os.environ.get("HTTP_CACHE_MODE", "on")
+HTTP_CACHE_TTL: int = int(os.environ.get("HTTP_CACHE_TTL", 6 * 60 * 60))  # 초
+HTTP_CACHE_MAX_BYTES: int = int(
+    os.environ.get("HTTP_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+)
+# OpenAI 응답 캐시 (on/off/only는 HTTP 캐시와 같음, off면 모든 호출이 캐시를 건너뜀)
+# 호출부 TTL은 LLM_CACHE_TTL(보관 기간) 이하로 지정
+LLM_CACHE_PATH: str = os.path.join(SAVE_PATH, "llm_cache.db")
+LLM_CACHE_MODE: str = os.environ.get("LLM_CACHE_MODE", "on")
+LLM_CACHE_TTL: int = int(os.environ.get("LLM_CACHE_TTL", 7 * 24 * 60 * 60))  # 초
+LLM_CACHE_MAX_BYTES: int = int(os.environ.get("LLM_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+LLM_MESSAGE_CACHE_TTL: int = 12 * 60 * 60  # 배치 메시지 생성 (당일 재실행)
+# GeekNews/나라사랑 글 점수 (며칠 연속 후보)
+LLM_SCORE_CACHE_TTL: int = 7 * 24 * 60 * 60
+# GeekNews/나라사랑 LLM 점수 요청 하나에 묶어 보낼 글 수 (1 이하면 글마다 따로 요청)
+LLM_SCORE_PACK_SIZE: int = int(os.environ.get("LLM_SCORE_PACK_SIZE", 10))
+# jupjup.db 연결 튜닝 (WAL 저널, page cache(KiB), mmap 크기(byte), 잠금 대기(ms))
+DB_CACHE_SIZE_KB: int = int(os.environ.get("DB_CACHE_SIZE_KB", 64 * 1024))
+DB_MMAP_SIZE: int = int(os.environ.get("DB_MMAP_SIZE", 256 * 1024 * 1024))
+DB_BUSY_TIMEOUT_MS: int = int(os.environ.get("DB_BUSY_TIMEOUT_MS", 5000))
+DB_CACHED_STATEMENTS: int = 256
+# 네이버 OpenAPI 일일 호출 한도 (API 묶음별)
+NAVER_DAILY_QUOTAS: dict[str, int] = {"search": 25000, "datalab": 1000}
+# 수집기 우선순위 (작을수록 먼저 budget을 보장) 와 일일 검색 API budget
+COLLECTOR_PRIORITY: dict[str, int] = {
+    "security_monitor": 0,
+    "narasarang": 1,
+    "travellog": 2,
+    "issue": 3,
+    "product": 4,
+}
+COLLECTOR_DAILY_BUDGET: dict[str, int] = {
+    "security_monitor": 6000,
+    "narasarang": 4000,
+    "travellog": 6000,
+    "issue": 5000,
+    "product": 2000,
+}
+# 새 URL이 나오지 않는 검색어도 최소 이 일수마다 한 번은 수집
+YIELD_MAX_STALENESS_DAYS: int = int(os.environ.get("YIELD_MAX_STALENESS_DAYS", 7))
+# 이슈 검색어를 OR(|)로 묶는 개수 (1이면 검색어마다 호출)
+ISSUE_QUERY_BATCH_SIZE: int = int(os.environ.get("ISSUE_QUERY_BATCH_SIZE", 1))
+# 프롬프트에 넣기 전 near-duplicate로 묶을 글자 3-gram Jaccard 유사도 기준
+NEAR_DUP_THRESHOLD: float = float(os.environ.get("NEAR_DUP_THRESHOLD", 0.7))
+# 점수 재료(키워드 스캔)를 나눠 계산할 프로세스 수 (1이면 현재 프로세스에서, 0이면 CPU 수만큼)
+# 행 수가 SCORE_PARALLEL_MIN_ROWS 미만이면 프로세스를 띄우지 않음
+SCORE_WORKERS: int = int(os.environ.get("SCORE_WORKERS", 1))
+SCORE_PARALLEL_MIN_ROWS: int = int(os.environ.get("SCORE_PARALLEL_MIN_ROWS", 200_000))
+SCORE_CHUNK_ROWS: int = 50_000
 TEST_CHANNEL_ID: str = "8895b3b4-1cff-cec7-b7bc-a6df449d3638"
 
 # 트래블로그 블로그글 송신, 하나머니UX팀 우수현
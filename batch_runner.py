@@ -4,35 +4,40 @@ import os
 from datetime import datetime
 from typing import Any
 
-import pandas as pd
-from holidayskr import is_holiday
-
 from batch.app_review.android import get_app_reviews
+from batch.cache import http_cache, llm_cache
 from batch.compare_travel.make_message import get_compare_travel_message
-from batch.database import init_database
-from batch.dml import fetch_df
+from batch.database import close_connections, init_database
 from batch.geeknews.load import collect_load_geeknews
 from batch.geeknews.make_message import get_geeknews_message
 from batch.issue.keywords import QUERIES
+from batch.issue.load import build_tasks as build_issue_tasks
 from batch.issue.load import collect_load_data
-from batch.issue.make_message import get_issue_message
+from batch.issue.make_message import get_issue_message, load_issue_data
+from batch.migrate import migrate_csv_history
 from batch.narasarang.keywords import NARASARANG_QUERIES
+from batch.narasarang.load import build_tasks as build_narasarang_tasks
 from batch.narasarang.load import collect_load_narasarang_data
 from batch.narasarang.make_message import (
     get_hana_narasarang_messages,
     get_shinhan_narasarang_messages,
     get_trend_narasarng_messages,
 )
+from batch.planner import QueryPlanner
+from batch.product.load import build_tasks as build_product_tasks
 from batch.product.load import collect_load_product_issues
 from batch.product.make_message import process_generate_message
+from batch.quota import api_quota
+from batch.scheduler import QueryScheduler
 from batch.security_monitor.keywords import SECURITY_QUERIES
+from batch.security_monitor.load import build_tasks as build_security_tasks
 from batch.security_monitor.load import collect_load_security_issues
 from batch.security_monitor.make_message import get_security_messages
 from batch.travellog.keywords import TRAVELLOG_QUERIES
+from batch.travellog.load import build_tasks as build_travellog_tasks
 from batch.travellog.load import collect_load_travellog_data
-from batch.travellog.make_message import get_travellog_message
+from batch.travellog.make_message import get_travellog_message, load_travellog_data
 from batch.variables import (
-    DATA_PATH,
     NARASARANG_CHANNEL_ID,
     PRODUCT_CHANNEL_ID,
     SECURITY_CHANNEL_ID,
@@ -51,37 +56,87 @@ from bot.services.core.post_payload import (
     async_post_payload,
 )
 from logger import logger
+from replay import recorder, replayable
+
+
+@replayable("holiday")
+def is_holiday(date_str: str) -> bool:
+    # holidayskr는 import 시점에 공휴일 데이터를 내려받으므로 필요할 때 import
+    from holidayskr import is_holiday as _is_holiday
+
+    return _is_holiday(date_str)
 
 
 def is_skip_batch(date: datetime) -> bool:
     return is_holiday(date.strftime("%Y-%m-%d")) or date.weekday() >= 5
 
 
+PRODUCT_FILE_TAGS: list[str] = ["credit", "debit", "wonder", "jade"]
+
+
 def data_collect():
-    collect_load_data(QUERIES)
+    # 수율이 낮은 검색어는 수집 주기를 늘리고, 남은 검색 요청은 모아서 중복 호출을 합침
+    scheduler = QueryScheduler()
+    planner = QueryPlanner()
+    planner.add("issue", build_issue_tasks(QUERIES, scheduler=scheduler))
+    planner.add(
+        "travellog", build_travellog_tasks(TRAVELLOG_QUERIES, scheduler=scheduler)
+    )
+    planner.add(
+        "security_monitor",
+        build_security_tasks(SECURITY_QUERIES, scheduler=scheduler),
+    )
+    for file_tag in PRODUCT_FILE_TAGS:
+        planner.add("product", build_product_tasks(file_tag, scheduler=scheduler))
+    planner.add(
+        "narasarang",
+        build_narasarang_tasks(NARASARANG_QUERIES, scheduler=scheduler),
+    )
+    planner.execute()
+
+    with api_quota.track("issue"):
+        collect_load_data(QUERIES, planner=planner, scheduler=scheduler)
     logger.info("Issue Data Collection Completed")
 
-    collect_load_travellog_data(TRAVELLOG_QUERIES)
+    with api_quota.track("travellog"):
+        collect_load_travellog_data(
+            TRAVELLOG_QUERIES, planner=planner, scheduler=scheduler
+        )
     logger.info("Travellog Data Collection Completed")
 
-    collect_load_security_issues(SECURITY_QUERIES)
+    with api_quota.track("security_monitor"):
+        collect_load_security_issues(
+            SECURITY_QUERIES, planner=planner, scheduler=scheduler
+        )
     logger.info("Security Data Collection Completed")
 
-    for file_tag in ["credit", "debit", "wonder", "jade"]:
-        collect_load_product_issues(file_tag=file_tag)
+    with api_quota.track("product"):
+        for file_tag in PRODUCT_FILE_TAGS:
+            collect_load_product_issues(
+                file_tag=file_tag, planner=planner, scheduler=scheduler
+            )
     logger.info("Product Data Collection Completed")
 
     collect_load_geeknews()
     logger.info("Geeknews Collection Completed")
 
-    collect_load_narasarang_data(NARASARANG_QUERIES)
+    with api_quota.track("narasarang"):
+        collect_load_narasarang_data(
+            NARASARANG_QUERIES, planner=planner, scheduler=scheduler
+        )
     logger.info("Narasarang Collection Completed")
 
+    scheduler.commit()
+    api_quota.flush()
+    logger.info(f"[planner] {planner.stats()}")
+    logger.info(f"[scheduler] {scheduler.stats()}")
+    logger.info(f"[quota] {api_quota.summary()}")
+
 
 async def make_message(today_str: str, is_test: bool = False):
     try:  # Issue 메시지 생성
         logger.info("Generating issue message")
-        issue_df = pd.read_csv(DATA_PATH, dtype={"post_date": object}, encoding="utf-8")
+        issue_df = load_issue_data()
         issue_message = await get_issue_message(issue_df, tag=not is_test)
         logger.info("Created issue message")
     except Exception as e:
@@ -90,7 +145,7 @@ async def make_message(today_str: str, is_test: bool = False):
 
     try:  # 트래블로그 메시지 생성
         logger.info("Generating travellog message")
-        travellog_df = fetch_df("travellog")
+        travellog_df = load_travellog_data()
         travellog_messages = await get_travellog_message(travellog_df, tag=not is_test)
         logger.info("Created travellog message")
     except Exception as e:
@@ -214,6 +269,7 @@ async def send_message(is_test: bool = False):
 if __name__ == "__main__":
     logger.info("Batch started")
     init_database()  # db 초기화
+    migrate_csv_history()  # 기존 CSV 데이터 이관 (최초 1회)
     data_collect()  # 데이터 수집
     logger.info("Data collection completed")
 
@@ -227,4 +283,11 @@ if __name__ == "__main__":
         logger.info("Message created")
         asyncio.run(send_message(is_test=False))  # 메시지 송신
         logger.info("Message sent")
+    api_quota.flush()
+    logger.info(f"[quota] {api_quota.summary()}")
+    http_cache.close()
+    llm_cache.close()
+    close_connections()
+    if recorder.mode != "off":
+        logger.info(f"[replay] {recorder.summary()}")
     logger.info("Batch completed")
@@ -0,0 +1,180 @@
+"""
+벤치마크용 합성 블로그/카페/뉴스 글.
+
+실제 수집 키워드(batch/*/keywords.py)와 흔한 한국어 단어를 섞어 제목/요약을 만들고,
+빈 제목, 빈/잘못된 날짜, 키워드 반복, 같은 글의 다른 URL 표기(m., utm_*)를 일정 비율로 넣음.
+같은 (n, seed)면 항상 같은 데이터.
+"""
+
+import json
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from batch.issue.keywords import CARD_PRODUCTS, ISSUE_KEYWORDS
+from batch.narasarang.keywords import COMPARE_ARMY_KEYWORDS
+from batch.product.keywords import CARD_COMPANIES
+from batch.security_monitor import keywords as security_keywords
+from batch.travellog.keywords import (
+    TRAVELLOG_ADDTIONAL_KEYWORDS,
+    TRAVELLOG_ISSUE_KEYWORDS,
+    TRAVELLOG_PRODUCT_KEYWORDS,
+)
+
+FILLER: list[str] = [
+    "오늘",
+    "후기",
+    "여행",
+    "일본",
+    "카페",
+    "추천",
+    "정리",
+    "공유",
+    "혜택",
+    "이벤트",
+    "발급",
+    "결제",
+    "환율",
+    "공항",
+    "호텔",
+    "맛집",
+    "질문이",
+    "있어요",
+    "했는데",
+    "그리고",
+    "진짜",
+    "ㅠㅠ",
+    "ㅋㅋ",
+]
+KEYWORDS: list[str] = list(
+    dict.fromkeys(
+        k
+        for k in CARD_PRODUCTS
+        + ISSUE_KEYWORDS
+        + TRAVELLOG_PRODUCT_KEYWORDS
+        + TRAVELLOG_ADDTIONAL_KEYWORDS
+        + TRAVELLOG_ISSUE_KEYWORDS
+        + security_keywords.ISSUE_KEYWORDS
+        + security_keywords.PRODUCT_KEYWORDS
+        + CARD_COMPANIES
+        + [k for g in COMPARE_ARMY_KEYWORDS for k in g["keywords"]]
+        if k
+    )
+)
+SOURCES: list[str] = ["blog", "cafe", "news"]
+SOURCE_WEIGHTS: list[float] = [0.45, 0.35, 0.2]
+_HOSTS: dict[str, str] = {
+    "blog": "https://blog.naver.com/user{}/2230{}",
+    "cafe": "https://cafe.naver.com/travel{}/{}",
+    "news": "https://n.news.naver.com/mnews/article/0{}/000{}",
+}
+
+
+def _texts(rng: np.random.Generator, n: int, words: int, keyword_ratio: float):
+    vocab = np.array(KEYWORDS + FILLER)
+    p = np.r_[
+        np.full(len(KEYWORDS), keyword_ratio / len(KEYWORDS)),
+        np.full(len(FILLER), (1 - keyword_ratio) / len(FILLER)),
+    ]
+    picks = rng.choice(vocab, size=(n, words), p=p)
+    texts = [" ".join(row) for row in picks]
+    # 5%는 키워드 하나를 3번 이상 이어 붙인 도배 글
+    for i in np.flatnonzero(rng.random(n) < 0.05):
+        texts[i] += " " + str(rng.choice(KEYWORDS)) * int(rng.integers(3, 5))
+    return texts
+
+
+def _dates(
+    rng: np.random.Generator,
+    n: int,
+    today: datetime,
+    empty_ratio: float,
+    invalid_ratio: float = 0.0,
+):
+    days = [(today - timedelta(days=d)).strftime("%Y%m%d") for d in range(60)]
+    values = np.array(days, dtype=object)[rng.integers(0, len(days), size=n)]
+    kind = rng.random(n)
+    values[kind < empty_ratio] = ""
+    values[(kind >= empty_ratio) & (kind < empty_ratio + invalid_ratio)] = "2024-13-01"
+    return values.tolist()
+
+
+@lru_cache(maxsize=8)
+def make_corpus(n: int, seed: int = 0, today: datetime | None = None) -> pd.DataFrame:
+    """dml.COMMON_COLS 컬럼의 미게시 수집 글 n개 (캐시되므로 수정하지 말 것)"""
+    rng = np.random.default_rng(seed)
+    today = today or datetime.today()
+    sources = rng.choice(SOURCES, size=n, p=SOURCE_WEIGHTS)
+    titles = _texts(rng, n, 5, keyword_ratio=0.3)
+    for i in np.flatnonzero(rng.random(n) < 0.02):
+        titles[i] = ""
+    urls = [_HOSTS[s].format(i % 997, i) for i, s in enumerate(sources)]
+    # 1%는 같은 글의 다른 URL 표기
+    for i in np.flatnonzero(rng.random(n) < 0.01)[1:]:
+        urls[i] = urls[i - 1].replace("https://", "https://m.") + "?utm_source=x"
+    return pd.DataFrame(
+        {
+            "query": rng.choice(KEYWORDS, size=n),
+            "title": titles,
+            "url": urls,
+            "description": _texts(rng, n, 30, keyword_ratio=0.15),
+            "post_date": _dates(rng, n, today, empty_ratio=0.3, invalid_ratio=0.01),
+            "scrap_date": _dates(rng, n, today, empty_ratio=0.0),
+            "source": sources,
+            "name": [f"작성자{i % 5000}" for i in range(n)],
+            "is_posted": (rng.random(n) < 0.1).astype(int),
+        }
+    )
+
+
+def make_search_response(n: int, source: str, seed: int = 0) -> bytes:
+    """네이버 검색 API(blog/cafe/news) 응답 본문 JSON, 검색어 부분은 <b> 태그로 감쌈"""
+    df = make_corpus(n, seed)
+    bold = [t.replace(q, f"<b>{q}</b>") for t, q in zip(df["title"], df["query"])]
+    common = {"title": bold, "link": df["url"], "description": df["description"]}
+    if source == "blog":
+        extra = {
+            "bloggername": df["name"],
+            "bloggerlink": "https://blog.naver.com/user",
+            "postdate": df["post_date"],
+        }
+    elif source == "cafe":
+        extra = {"cafename": df["name"], "cafeurl": "https://cafe.naver.com/travel"}
+    else:
+        pub = pd.to_datetime(df["scrap_date"], format="%Y%m%d").dt.strftime(
+            "%a, %d %b %Y 09:30:00 +0900"
+        )
+        extra = {"originallink": df["url"], "pubDate": pub}
+    items = pd.DataFrame({**common, **extra}).to_dict(orient="records")
+    body = {
+        "lastBuildDate": "Mon, 02 Jan 2026 10:00:00 +0900",
+        "total": n,
+        "start": 1,
+        "display": n,
+        "items": items,
+    }
+    return json.dumps(body, ensure_ascii=False).encode()
+
+
+def make_messages(n: int, seed: int = 0) -> list[str]:
+    """LLM이 만든 형태의 "제목/내용/링크" 메시지 (make_flexible_payload 입력)"""
+    df = make_corpus(n, seed)
+    return [
+        f'제목: "{t or "제목 없음"}"\n내용: "{d}"\n링크: {u}'
+        for t, d, u in zip(df["title"], df["description"], df["url"])
+    ]
+
+
+def make_post_items(n: int, seed: int = 0) -> list[dict[str, str | None]]:
+    """YYYYMMDD와 RFC 2822 pubDate가 섞인 나라사랑 후보 글 (filter_recent_days 입력)"""
+    df = make_corpus(n, seed)
+    rfc = pd.to_datetime(df["scrap_date"], format="%Y%m%d").dt.strftime(
+        "%a, %d %b %Y 09:30:00 +0900"
+    )
+    post_dates = np.where(df["source"] == "news", rfc, df["post_date"])
+    return [
+        {"title": t, "url": u, "description": d, "post_date": p}
+        for t, u, d, p in zip(df["title"], df["url"], df["description"], post_dates)
+    ]
@@ -0,0 +1,100 @@
+"""
+extract_high_score_data: source별로 따로 점수 매기고 전체 정렬하던 기존 방식과
+한 번 점수 매기고 source별 top-k(argpartition)만 고르는 방식의 결과 일치 확인 및 속도 비교.
+
+    python -m benchmarks.extract [--sizes 10000 100000 1000000] [--count 20] [--table issue]
+
+두 방식 모두 수집 시 저장한 점수 재료(SCORE_COLS)가 있는 상태에서 측정.
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from batch.scorer import (
+    SCORE_KEYWORDS,
+    VectorizedFeedbackScorer,
+    extract_high_score_data,
+)
+from benchmarks.corpus import make_corpus
+
+
+def make_candidates(
+    n: int, table: str = "issue", seed: int = 0, today: datetime | None = None
+):
+    """make_corpus 글에 table 키워드로 계산한 저장된 점수 재료를 붙인 후보 글"""
+    df = make_corpus(n, seed=seed, today=today)
+    scorer = VectorizedFeedbackScorer(*SCORE_KEYWORDS[table])
+    components = scorer.keyword_components(
+        df["title"].tolist(), df["description"].tolist()
+    )
+    return df.assign(**components, score_key=scorer.score_key)
+
+
+def reference_extract(
+    data: pd.DataFrame,
+    issue_keywords: list[str],
+    product_keywords: list[str],
+    extracted_data_count: int,
+) -> pd.DataFrame:
+    """기존 extract_high_score_data (source마다 apply_scores, 전체 정렬 후 slice)"""
+    scorer = VectorizedFeedbackScorer(issue_keywords, product_keywords)
+    _data = data.loc[data["is_posted"] == 0]
+    picked = []
+    for source, date_col, count in [
+        ("blog", "post_date", extracted_data_count // 2),
+        ("cafe", "scrap_date", extracted_data_count // 2),
+        ("news", "scrap_date", extracted_data_count),
+    ]:
+        part = scorer.apply_scores(_data.loc[_data["source"] == source])
+        part = (
+            part.loc[part["total_score"] > 0]
+            .sort_values([date_col, "total_score"], ascending=[False, False])
+            .iloc[: min(count, len(part))]
+        )
+        picked.append(part)
+    return pd.concat(picked, ignore_index=True)
+
+
+def _timed(func, *args) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run(sizes: list[int], count: int, table: str = "issue") -> list[dict]:
+    results: list[dict] = []
+    for n in sizes:
+        df = make_candidates(n, table, today=datetime.today())
+        args = (df, *SCORE_KEYWORDS[table], count)
+        old_s, old = _timed(reference_extract, *args)
+        new_s, new = _timed(extract_high_score_data, *args)
+        if old["url"].tolist() != new["url"].tolist():
+            raise AssertionError(f"selection mismatch: n={n}")
+        if old["total_score"].tolist() != new["total_score"].tolist():
+            raise AssertionError(f"total_score mismatch: n={n}")
+        results.append({"n": n, "sort_s": old_s, "top_k_s": new_s})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--table", choices=list(SCORE_KEYWORDS), default="issue")
+    args = parser.parse_args()
+
+    print(f"{'n':>10}{'sort(s)':>12}{'top-k(s)':>12}{'speedup':>10}")
+    for r in run(args.sizes, args.count, args.table):
+        print(
+            f"{r['n']:>10}{r['sort_s']:>12.3f}{r['top_k_s']:>12.3f}"
+            f"{r['sort_s'] / r['top_k_s']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
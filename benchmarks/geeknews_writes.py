@@ -0,0 +1,120 @@
+"""
+GeekNews 저장/게시 처리의 건별 vs 일괄 비용 비교.
+
+    python -m benchmarks.geeknews_writes [--sizes 1000 10000]
+
+임시 디렉터리에 jupjup.db를 새로 만들어 측정하므로 실제 DB는 건드리지 않음.
+- insert/connect_per_item: 건마다 sqlite3.connect + commit (이전 방식)
+- insert/per_item: 공유 연결에서 건마다 트랜잭션 (save_news_item)
+- insert/bulk: executemany 한 트랜잭션 (save_news_items)
+- posted/per_id, posted/bulk: update_posted_status 반복 vs update_posted_statuses
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+
+from batch.database import DB_PATH, close_connections, get_connection, init_database
+from batch.geeknews.gpt_rank import GeekNewsItem
+from batch.geeknews.load import INSERT_SQL, _row, save_news_item, save_news_items
+from batch.geeknews.make_message import update_posted_status, update_posted_statuses
+
+
+def make_items(n: int, prefix: str) -> list[GeekNewsItem]:
+    return [
+        GeekNewsItem(
+            title=f"title {i}",
+            url=f"https://news.hada.io/topic?id={prefix}{i}",
+            content="content " * 40,
+            rule_score=float(i % 7),
+            gpt_score=float(i % 100),
+            topic="보안",
+        )
+        for i in range(n)
+    ]
+
+
+def _insert_connect_per_item(items: list[GeekNewsItem]) -> None:
+    for it in items:
+        with sqlite3.connect(DB_PATH) as conn:
+            conn.execute(INSERT_SQL, _row(it))
+            conn.commit()
+
+
+def _insert_per_item(items: list[GeekNewsItem]) -> None:
+    for it in items:
+        save_news_item(it)
+
+
+def _ids(prefix: str) -> list[int]:
+    sql = "SELECT id FROM geeknews WHERE url LIKE ?"
+    pattern = f"https://news.hada.io/topic?id={prefix}%"
+    return [row[0] for row in get_connection().execute(sql, (pattern,))]
+
+
+def _update_per_id(ids: list[int]) -> None:
+    for id in ids:
+        update_posted_status(str(id))
+
+
+def _timed(func: Callable, arg) -> float:
+    start = time.perf_counter()
+    func(arg)
+    return time.perf_counter() - start
+
+
+def run(sizes: list[int]) -> list[dict]:
+    inserts: dict[str, Callable[[list[GeekNewsItem]], object]] = {
+        "connect_per_item": _insert_connect_per_item,
+        "per_item": _insert_per_item,
+        "bulk": save_news_items,
+    }
+    updates: dict[str, Callable[[list[int]], object]] = {
+        "per_id": _update_per_id,
+        "bulk": update_posted_statuses,
+    }
+    results: list[dict] = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            init_database()
+            for n in sizes:
+                for name, func in inserts.items():
+                    prefix = f"{n}-{name}-"
+                    seconds = _timed(func, make_items(n, prefix))
+                    results.append({"case": f"insert/{name}", "n": n, "s": seconds})
+                for name, func in updates.items():
+                    # 같은 크기의 일괄 insert 결과를 대상으로 게시 처리
+                    prefix = f"{n}-bulk-"
+                    get_connection().execute(
+                        "UPDATE geeknews SET is_posted = 0 WHERE url LIKE ?",
+                        (f"https://news.hada.io/topic?id={prefix}%",),
+                    )
+                    seconds = _timed(func, _ids(prefix))
+                    results.append({"case": f"posted/{name}", "n": n, "s": seconds})
+        finally:
+            close_connections()
+            os.chdir(cwd)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+    print(f"{'case':<26}{'n':>8}{'total(ms)':>12}{'per item(us)':>14}")
+    for r in results:
+        print(
+            f"{r['case']:<26}{r['n']:>8}{r['s'] * 1000:>12.1f}"
+            f"{r['s'] / r['n'] * 1e6:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+KeywordMatcher(Aho-Corasick)와 키워드마다 `in`/`str.count`를 반복하는 방식의 결과 일치 확인 및 속도 비교.
+
+    python -m benchmarks.matcher [--docs 20000] [--keywords 10 100 1000]
+
+겹치는 키워드("aa"), 대소문자, 공백 차이가 섞인 합성 데이터로 has_any/hits/count가
+기존 방식과 같은지 확인한 뒤, 키워드 수를 늘려 가며 글 전체를 훑는 시간을 출력.
+"""
+
+import argparse
+import re
+import time
+
+import numpy as np
+
+from batch.matcher import KeywordMatcher
+
+SYLLABLES: list[str] = list("가나다라마바사아자차카타파하") + ["aa", "AI", "Kb", " "]
+
+
+def make_texts(n: int, length: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(np.array(SYLLABLES), size=(n, length))
+    return ["".join(row) for row in picks]
+
+
+def make_keywords(n: int, seed: int = 1) -> list[str]:
+    rng = np.random.default_rng(seed)
+    base = ["aa", "aaa", "ai", "kb", "가나", "나 다", "다라마"]
+    sizes = rng.integers(2, 5, size=max(0, n - len(base)))
+    syllables = np.array(SYLLABLES[:14])
+    return base + ["".join(rng.choice(syllables, size=s)) for s in sizes]
+
+
+def _check(texts: list[str], keywords: list[str]) -> None:
+    plain = KeywordMatcher(keywords)
+    folded = KeywordMatcher(keywords, ignore_case=True)
+    spaced = KeywordMatcher(keywords, ignore_space=True)
+    squeezed_keywords = [re.sub(r"\s+", "", k) for k in keywords]
+    for t in texts:
+        lower = t.lower()
+        squeezed = re.sub(r"\s+", "", t)
+        expected = {
+            "has_any": any(k in t for k in keywords),
+            "hits": {k for k in keywords if k in t},
+            "count": sum(t.count(k) for k in keywords),
+            "hits(ignore_case)": {k for k in keywords if k.lower() in lower},
+            "has_any(ignore_space)": any(
+                k and k in squeezed for k in squeezed_keywords
+            ),
+        }
+        actual = {
+            "has_any": plain.has_any(t),
+            "hits": plain.hits(t),
+            "count": plain.count(t),
+            "hits(ignore_case)": folded.hits(t),
+            "has_any(ignore_space)": spaced.has_any(t),
+        }
+        if actual != expected:
+            raise AssertionError(f"mismatch for {t!r}: {actual} != {expected}")
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(docs: int, keyword_sizes: list[int]) -> list[dict]:
+    texts = make_texts(docs, length=200)
+    _check(texts[:2000], make_keywords(50))
+
+    results: list[dict] = []
+    for k in keyword_sizes:
+        keywords = make_keywords(k)
+        matcher = KeywordMatcher(keywords)
+        results.append(
+            {
+                "keywords": k,
+                "loop_s": _timed(
+                    lambda: [sum(t.count(kw) for kw in keywords) for t in texts]
+                ),
+                "matcher_s": _timed(lambda: [matcher.count(t) for t in texts]),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--keywords", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'keywords':>10}{'loop(s)':>12}{'matcher(s)':>12}{'speedup':>10}")
+    for r in run(args.docs, args.keywords):
+        print(
+            f"{r['keywords']:>10}{r['loop_s']:>12.3f}{r['matcher_s']:>12.3f}"
+            f"{r['loop_s'] / r['matcher_s']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
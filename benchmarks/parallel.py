@@ -0,0 +1,56 @@
+"""
+VectorizedFeedbackScorer의 키워드 스캔을 프로세스 풀로 나눠 계산할 때의 결과 일치 확인 및 속도 비교.
+
+    python -m benchmarks.parallel [--sizes 200000 1000000] [--workers 8] [--table issue]
+
+저장된 점수 재료가 없는 글(기존 data.csv 이관 직후, 키워드 변경 직후)을 단일 프로세스와
+worker 여러 개로 점수 매겨 total_score가 모두 같은지 확인. percentile은 두 경우 모두 전체 분포로 계산.
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime
+
+from batch.scorer import SCORE_KEYWORDS, VectorizedFeedbackScorer
+from benchmarks.corpus import make_corpus
+
+
+def run(sizes: list[int], workers: int, table: str = "issue") -> list[dict]:
+    today = datetime.today()
+    keywords = SCORE_KEYWORDS[table]
+    serial = VectorizedFeedbackScorer(*keywords, workers=1)
+    parallel = VectorizedFeedbackScorer(*keywords, workers=workers, parallel_min_rows=0)
+    results: list[dict] = []
+    for n in sizes:
+        df = make_corpus(n, today=today)
+        start = time.perf_counter()
+        expected = serial.apply_scores(df, today)
+        serial_s = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = parallel.apply_scores(df, today)
+        parallel_s = time.perf_counter() - start
+        if not actual["total_score"].equals(expected["total_score"]):
+            raise AssertionError(f"total_score mismatch: n={n}, workers={workers}")
+        results.append({"n": n, "serial_s": serial_s, "parallel_s": parallel_s})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200_000, 1_000_000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--table", choices=list(SCORE_KEYWORDS), default="issue")
+    args = parser.parse_args()
+
+    print(f"workers={args.workers}")
+    print(f"{'n':>10}{'serial(s)':>12}{'parallel(s)':>13}{'speedup':>10}")
+    for r in run(args.sizes, args.workers, args.table):
+        print(
+            f"{r['n']:>10}{r['serial_s']:>12.3f}{r['parallel_s']:>13.3f}"
+            f"{r['serial_s'] / r['parallel_s']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
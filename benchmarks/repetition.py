@@ -0,0 +1,109 @@
+"""
+반복 키워드 검출: 키워드마다 정규식을 만들어 돌리던 기존 방식과
+FeedbackScorer.repetition_matcher(3번 이어 붙인 키워드의 automaton 하나)의 결과 일치 확인 및 속도 비교.
+
+    python -m benchmarks.repetition [--docs 5000] [--lengths 200 2000 10000]
+
+issue 메시지 키워드(ISSUE_KEYWORDS + CARD_PRODUCTS)로 긴 카페 본문을 흉내 낸 합성 글을 만들고,
+일부 글에만 키워드를 3번 이상 이어 붙여 두 방식이 같은 글을 고르는지 확인.
+"""
+
+import argparse
+import re
+import time
+
+import numpy as np
+
+from batch.issue.keywords import CARD_PRODUCTS, ISSUE_KEYWORDS
+from batch.scorer import FeedbackScorer
+
+FILLER: list[str] = [
+    "후기",
+    "여행",
+    "일본",
+    "카페",
+    "오늘",
+    "추천",
+    "정리",
+    "공유",
+    "ㅋㅋ",
+]
+
+
+def make_descriptions(
+    n: int, length: int, keywords: list[str], seed: int = 0
+) -> list[str]:
+    """length 글자 안팎의 글, 5%는 키워드 하나를 3~4번 연달아 붙임"""
+    rng = np.random.default_rng(seed)
+    vocab = np.array(keywords + FILLER * 4)
+    words = max(1, length // 4)
+    out: list[str] = []
+    for _ in range(n):
+        text = " ".join(rng.choice(vocab, size=words))
+        if rng.random() < 0.05:
+            text += " " + str(rng.choice(keywords)) * int(rng.integers(3, 5))
+        out.append(text)
+    return out
+
+
+def per_keyword_repetition(keywords: list[str], text: str) -> int:
+    """기존 score_by_repetition (키워드마다 re.search, 패턴은 re 모듈 캐시에 의존)"""
+    for kw in keywords:
+        if re.search(rf"({re.escape(kw)})\1{{2,}}", text):
+            return -1
+    return 0
+
+
+def _timed(func) -> tuple[float, list[int]]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def run(docs: int, lengths: list[int]) -> list[dict]:
+    scorer = FeedbackScorer(ISSUE_KEYWORDS, CARD_PRODUCTS)
+    keywords = scorer.all_keywords
+    results: list[dict] = []
+    for length in lengths:
+        texts = make_descriptions(docs, length, keywords)
+        loop_s, expected = _timed(
+            lambda: [per_keyword_repetition(keywords, t) for t in texts]
+        )
+        single_s, actual = _timed(
+            lambda: [scorer.score_by_repetition(t) for t in texts]
+        )
+        if actual != expected:
+            mismatch = sum(a != e for a, e in zip(actual, expected))
+            raise AssertionError(f"repetition mismatch: length={length}, {mismatch}")
+        results.append(
+            {
+                "length": length,
+                "keywords": len(keywords),
+                "repeated": -sum(actual),
+                "per_keyword_s": loop_s,
+                "single_s": single_s,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=5_000)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[200, 2000, 10000])
+    args = parser.parse_args()
+
+    print(
+        f"{'length':>8}{'keywords':>10}{'repeated':>10}"
+        f"{'per-kw(s)':>12}{'single(s)':>12}{'speedup':>10}"
+    )
+    for r in run(args.docs, args.lengths):
+        print(
+            f"{r['length']:>8}{r['keywords']:>10}{r['repeated']:>10}"
+            f"{r['per_keyword_s']:>12.3f}{r['single_s']:>12.3f}"
+            f"{r['per_keyword_s'] / r['single_s']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+FeedbackScorer(행 단위 apply)와 VectorizedFeedbackScorer의 결과 일치 확인 및 속도 비교.
+
+    python -m benchmarks.scorer [--sizes 10000 100000 1000000] [--reference-max 100000] [--table issue]
+
+benchmarks.corpus 합성 글과 실제 테이블 키워드(SCORE_KEYWORDS)로 키워드 점수가 원래 정의(키워드마다 in/str.count/정규식)와 같은지,
+두 구현의 total_score가 모든 행에서 같은지 확인하고 소요 시간을 출력.
+stored(s)는 수집 시 저장한 점수 재료(SCORE_COLS)로 날짜 점수와 percentile만 계산하는 경우.
+기존 구현은 느리므로 --reference-max 보다 큰 크기에서는 벡터화 구현만 측정.
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from batch.scorer import SCORE_KEYWORDS, FeedbackScorer, VectorizedFeedbackScorer
+from benchmarks.corpus import make_corpus
+
+
+def check_keyword_scores(
+    texts: list[str], issue_keywords: list[str], product_keywords: list[str]
+) -> None:
+    """키워드 점수가 키워드마다 `in`/str.count/정규식을 돌리던 원래 정의와 같은지 확인"""
+    scorer = FeedbackScorer(issue_keywords, product_keywords)
+    for t in texts:
+        expected = (
+            int(any(kw in t for kw in product_keywords)),
+            sum(t.count(kw) for kw in issue_keywords),
+            -1
+            if any(
+                re.search(rf"({re.escape(kw)})\1{{2,}}", t)
+                for kw in scorer.all_keywords
+            )
+            else 0,
+        )
+        actual = (
+            scorer.calculate_product_score(t),
+            scorer.calculate_issue_score(t),
+            scorer.score_by_repetition(t),
+        )
+        if actual != expected:
+            raise AssertionError(f"keyword score mismatch for {t!r}: {actual}")
+
+
+def _timed(func, *args) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run(sizes: list[int], reference_max: int, table: str = "issue") -> list[dict]:
+    today = datetime.today()
+    reference = FeedbackScorer(*SCORE_KEYWORDS[table])
+    vectorized = VectorizedFeedbackScorer(*SCORE_KEYWORDS[table])
+    sample = make_corpus(2_000, seed=1, today=today)["description"].tolist()
+    # 트래블로그 issue 키워드에는 빈 문자열이 들어 있음
+    for issue_keywords, product_keywords in SCORE_KEYWORDS.values():
+        check_keyword_scores(sample, issue_keywords, product_keywords)
+
+    results: list[dict] = []
+    for n in sizes:
+        df = make_corpus(n, today=today)
+        fast_s, fast = _timed(vectorized.apply_scores, df, today)
+        # 수집 시 저장해 둔 점수 재료(SCORE_COLS)가 있을 때: 날짜 점수와 percentile만 계산
+        stored_df = df.assign(
+            **vectorized.keyword_components(
+                df["title"].fillna("").tolist(), df["description"].tolist()
+            ),
+            score_key=vectorized.score_key,
+        )
+        stored_s, stored = _timed(vectorized.apply_scores, stored_df, today)
+        if not stored["total_score"].equals(fast["total_score"]):
+            raise AssertionError(f"stored components mismatch: n={n}")
+        row: dict = {
+            "n": n,
+            "vectorized_s": fast_s,
+            "stored_s": stored_s,
+            "reference_s": None,
+        }
+        if n <= reference_max:
+            slow_s, slow = _timed(reference.apply_scores, df)
+            mismatch = int((slow["total_score"] != fast["total_score"]).sum())
+            if mismatch:
+                raise AssertionError(f"total_score mismatch: n={n}, rows={mismatch}")
+            row["reference_s"] = slow_s
+        results.append(row)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--reference-max", type=int, default=100_000)
+    parser.add_argument("--table", choices=list(SCORE_KEYWORDS), default="issue")
+    args = parser.parse_args()
+
+    print(
+        f"{'n':>10}{'apply(s)':>12}{'vectorized(s)':>15}{'speedup':>10}{'stored(s)':>12}"
+    )
+    for r in run(args.sizes, args.reference_max, args.table):
+        slow = r["reference_s"]
+        print(
+            f"{r['n']:>10}"
+            f"{(f'{slow:.3f}' if slow else '-'):>12}"
+            f"{r['vectorized_s']:>15.3f}"
+            f"{(f'{slow / r["vectorized_s"]:.1f}x' if slow else '-'):>10}"
+            f"{r['stored_s']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+배치 주요 경로의 규모별 소요 시간 측정과 회귀 검사.
+
+    python -m benchmarks.suite [--sizes 1000 10000 100000 1000000] [--cases scorer dml]
+                               [--output result.json] [--baseline old.json --threshold 0.25]
+
+합성 글(benchmarks.corpus)로 case마다 크기별 소요 시간(repeat 중 최솟값)을 재고 JSON으로 저장.
+--baseline을 주면 같은 (case, n)의 시간이 threshold 비율 이상 느려진 항목을 출력하고 exit code 1.
+DB case는 임시 디렉터리에 jupjup.db를 새로 만들어 측정하므로 실제 DB는 건드리지 않음.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, NamedTuple
+
+import pandas as pd
+
+from batch.database import close_connections, get_connection, init_database
+from batch.dml import COMMON_COLS, fetch_df, insert_rows, mark_posted
+from batch.models.response import BlogResponse, NewsResponse
+from batch.narasarang.gpt_rank import filter_recent_days
+from batch.scorer import (
+    SCORE_COLS,
+    SCORE_KEYWORDS,
+    FeedbackScorer,
+    VectorizedFeedbackScorer,
+    extract_high_score_data,
+    get_scorer,
+)
+from benchmarks.corpus import (
+    make_corpus,
+    make_messages,
+    make_post_items,
+    make_search_response,
+)
+from bot.services.batch_message.get_message import make_flexible_payload
+
+RESULT_DIR: str = os.path.join("data", "benchmarks")
+# 이보다 짧은 측정값의 차이는 잡음으로 보고 회귀 검사에서 제외
+NOISE_FLOOR_S: float = 0.005
+
+
+class Case(NamedTuple):
+    """setup(n)은 측정하지 않고, setup이 돌려준 함수를 호출하는 시간만 측정"""
+
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    max_n: int = 10**6
+    repeat: int = 3
+
+
+def _issue_scorer() -> VectorizedFeedbackScorer:
+    scorer = get_scorer("issue")
+    assert scorer is not None
+    return scorer
+
+
+def _scored_frame(n: int) -> pd.DataFrame:
+    """수집 시 저장한 점수 재료(SCORE_COLS)가 붙은 issue 후보 글"""
+    df = make_corpus(n)
+    scorer = _issue_scorer()
+    components = scorer.keyword_components(
+        df["title"].tolist(), df["description"].tolist()
+    )
+    return df.assign(**components, score_key=scorer.score_key)
+
+
+def _rows(n: int) -> list[dict]:
+    return make_corpus(n)[COMMON_COLS].to_dict(orient="records")
+
+
+def _fill_issue(n: int) -> None:
+    """issue 테이블을 크기 n의 합성 글로 맞춤"""
+    conn = get_connection()
+    if conn.execute("SELECT COUNT(*) FROM issue").fetchone()[0] != n:
+        conn.execute("DELETE FROM issue")
+        insert_rows("issue", _rows(n))
+
+
+def _insert_rows(n: int) -> Callable[[], Any]:
+    get_connection().execute("DELETE FROM issue")
+    rows = _rows(n)
+    return lambda: insert_rows("issue", rows)
+
+
+def _fetch_df(n: int) -> Callable[[], Any]:
+    _fill_issue(n)
+    return lambda: fetch_df("issue", COMMON_COLS + SCORE_COLS, unposted=True)
+
+
+def _mark_posted(n: int) -> Callable[[], Any]:
+    _fill_issue(n)
+    get_connection().execute("UPDATE issue SET is_posted = 0")
+    urls = make_corpus(n)["url"].iloc[:: max(1, n // 1000)].tolist()
+    return lambda: mark_posted("issue", urls)
+
+
+def _reference_scores(n: int) -> Callable[[], Any]:
+    scorer = FeedbackScorer(*SCORE_KEYWORDS["issue"])
+    df = make_corpus(n)
+    return lambda: scorer.apply_scores(df)
+
+
+def _vectorized_scores(n: int) -> Callable[[], Any]:
+    df = make_corpus(n)
+    return lambda: _issue_scorer().apply_scores(df)
+
+
+def _stored_scores(n: int) -> Callable[[], Any]:
+    df = _scored_frame(n)
+    return lambda: _issue_scorer().apply_scores(df)
+
+
+def _extract(n: int) -> Callable[[], Any]:
+    df = _scored_frame(n)
+    return lambda: extract_high_score_data(df, *SCORE_KEYWORDS["issue"], 100)
+
+
+def _decode(
+    model: type[BlogResponse | NewsResponse], source: str
+) -> Callable[[int], Callable[[], Any]]:
+    def setup(n: int) -> Callable[[], Any]:
+        raw = make_search_response(n, source)
+        return lambda: model.decode(raw).to_items("query", "20260101")
+
+    return setup
+
+
+def _flexible_payload(n: int) -> Callable[[], Any]:
+    messages = make_messages(n)
+    return lambda: make_flexible_payload(messages)
+
+
+def _filter_recent_days(n: int) -> Callable[[], Any]:
+    items = make_post_items(n)
+    return lambda: filter_recent_days(items, days=7)
+
+
+CASES: list[Case] = [
+    Case("scorer/reference", _reference_scores, max_n=10**5, repeat=1),
+    Case("scorer/vectorized", _vectorized_scores),
+    Case("scorer/stored", _stored_scores),
+    Case("scorer/extract_high_score_data", _extract),
+    Case("dml/insert_rows", _insert_rows, repeat=1),
+    Case("dml/fetch_df", _fetch_df),
+    Case("dml/mark_posted", _mark_posted),
+    Case("response/blog.to_items", _decode(BlogResponse, "blog")),
+    Case("response/news.to_items", _decode(NewsResponse, "news")),
+    Case("payload/make_flexible_payload", _flexible_payload),
+    Case("narasarang/filter_recent_days", _filter_recent_days),
+]
+
+
+def _measure(case: Case, n: int) -> float:
+    best = float("inf")
+    for _ in range(case.repeat):
+        func = case.setup(n)
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: list[int], prefixes: list[str] | None = None) -> list[dict]:
+    cases = [
+        c for c in CASES if not prefixes or any(c.name.startswith(p) for p in prefixes)
+    ]
+    results: list[dict] = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            init_database()
+            for n in sizes:
+                for case in cases:
+                    if n > case.max_n:
+                        continue
+                    seconds = _measure(case, n)
+                    results.append({"case": case.name, "n": n, "s": seconds})
+                    print(f"{case.name:<36}{n:>9}{seconds * 1000:>12.1f}ms", flush=True)
+        finally:
+            close_connections()
+            os.chdir(cwd)
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[dict]:
+    """baseline보다 threshold 비율 이상 느려진 (case, n)"""
+    before = {(r["case"], r["n"]): r["s"] for r in baseline}
+    regressions: list[dict] = []
+    for r in results:
+        old = before.get((r["case"], r["n"]))
+        if old is None or r["s"] - old < NOISE_FLOOR_S:
+            continue
+        if r["s"] > old * (1 + threshold):
+            regressions.append({**r, "baseline_s": old, "ratio": r["s"] / old})
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--cases", nargs="+", help="case 이름 prefix (예: scorer dml)")
+    parser.add_argument("--output", help=f"결과 JSON 경로 (기본: {RESULT_DIR}/)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.cases)
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        RESULT_DIR, f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"saved: {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['case']} n={r['n']}: "
+                f"{r['baseline_s'] * 1000:.1f}ms -> {r['s'] * 1000:.1f}ms "
+                f"({r['ratio']:.2f}x)"
+            )
+        if regressions:
+            sys.exit(1)
+        print(f"no regression above {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
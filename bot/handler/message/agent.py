@@ -1,10 +1,11 @@
 import json
 from typing import Literal
 
-from agents import Agent, WebSearchTool, function_tool
+from agents import Agent, Runner, WebSearchTool, function_tool
 
 from batch.fetch import fetch_data
 from bot.services.cafeteria.menu import CAFETERIA_MENU
+from replay import replayable
 
 
 @function_tool
@@ -43,3 +44,11 @@ agent = Agent(
         ),
     ],
 )
+AGENTS: dict[str, Agent] = {agent.name: agent}
+
+
+@replayable("agent_run")
+async def run_agent(input: str, agent_name: str = agent.name) -> str:
+    """agent 실행 결과(final_output). 녹화/재생 fixture는 agent 이름과 입력으로 구분"""
+    result = await Runner.run(AGENTS[agent_name], input)
+    return str(result.final_output)
@@ -2,13 +2,12 @@ import asyncio
 import re
 from typing import Callable, Literal
 
-from agents import Runner
 from fastapi.responses import JSONResponse
 
 from bot.enums.button_templates import JUPJUP_BUTTON, LAB_BUTTON, PRODUCT_BUTTON
 from bot.enums.default_messages import Message, NoneArgumentMessage
 from bot.enums.status import BotStatus
-from bot.handler.message.agent import agent
+from bot.handler.message.agent import run_agent
 from bot.services.batch_message.get_message import (
     get_batch_message,
     get_narasarang_batch_message,
@@ -402,8 +401,7 @@ async def handle_channel_message_event(text: str, channel_id: str) -> JSONRespon
 
     if text.startswith("!"):
         try:
-            result = await Runner.run(agent, text[1:].strip())
-            response = result.final_output
+            response = await run_agent(text[1:].strip())
             await async_post_message(response, channel_id)
         except Exception:
             response = Message.ERROR_REPLY.value
@@ -1,9 +1,8 @@
-from agents import Runner
 from fastapi.responses import JSONResponse
 
 from bot.enums.default_messages import Message
 from bot.enums.status import BotStatus
-from bot.handler.message.agent import agent
+from bot.handler.message.agent import run_agent
 from bot.services.core.post_payload import (
     async_post_message,
 )
@@ -12,8 +11,7 @@ from logger import logger
 
 async def handle_private_message_event(text: str, user_id: str) -> JSONResponse:
     try:
-        result = await Runner.run(agent, text)
-        response = result.final_output
+        response = await run_agent(text)
         await async_post_message(response, user_id, True)
     except Exception as e:
         logger.exception(f"handle private agent exception: {e}")
@@ -3,12 +3,21 @@ from cachetools import TTLCache
 from openai import APIConnectionError, AsyncOpenAI
 from retry import retry
 
+from batch.cache import llm_cache
 from logger import logger
+from replay import replayable
 from secret import OPENAI_API_KEY
 
 async_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+OPENAI_MODEL: str = "gpt-4o"
 
 
+def openai_cache_key(prompt: str, input: str) -> str:
+    """async_openai_response가 llm_cache에 응답을 저장하는 키"""
+    return llm_cache.make_text_key(OPENAI_MODEL, prompt, input)
+
+
+@replayable("openai_response", key_args=("prompt", "input"))
 async def async_openai_response(
     prompt: str,
     input: str,
@@ -16,7 +25,21 @@ async def async_openai_response(
     max_retries: int = 5,
     initial_delay: int = 1,
     backoff_factor: int = 2,
+    cache_ttl: int | None = None,
 ) -> str:
+    """
+    cache_ttl(초)을 주면 같은 (model, prompt, input)의 응답을 llm_cache에서 재사용.
+    None이면 캐시를 쓰지 않음 (대화형 봇 응답처럼 매번 새로 생성해야 하는 호출).
+    """
+    cache_key = None
+    if cache_ttl is not None and llm_cache.enabled:
+        cache_key = openai_cache_key(prompt, input)
+        cached = llm_cache.get(cache_key, ttl=cache_ttl)
+        if cached is not None:
+            return cached
+        if llm_cache.offline:
+            raise ConnectionError("[llm_cache] cache miss in cache-only mode")
+
     @retry(
         tries=max_retries,
         delay=initial_delay,
@@ -26,7 +49,7 @@ async def async_openai_response(
     async def _execute():
         try:
             response = await async_client.responses.create(
-                model="gpt-4o",
+                model=OPENAI_MODEL,
                 instructions=prompt,
                 input=input,
                 timeout=timeout,
@@ -39,11 +62,15 @@ async def async_openai_response(
             logger.error(f"Something wrong: {type(e).__name__} - {e}")
             raise
 
-    return await _execute()
+    result = await _execute()
+    if cache_key is not None and result:
+        llm_cache.set(cache_key, result, endpoint=OPENAI_MODEL)
+    return result
 
 
 @retry(tries=5, delay=1, backoff=2, exceptions=APIConnectionError)
 @cached(TTLCache(maxsize=100, ttl=3600))
+@replayable("openai_image")
 async def async_generate_image(prompt: str) -> str | None:
     response = await async_client.images.generate(
         model="dall-e-3",
@@ -5,12 +5,18 @@ from retry import retry
 
 from bot.utils.access_token import set_headers
 from logger import logger
+from replay import replayable
 
 CHANNEL_POST_URL = "https://www.worksapis.com/v1.0/bots/9881957/channels/{id}/messages"
 USER_POST_URL = "https://www.worksapis.com/v1.0/bots/9881957/users/{id}/messages"
 
 
+def _post_failed(name: str) -> None:
+    raise httpx.ConnectError(f"[replay] injected failure: {name}")
+
+
 @retry(tries=3, delay=1, backoff=2, exceptions=(httpx.RequestError, httpx.HTTPError))
+@replayable("works_post", fail=_post_failed, sink=True)
 async def async_post_payload(
     payload: dict[str, Any],
     id: str,
@@ -7,6 +7,7 @@ from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.responses import JSONResponse
 from uvicorn.config import LOGGING_CONFIG
 
+from batch.quota import api_quota
 from batch.variables import TEST_CHANNEL_ID
 from bot.handler.event import get_processed_event
 from bot.services.core.post_payload import async_post_message
@@ -20,6 +21,7 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
         yield
     finally:
         logger.info("줍줍이 서버 종료")
+        api_quota.flush()  # agent의 검색 호출을 배치와 공유하는 장부에 반영
         await async_post_message(
             f"줍줍이 종료: {datetime.now().isoformat()}",
             TEST_CHANNEL_ID,
@@ -0,0 +1,203 @@
+"""
+외부 API(네이버 검색/데이터랩, OpenAI, 네이버 웍스, Play Store) 응답을 fixture로 녹화하고
+네트워크 없이 재생하는 stand-in.
+
+환경 변수
+- JUPJUP_REPLAY: off(기본, 실제 호출) | record(실제 호출 + fixture 저장) | replay(fixture만 사용)
+- REPLAY_DIR: fixture 저장 위치 (기본 data/fixtures)
+- REPLAY_LATENCY_MS: 재생 시 호출마다 넣을 지연. "50" 또는 "20-200"(균등 분포)
+- REPLAY_ERROR_RATE: 재생 시 실패로 처리할 호출 비율 (0.0 ~ 1.0)
+- REPLAY_SEED: 지연/실패 주입 난수 seed (같은 seed면 같은 순서로 재현)
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from logger import logger
+
+REPLAY_MODES: tuple[str, ...] = ("off", "record", "replay")
+REPLAY_MODE: str = os.environ.get("JUPJUP_REPLAY", "off")
+REPLAY_DIR: str = os.environ.get("REPLAY_DIR", os.path.join("data", "fixtures"))
+REPLAY_LATENCY_MS: str = os.environ.get("REPLAY_LATENCY_MS", "0")
+REPLAY_ERROR_RATE: float = float(os.environ.get("REPLAY_ERROR_RATE", 0.0))
+REPLAY_SEED: int | None = (
+    int(os.environ["REPLAY_SEED"]) if os.environ.get("REPLAY_SEED") else None
+)
+
+if REPLAY_MODE not in REPLAY_MODES:
+    raise ValueError(f"JUPJUP_REPLAY must be one of {REPLAY_MODES}: {REPLAY_MODE}")
+
+
+class ReplayError(ConnectionError):
+    """재생 모드에서 주입된 실패 또는 fixture 없음"""
+
+
+def _parse_latency(spec: str) -> tuple[float, float]:
+    low, _, high = spec.partition("-")
+    low_ms = float(low or 0)
+    return low_ms / 1000, float(high or low_ms) / 1000
+
+
+def _identity(value: Any, arguments: dict[str, Any] | None = None) -> Any:
+    return value
+
+
+def _raise(name: str) -> Any:
+    raise ReplayError(f"[replay] injected failure: {name}")
+
+
+class Recorder:
+    """fixture 파일 입출력과 재생 시 지연/실패 주입"""
+
+    def __init__(
+        self,
+        mode: str = REPLAY_MODE,
+        root: str = REPLAY_DIR,
+        latency: str = REPLAY_LATENCY_MS,
+        error_rate: float = REPLAY_ERROR_RATE,
+        seed: int | None = REPLAY_SEED,
+    ):
+        self.mode = mode
+        self.root = root
+        self.latency = _parse_latency(latency)
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def make_key(arguments: dict[str, Any]) -> str:
+        normalized = json.dumps(
+            arguments, ensure_ascii=False, sort_keys=True, default=str
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()[:32]
+
+    def _path(self, name: str, key: str) -> str:
+        return os.path.join(self.root, name, f"{key}.json")
+
+    def save(self, name: str, arguments: dict[str, Any], result: Any) -> None:
+        path = self._path(name, self.make_key(arguments))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"name": name, "arguments": arguments, "result": result},
+                f,
+                ensure_ascii=False,
+                indent=2,
+                default=str,
+            )
+        self.stats[name]["recorded"] += 1
+
+    def load(self, name: str, arguments: dict[str, Any]) -> tuple[bool, Any]:
+        path = self._path(name, self.make_key(arguments))
+        if not os.path.exists(path):
+            logger.warning(f"[replay] fixture missing: {name} {arguments}")
+            self.stats[name]["missing"] += 1
+            return False, None
+        with open(path, encoding="utf-8") as f:
+            return True, json.load(f)["result"]
+
+    def delay(self) -> float:
+        low, high = self.latency
+        return self._random.uniform(low, high) if high > 0 else 0.0
+
+    def inject_error(self, name: str) -> bool:
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            self.stats[name]["injected_errors"] += 1
+            return True
+        return False
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        return {name: dict(counts) for name, counts in self.stats.items()}
+
+
+recorder = Recorder()
+
+
+def replayable(
+    name: str,
+    key_args: tuple[str, ...] | None = None,
+    encode: Callable[[Any], Any] = _identity,
+    decode: Callable[[Any, dict[str, Any]], Any] = _identity,
+    fail: Callable[[str], Any] = _raise,
+    sink: bool = False,
+) -> Callable:
+    """
+    외부 호출 함수를 녹화/재생 가능하게 감싸는 decorator (동기/비동기 함수 모두 지원).
+    - key_args: fixture 키에 쓸 인자 이름 (기본은 self를 뺀 전체 인자)
+    - encode/decode: 반환값 ↔ JSON 변환. decode는 호출 인자도 함께 받음
+    - fail: 주입된 실패나 fixture 없음일 때 호출. 원래 함수가 실패 시 돌려주는 값을
+      반환하거나 원래 함수와 같은 종류의 예외를 발생시킴
+    - sink: 메시지 전송처럼 응답이 필요 없는 호출. 재생 시 fixture 없이 성공 처리
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def _arguments(args: tuple, kwargs: dict) -> dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return {
+                k: v
+                for k, v in bound.arguments.items()
+                if k != "self" and (key_args is None or k in key_args)
+            }
+
+        def _replay(arguments: dict[str, Any]) -> Any:
+            if recorder.inject_error(name):
+                return fail(name)
+            if sink:
+                recorder.stats[name]["served"] += 1
+                return None
+            found, payload = recorder.load(name, arguments)
+            if not found:
+                return fail(name)
+            recorder.stats[name]["served"] += 1
+            return decode(payload, arguments)
+
+        def _record(arguments: dict[str, Any], result: Any) -> None:
+            recorder.save(name, arguments, None if sink else encode(result))
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if recorder.replaying:
+                    await asyncio.sleep(recorder.delay())
+                    return _replay(_arguments(args, kwargs))
+                result = await func(*args, **kwargs)
+                if recorder.recording:
+                    _record(_arguments(args, kwargs), result)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if recorder.replaying:
+                time.sleep(recorder.delay())
+                return _replay(_arguments(args, kwargs))
+            result = func(*args, **kwargs)
+            if recorder.recording:
+                _record(_arguments(args, kwargs), result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -2,22 +2,33 @@ import os
 
 from dotenv import load_dotenv
 
+from replay import REPLAY_MODE
+
 if os.path.exists(".env"):
     load_dotenv()
 
 
-CLIENT_ID = os.environ["CLIENT_ID"]
-CLIENT_SECRET = os.environ["CLIENT_SECRET"]
+def _env(name: str) -> str:
+    """재생 모드에서는 키 없이도 실행되도록 빈 문자열로 대체"""
+    if REPLAY_MODE == "replay":
+        return os.environ.get(name, "")
+    return os.environ[name]
+
+
+CLIENT_ID = _env("CLIENT_ID")
+CLIENT_SECRET = _env("CLIENT_SECRET")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
-WORKS_CLIENT_ID = os.environ["WORKS_CLIENT_ID"]
-WORKS_CLIENT_SECRET = os.environ["WORKS_CLIENT_SECRET"]
-SERVICE_ACCOUNT = os.environ["SERVICE_ACCOUNT"]
+if REPLAY_MODE == "replay" and not OPENAI_API_KEY:
+    OPENAI_API_KEY = "replay"  # 클라이언트 생성 시 키 검사만 통과하면 됨
+WORKS_CLIENT_ID = _env("WORKS_CLIENT_ID")
+WORKS_CLIENT_SECRET = _env("WORKS_CLIENT_SECRET")
+SERVICE_ACCOUNT = _env("SERVICE_ACCOUNT")
 
-_PRIVATE_KEY_PATH = os.environ["PRIVATE_KEY_PATH"]
+_PRIVATE_KEY_PATH = _env("PRIVATE_KEY_PATH")
 if _PRIVATE_KEY_PATH.endswith(".key"):
     with open(_PRIVATE_KEY_PATH, "r") as key_file:
         PRIVATE_KEY_PATH = key_file.read()
 else:
     PRIVATE_KEY_PATH = _PRIVATE_KEY_PATH
 
-BOT_SECRET = os.environ["BOT_SECRET"]
+BOT_SECRET = _env("BOT_SECRET")
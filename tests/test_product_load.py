@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from batch.database import close_connections, get_connection, init_database
+from batch.dml import insert_rows
+from batch.product import load
+from batch.scheduler import QueryScheduler
+
+STORED = "https://news.example.com/1"
+SHARED = "https://news.example.com/2"
+
+
+class FakeResponse:
+    def __init__(self, links: list[str]):
+        self.links = links
+
+    def to_items(self, query: str, scrap_date: str) -> list[dict[str, str]]:
+        return [
+            {
+                "query": query,
+                "title": link,
+                "link": link,
+                "description": "",
+                "post_date": scrap_date,
+                "scrap_date": scrap_date,
+            }
+            for link in self.links
+        ]
+
+
+def fake_fetch_many(responses: dict[str, FakeResponse]):
+    return lambda tasks: [responses[t["query"]] for t in tasks]
+
+
+class ProductYieldTest(unittest.TestCase):
+    """검색어별 수율은 insert 전에, 중복을 뺀 새 URL 수로 기록"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        init_database()
+
+    def tearDown(self):
+        close_connections()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _yields(self) -> dict[str, int]:
+        sql = "SELECT query, last_new_count FROM query_yield"
+        return dict(get_connection().execute(sql).fetchall())
+
+    def test_shared_and_stored_urls_are_not_new(self):
+        insert_rows("product", [{"url": STORED, "source": "news", "tag": "jade"}])
+        fetch_many = fake_fetch_many(
+            {
+                "a": FakeResponse([STORED, SHARED, "https://news.example.com/3"]),
+                # 같은 글의 다른 URL 표기
+                "b": FakeResponse([SHARED.replace("https://", "https://m.")]),
+                "c": FakeResponse([SHARED, "https://news.example.com/4"]),
+            }
+        )
+        scheduler = QueryScheduler()
+        with (
+            mock.patch.dict(load.FILE_TAG_QUERIES_MAP, {"jade": ["a", "b", "c"]}),
+            mock.patch.dict(load.FILE_TAG_SOURCES_MAP, {"jade": ["news"]}),
+            mock.patch.object(load, "fetch_many", fetch_many),
+        ):
+            load.collect_load_product_issues("jade", scheduler=scheduler)
+        scheduler.commit()
+
+        self.assertEqual(self._yields(), {"a": 2, "b": 0, "c": 1})
+        count = get_connection().execute("SELECT COUNT(*) FROM product").fetchone()
+        self.assertEqual(count[0], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
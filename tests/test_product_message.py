@@ -0,0 +1,33 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from batch.database import close_connections, init_database
+from batch.product import make_message
+
+
+class EmptyWindowTest(unittest.TestCase):
+    """최근 7일 글이 없는 tag는 오류 대신 빈 상태 메시지를 돌려줌"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        init_database()
+
+    def tearDown(self):
+        close_connections()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_no_rows_in_window(self):
+        with mock.patch.object(make_message, "async_openai_response") as llm:
+            result = asyncio.run(make_message.process_generate_message("JADE 고객반응"))
+        self.assertEqual(result, ["[JADE 고객반응]\n최근 7일 내 소식이 없어요 😊"])
+        llm.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
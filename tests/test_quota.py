@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from batch.database import close_connections, get_connection, init_database
+from batch.quota import QuotaLedger
+
+URL = "https://openapi.naver.com/v1/search/blog.json"
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class QuotaLedgerTest(unittest.TestCase):
+    """callback 서버처럼 오래 떠 있는 프로세스의 장부"""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        init_database()
+        self.clock = Clock(datetime(2026, 1, 1, 23, 50))
+
+    def tearDown(self):
+        close_connections()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _ledger(self) -> QuotaLedger:
+        # 우선순위가 높은 issue가 3회를 예약하므로 etc(기본 수집기)는 하루 2회
+        return QuotaLedger(
+            quotas={"search": 5},
+            budgets={"issue": 3},
+            priorities={"issue": 0},
+            clock=self.clock,
+        )
+
+    def _use(self, ledger: QuotaLedger, n: int) -> int:
+        allowed = 0
+        for _ in range(n):
+            if ledger.allow(URL):
+                ledger.charge(URL)
+                allowed += 1
+        return allowed
+
+    def _usage(self) -> dict[str, int]:
+        sql = "SELECT day, SUM(calls) FROM api_usage GROUP BY day"
+        return dict(get_connection().execute(sql).fetchall())
+
+    def test_crossing_midnight(self):
+        ledger = self._ledger()
+        self.assertEqual(self._use(ledger, 5), 2)
+
+        self.clock.now += timedelta(minutes=20)
+        self.assertEqual(self._use(ledger, 5), 2)
+        ledger.flush()
+        self.assertEqual(self._usage(), {"20260101": 2, "20260102": 2})
+
+    def test_long_running_sees_other_process(self):
+        bot = self._ledger()
+        self.assertEqual(self._use(bot, 1), 1)
+
+        batch = self._ledger()
+        with batch.track("issue"):
+            self.assertEqual(self._use(batch, 3), 3)
+        batch.flush()
+
+        # 다시 읽기 전에는 batch 호출이 보이지 않고, 읽은 뒤에는 남은 한도만 사용
+        self.assertEqual(bot.used(group="search"), 1)
+        self.clock.now += QuotaLedger.RELOAD_EVERY
+        self.assertEqual(self._use(bot, 5), 1)
+        self.assertEqual(bot.used(group="search"), 5)
+        self.assertEqual(self._usage(), {"20260101": 4})
+
+
+if __name__ == "__main__":
+    unittest.main()